@@ -5,23 +5,79 @@ API Driver
 This module defines :class:`APIDriver`, a helper for executing API
 tests described in plain English.  Each test step is translated into a
 structured request using the LLM agent or a deterministic parser and
-then executed with the ``requests`` library.  Results are recorded in
-the database at both the run and step level.
+then executed with a pooled ``requests`` session.  Results are recorded in
+the database at both the run and step level.  When ``aiohttp`` is
+installed :meth:`APIDriver.arun_test_case` offers an ``asyncio`` path
+so many cases can share one event loop and connection pool.
 """
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
+import hmac
 import json
 import logging
+import queue
+import re
+import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp  # type: ignore
+    _aiohttp_available = True
+except ImportError:
+    _aiohttp_available = False
+
+try:
+    import uvloop  # type: ignore
+    _uvloop_available = True
+except ImportError:
+    _uvloop_available = False
+
+try:
+    from blake3 import blake3  # type: ignore
+    _blake3_available = True
+except ImportError:
+    _blake3_available = False
+
+try:
+    import orjson  # type: ignore
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
 
 from ..utils.db_utils import Database
+from ..utils.time_utils import iso_timestamp as _iso
 from ..llm_integration.llm_agent import LLMAgent, APIRequest
 
 
+@dataclass
+class _StepPlan:
+    """Values derived from a step once per case rather than per access."""
+    step: Dict[str, Any]
+    command: Optional[str]
+    base_url: str
+    # Compiled matcher for dict ``expected_body`` values
+    subset_check: Optional[Callable[[Any], Optional[Tuple[Any, Any]]]] = None
+    # Raw bytes of ``snapshot_hash``; ``None`` if it is not valid hex
+    snapshot_digest: Optional[bytes] = None
+    # Upper-cased ``method`` override, validated when the case is planned
+    method: Optional[str] = None
+    # UTF-8 form of a non-dict ``expected_body`` for raw byte searches
+    expected_bytes: Optional[bytes] = None
+
+
 class APIDriver:
     """Execute API test cases described in natural language."""
 
@@ -29,61 +85,189 @@ class APIDriver:
         self.config = config
         self.db = db
         self.llm = LLMAgent(config)
-        # Precompute base URLs from config
+        # Precompute base URLs from config; frozen so resolved plans stay valid
         try:
-            self.base_urls = config.get("api", {}).get("base_urls", {})  # type: ignore
+            base_urls = dict(config.get("api", {}).get("base_urls", {}) or {})  # type: ignore
         except Exception:
-            self.base_urls = {}
+            base_urls = {}
+        self.base_urls: Mapping[str, str] = MappingProxyType(base_urls)
+        try:
+            api_cfg = config.get("api", {}) or {}  # type: ignore
+            self.timeout = float(api_cfg.get("timeout", 30))
+            self.max_workers = max(1, int(api_cfg.get("max_workers", 1)))
+            self.translation_ttl = float(api_cfg.get("translation_cache_ttl", 86400))
+            retry_failed = bool(api_cfg.get("retry_failed_requests", True))
+            snapshot_algorithm = str(api_cfg.get("snapshot_algorithm", "sha256")).lower()
+            self.background_writes = bool(api_cfg.get("background_writes", False))
+        except Exception:
+            self.timeout = 30.0
+            self.max_workers = 1
+            self.translation_ttl = 86400.0
+            retry_failed = True
+            snapshot_algorithm = "sha256"
+            self.background_writes = False
+        if snapshot_algorithm == "blake3" and not _blake3_available:
+            logging.getLogger(__name__).warning("blake3 is not installed; snapshot hashes fall back to sha256")
+            snapshot_algorithm = "sha256"
+        self._snapshot_hasher: Callable[[], Any] = blake3 if snapshot_algorithm == "blake3" else hashlib.sha256
+        # A single pooled session keeps connections alive between steps so
+        # TCP/TLS setup is paid once per host instead of once per request.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1) if retry_failed else 0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # LLM translations keyed by a hash of (command, base_url).  Entries
+        # are loaded from and persisted to the database on the calling
+        # thread; worker threads only touch the in-memory dict.
+        self._translations: Dict[str, APIRequest] = {}
+        self._unsaved_translations: Set[str] = set()
+        # Created lazily by astart() for the asynchronous execution path
+        self._aiohttp_session: Optional[Any] = None
+        # Finished runs handed to the background writer; ``None`` stops it
+        self._write_queue: "queue.Queue[Optional[Tuple[Any, ...]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def close(self) -> None:
+        """Persist queued results and release pooled HTTP connections."""
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self.session.close()
+
+    def flush(self) -> None:
+        """Block until every queued run has been written to the database."""
+        self._write_queue.join()
 
     def run_test_case(self, case: Dict[str, Any]) -> int:
         """Execute an API test case and record results.
 
-        The API driver executes each step sequentially and records
-        individual outcomes.  Missing commands are reported as skipped.
-        A run is considered ``passed`` only if all steps pass.  If some
-        steps fail while others pass the run status becomes ``partial``.
+        Steps are executed on a thread pool sized by ``api.max_workers``
+        (sequentially by default); a step that ``depends_on`` an earlier
+        one waits for it and is skipped unless it passed.  Individual
+        outcomes are recorded in step order.  Missing commands are
+        reported as skipped.  A run is considered ``passed`` only if all
+        steps pass.  If some steps fail while others pass the run status
+        becomes ``partial``.  A ``KeyError`` or ``ValueError`` is raised
+        before the run is recorded if a step names an unknown ``base`` or
+        ``method``.  With ``api.background_writes`` enabled the results are
+        committed by a writer thread; call :meth:`flush` before reading them.
+        """
+        steps = self._plan_steps(case.get("steps", []) or [])
+        run_id = self._start_run(case)
+        self._load_translations(steps)
+        self._prefetch_translations(steps)
+        # Steps are submitted in order; a step only waits on the future of
+        # the step it ``depends_on`` so independent requests overlap.
+        futures: List[Future] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for idx, plan in enumerate(steps):
+                dep = plan.step.get("depends_on")
+                dep_future = futures[dep] if isinstance(dep, int) and 0 <= dep < idx else None
+                futures.append(executor.submit(self._run_step, plan, dep, dep_future))
+        self._save_translations()
+        self._finish_run(run_id, [future.result() for future in futures])
+        return run_id
+
+    def run_test_cases(self, cases: List[Dict[str, Any]]) -> List[int]:
+        """Execute many cases concurrently and return their run IDs in order.
+
+        When ``aiohttp`` is installed the cases are gathered on a private
+        event loop, using ``uvloop`` if it is available for lower
+        per-socket overhead.  Otherwise each case is run in turn with
+        :meth:`run_test_case`.
+        """
+        if not _aiohttp_available:
+            return [self.run_test_case(case) for case in cases]
+
+        async def _gather() -> List[int]:
+            try:
+                return list(await asyncio.gather(*(self.arun_test_case(case) for case in cases)))
+            finally:
+                await self.aclose()
+
+        loop = uvloop.new_event_loop() if _uvloop_available else asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(_gather())
+        finally:
+            loop.close()
+
+    async def arun_test_case(self, case: Dict[str, Any]) -> int:
+        """Coroutine counterpart of :meth:`run_test_case` built on ``aiohttp``.
+
+        All steps of the case are scheduled as tasks on the running event
+        loop, with dependent steps awaiting their prerequisite, so callers
+        can ``asyncio.gather`` many cases over one connection pool.
+        Database access stays on the event loop thread.
         """
-        # Insert case if necessary
+        steps = self._plan_steps(case.get("steps", []) or [])
+        if self._aiohttp_session is None:
+            await self.astart()
+        run_id = self._start_run(case)
+        self._load_translations(steps)
+        await asyncio.to_thread(self._prefetch_translations, steps)
+        tasks: List[asyncio.Task] = []
+        for idx, plan in enumerate(steps):
+            dep = plan.step.get("depends_on")
+            dep_task = tasks[dep] if isinstance(dep, int) and 0 <= dep < idx else None
+            tasks.append(asyncio.ensure_future(self._arun_step(plan, dep, dep_task)))
+        results = await asyncio.gather(*tasks)
+        self._save_translations()
+        self._finish_run(run_id, results)
+        return run_id
+
+    async def astart(self) -> None:
+        """Open the ``aiohttp`` session used by :meth:`arun_test_case`."""
+        if not _aiohttp_available:
+            raise RuntimeError("aiohttp is required for asynchronous API execution")
+        if self._aiohttp_session is None:
+            connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout, sock_connect=3.05),
+            )
+
+    async def aclose(self) -> None:
+        """Close the ``aiohttp`` session if one was opened."""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    def _start_run(self, case: Dict[str, Any]) -> int:
+        """Insert the case if necessary and record a ``running`` run."""
         test_case_id = case.get("id")
         if not test_case_id:
             test_case_id = self.db.add_test_case(case)
         start_time = time.time()
-        run_id = self.db.add_test_run(
+        return self.db.add_test_run(
             test_case_id,
             status="running",
             started_at=_iso(start_time),
             ended_at=_iso(start_time),
         )
+
+    def _finish_run(self, run_id: int, results: List[Tuple[str, Optional[str], float, float]]) -> None:
+        """Derive the overall status from step ``results`` and persist the run."""
         passed_steps = 0
         failed_steps = 0
         skipped_steps = 0
         error_message: Optional[str] = None
-        steps = case.get("steps", []) or []
-        for idx, step in enumerate(steps):
-            step_start = time.time()
-            status = "passed"
-            message: Optional[str] = None
-            try:
-                dep = step.get("depends_on")
-                if dep is not None and isinstance(dep, int):
-                    prev_results = self.db.get_run_steps(run_id) if run_id else []
-                    for r in prev_results:
-                        if r.get("step_index") == dep and r.get("status") in {"failed", "skipped"}:
-                            raise ValueError(f"Step depends_on {dep} which did not pass")
-                self._execute_step(step)
-            except ValueError as ve:
-                status = "skipped"
-                message = str(ve)
+        # Step results are buffered and written together with the final
+        # run update so the whole run costs a single commit.
+        pending_steps: List[Tuple[int, str, Optional[str], str, str]] = []
+        for idx, (status, message, step_start, step_end) in enumerate(results):
+            if status == "skipped":
                 skipped_steps += 1
-            except Exception as exc:
-                status = "failed"
-                message = str(exc)
+            elif status == "failed":
                 failed_steps += 1
                 error_message = message
             else:
                 passed_steps += 1
-            step_end = time.time()
-            self.db.add_run_step(run_id, idx, status, message, _iso(step_start), _iso(step_end))
+            pending_steps.append((idx, status, message, _iso(step_start), _iso(step_end)))
         end_time = time.time()
         executed = passed_steps + failed_steps
         if executed == 0 and skipped_steps > 0:
@@ -94,69 +278,385 @@ class APIDriver:
             overall_status = "failed"
         else:
             overall_status = "partial"
-        # Update run record
-        self.db.conn.cursor().execute(
-            """
-            UPDATE test_runs
-            SET status = ?, ended_at = ?, error_message = ?
-            WHERE id = ?
-            """,
-            (overall_status, _iso(end_time), error_message, run_id),
-        )
-        self.db.conn.commit()
-        return run_id
+        record = (run_id, overall_status, _iso(end_time), error_message, pending_steps)
+        if self.background_writes:
+            # Let the writer thread commit while the next case does HTTP
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._db_writer, name="api-db-writer", daemon=True)
+                self._writer.start()
+            self._write_queue.put(record)
+        else:
+            # Flush step results and update the run record in one transaction
+            self.db.finish_test_run(*record)
 
-    def _execute_step(self, step: Dict[str, Any]) -> None:
-        """Execute an individual API step."""
-        # Steps may specify a natural language command in 'command' or 'text'
-        command = step.get("command") or step.get("text") or step.get("description")
-        if not command:
-            raise ValueError("API step requires a 'command' or 'text' field")
-        # Determine base URL.  If the step specifies a base key use it; otherwise default
-        base_key = step.get("base") or "default"
-        base_url = self.base_urls.get(base_key, "")
-        req: APIRequest = self.llm.translate_api(command, base_url)
-        method = req.method or "GET"
-        url = req.url
-        headers = req.headers or {}
-        body = req.body
-        # Allow the test case to override expected status per step
-        expected_status = step.get("expected_status", req.expected_status or 200)
-        # Execute using requests
-        response = requests.request(method=method, url=url, headers=headers, json=body)
-        if response.status_code != expected_status:
-            raise AssertionError(
-                f"Expected status {expected_status} but got {response.status_code} for {method} {url}"
-            )
-        # Optionally validate response body
-        if "expected_body" in step:
-            expected_body = step["expected_body"]
-            actual_json: Any = None
+    def _db_writer(self) -> None:
+        """Write queued runs, grouping whatever is pending into one transaction."""
+        while True:
+            batch = [self._write_queue.get()]
+            while batch[-1] is not None and len(batch) < 256:
+                try:
+                    batch.append(self._write_queue.get(timeout=0.05))
+                except queue.Empty:
+                    break
             try:
-                actual_json = response.json()
+                runs = [record for record in batch if record is not None]
+                if runs:
+                    self.db.finish_test_runs(runs)
             except Exception:
-                actual_json = response.text
-            if isinstance(expected_body, dict):
-                # Check that all key/value pairs exist in the actual response
-                for k, v in expected_body.items():
-                    if not isinstance(actual_json, dict) or actual_json.get(k) != v:  # type: ignore[union-attr]
-                        raise AssertionError(f"Expected response field {k}={v} but got {actual_json.get(k) if isinstance(actual_json, dict) else 'N/A'}")
-            else:
-                if str(expected_body) not in response.text:
-                    raise AssertionError(f"Expected body to contain {expected_body} but got {response.text}")
+                logging.getLogger(__name__).exception("Failed to persist %d API run(s)", len(batch))
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def _plan_steps(self, steps: List[Dict[str, Any]]) -> List[_StepPlan]:
+        """Resolve per-step values once before any step is executed.
+
+        Each distinct ``base`` key is looked up a single time.  A missing
+        ``default`` entry resolves to an empty base URL, but any other
+        unknown key is rejected up front instead of surfacing later as
+        a malformed request URL.  An explicit step ``method`` overrides
+        the translated one and must be a known HTTP method.
+        """
+        keys = {step.get("base") or "default" for step in steps}
+        unknown = sorted(key for key in keys if key != "default" and key not in self.base_urls)
+        if unknown:
+            raise KeyError(f"Unknown API base key(s): {', '.join(unknown)}")
+        methods = [str(step["method"]).upper() if step.get("method") else None for step in steps]
+        invalid = sorted({m for m in methods if m is not None and m not in _HTTP_METHODS})
+        if invalid:
+            raise ValueError(f"Unsupported HTTP method(s): {', '.join(invalid)}")
+        resolved = {key: self.base_urls.get(key, "") for key in keys}
+        return [
+            _StepPlan(
+                step=step,
+                # Steps may specify a natural language command in 'command' or 'text'
+                command=step.get("command") or step.get("text") or step.get("description"),
+                base_url=resolved[step.get("base") or "default"],
+                subset_check=_compile_subset(step["expected_body"])
+                if isinstance(step.get("expected_body"), dict)
+                else None,
+                snapshot_digest=_decode_digest(step.get("snapshot_hash")),
+                method=method,
+                expected_bytes=str(step["expected_body"]).encode("utf-8")
+                if "expected_body" in step and not isinstance(step["expected_body"], dict)
+                else None,
+            )
+            for step, method in zip(steps, methods)
+        ]
+
+    def _translate(self, command: str, base_url: str) -> APIRequest:
+        """Translate ``command`` into a request, reusing cached LLM output."""
+        # Simple "<METHOD> <path>" commands never need the LLM
+        fast = _fast_translate(command, base_url)
+        if fast is not None:
+            return fast
+        # Heuristic translations are cheap and must not outlive a provider
+        # becoming available (or recovering), so only LLM answers are cached.
+        if self.llm.active_provider is None:
+            return self.llm.translate_api(command, base_url)
+        key = _translation_key(command, base_url)
+        req = self._translations.get(key)
+        if req is None:
+            req, from_llm = self.llm.translate_api_with_source(command, base_url)
+            if from_llm:
+                self._translations[key] = req
+                self._unsaved_translations.add(key)
+        return req
+
+    def _load_translations(self, steps: List[_StepPlan]) -> None:
+        """Populate the in-memory cache with persisted translations for ``steps``."""
+        if self.llm.active_provider is None or self.translation_ttl <= 0:
+            return
+        keys = set()
+        for plan in steps:
+            if plan.command:
+                key = _translation_key(plan.command, plan.base_url)
+                if key not in self._translations:
+                    keys.add(key)
+        if not keys:
+            return
+        for key, payload in self.db.get_cached_translations(keys, self.translation_ttl).items():
+            try:
+                self._translations[key] = APIRequest(**json.loads(payload))
+            except (TypeError, ValueError):
+                logging.getLogger(__name__).warning("Ignoring malformed cached translation %s", key)
+
+    def _prefetch_translations(self, steps: List[_StepPlan]) -> None:
+        """Translate every uncached LLM-bound command of ``steps`` in one batch."""
+        if self.llm.active_provider is None:
+            return
+        misses: Dict[str, Tuple[str, str]] = {}
+        for plan in steps:
+            if not plan.command or _fast_translate(plan.command, plan.base_url) is not None:
+                continue
+            key = _translation_key(plan.command, plan.base_url)
+            if key not in self._translations:
+                misses[key] = (plan.command, plan.base_url)
+        if not misses:
+            return
+        for key, (req, from_llm) in zip(misses, self.llm.translate_api_batch(list(misses.values()))):
+            # Heuristic fallbacks are left uncached; _translate retries them
+            if from_llm:
+                self._translations[key] = req
+                self._unsaved_translations.add(key)
+
+    def _save_translations(self) -> None:
+        """Persist translations produced since the last save."""
+        if not self._unsaved_translations:
+            return
+        if self.translation_ttl > 0:
+            self.db.cache_translations(
+                {key: json.dumps(asdict(self._translations[key])) for key in self._unsaved_translations}
+            )
+        self._unsaved_translations.clear()
+
+    def _run_step(
+        self, plan: _StepPlan, dep: Optional[int], dep_future: Optional[Future]
+    ) -> Tuple[str, Optional[str], float, float]:
+        """Run a single step and return ``(status, message, started, ended)``.
+
+        When ``dep_future`` is given the step blocks until its prerequisite
+        has finished and is skipped if that step did not pass.
+        """
+        if dep_future is not None and dep_future.result()[0] in {"failed", "skipped"}:
+            now = time.time()
+            return "skipped", f"Step depends_on {dep} which did not pass", now, now
+        step_start = time.time()
+        try:
+            self._execute_step(plan)
+        except ValueError as ve:
+            return "skipped", str(ve), step_start, time.time()
+        except Exception as exc:
+            return "failed", str(exc), step_start, time.time()
+        return "passed", None, step_start, time.time()
+
+    async def _arun_step(
+        self, plan: _StepPlan, dep: Optional[int], dep_task: Optional[asyncio.Task]
+    ) -> Tuple[str, Optional[str], float, float]:
+        """Asynchronous variant of :meth:`_run_step`."""
+        if dep_task is not None and (await dep_task)[0] in {"failed", "skipped"}:
+            now = time.time()
+            return "skipped", f"Step depends_on {dep} which did not pass", now, now
+        step_start = time.time()
+        try:
+            await self._aexecute_step(plan)
+        except ValueError as ve:
+            return "skipped", str(ve), step_start, time.time()
+        except Exception as exc:
+            return "failed", str(exc), step_start, time.time()
+        return "passed", None, step_start, time.time()
+
+    def _prepare_request(self, plan: _StepPlan) -> Tuple[str, str, Dict[str, str], Optional[bytes], int]:
+        """Translate ``step`` into ``(method, url, headers, data, expected_status)``.
+
+        JSON bodies are serialised here so both execution paths send the
+        same pre-encoded payload.
+        """
+        if not plan.command:
+            raise ValueError("API step requires a 'command' or 'text' field")
+        req = self._translate(plan.command, plan.base_url)
+        # Allow the test case to override expected status per step
+        expected_status = plan.step.get("expected_status", req.expected_status or 200)
+        headers = req.headers or {}
+        data: Optional[bytes] = None
+        if req.body is not None:
+            data = _json_dumps(req.body)
+            headers = {"Content-Type": "application/json", **headers}
+        method = plan.method or (req.method or "GET").upper()
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        return method, req.url, headers, data, expected_status
+
+    async def _aexecute_step(self, plan: _StepPlan) -> None:
+        """Execute an individual API step over the ``aiohttp`` session."""
+        step = plan.step
+        # Translation may block on the LLM, so keep it off the event loop
+        method, url, headers, data, expected_status = await asyncio.to_thread(self._prepare_request, plan)
+        async with self._aiohttp_session.request(method, url, headers=headers, data=data) as resp:
+            _check_status(resp.status, expected_status, method, url)
+            expect_body = "expected_body" in step
+            hasher = self._snapshot_hasher() if step.get("snapshot_hash") else None
+            if not expect_body and hasher is None:
+                return
+            buf = bytearray()
+            async for chunk in resp.content.iter_chunked(65536):
+                if hasher is not None:
+                    hasher.update(chunk)
+                if expect_body:
+                    buf += chunk
+            # get_encoding() raises for non-JSON bodies without a charset
+            # once the stream is consumed, so read the header value instead
+            encoding = (resp.charset or "utf-8") if expect_body else "utf-8"
+            _check_payload(plan, buf, hasher, encoding)
+
+    def _execute_step(self, plan: _StepPlan) -> None:
+        """Execute an individual API step."""
+        step = plan.step
+        method, url, headers, data, expected_status = self._prepare_request(plan)
+        # Bodies that are validated or hashed are streamed and scanned
+        # once; unread bodies are left to the session so keep-alive works.
+        stream = "expected_body" in step or bool(step.get("snapshot_hash"))
+        # Execute using the pooled session
+        with self.session.request(
+            method=method, url=url, headers=headers, data=data, timeout=(3.05, self.timeout), stream=stream
+        ) as response:
+            self._check_response(plan, response, expected_status, method, url)
+
+    def _check_response(
+        self, plan: _StepPlan, response: requests.Response, expected_status: int, method: str, url: str
+    ) -> None:
+        """Validate status, body and snapshot hash of ``response`` for a step."""
+        step = plan.step
+        _check_status(response.status_code, expected_status, method, url)
+        expect_body = "expected_body" in step
         # Swagger mismatch handling via snapshot hash
-        if step.get("snapshot_hash"):
-            import hashlib
-            body_bytes = response.content or b""
-            digest = hashlib.sha256(body_bytes).hexdigest()
-            if digest != step["snapshot_hash"]:
-                raise AssertionError(
-                    f"Swagger snapshot hash mismatch: expected {step['snapshot_hash']} but got {digest}"
-                )
-
-
-def _iso(ts: float) -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts))
+        hasher = self._snapshot_hasher() if step.get("snapshot_hash") else None
+        if not expect_body and hasher is None:
+            return
+        # Hash every chunk as it arrives and keep it only if the body is
+        # validated as well, so the payload is traversed a single time.
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            if hasher is not None:
+                hasher.update(chunk)
+            if expect_body:
+                buf += chunk
+        _check_payload(plan, buf, hasher, response.encoding or "utf-8")
+
+
+def _check_status(status_code: int, expected_status: int, method: str, url: str) -> None:
+    if status_code != expected_status:
+        raise AssertionError(f"Expected status {expected_status} but got {status_code} for {method} {url}")
+
+
+def _check_payload(plan: _StepPlan, content: bytearray, hasher: Optional[Any], encoding: str) -> None:
+    if "expected_body" in plan.step:
+        _check_body(plan, content, encoding)
+    if hasher is not None:
+        _check_snapshot(plan, hasher.digest())
+
+
+def _check_body(plan: _StepPlan, content: bytearray, encoding: str) -> None:
+    if plan.subset_check is not None:
+        # Only dict expectations need the decoded JSON document
+        actual_json: Any = None
+        try:
+            actual_json = _json_loads(content)
+        except ValueError:
+            actual_json = None
+        # Check that all key/value pairs exist in the actual response
+        miss = plan.subset_check(actual_json)
+        if miss is not None:
+            k, v = miss
+            raise AssertionError(f"Expected response field {k}={v} but got {actual_json.get(k) if isinstance(actual_json, dict) else 'N/A'}")
+    else:
+        expected_body = plan.step["expected_body"]
+        # Search the raw bytes when the body's encoding allows it; the body
+        # is then only decoded to build a failure message.
+        if plan.expected_bytes is not None and _byte_searchable(encoding):
+            if plan.expected_bytes in content:
+                return
+        elif str(expected_body) in content.decode(encoding, errors="replace"):
+            return
+        text = content.decode(encoding, errors="replace")
+        raise AssertionError(f"Expected body to contain {expected_body} but got {text}")
+
+
+@lru_cache(maxsize=32)
+def _byte_searchable(encoding: str) -> bool:
+    """Whether a UTF-8 needle can be matched against raw bytes in ``encoding``."""
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+    return name in ("utf-8", "ascii")
+
+
+def _decode_digest(value: Any) -> Optional[bytes]:
+    if not value:
+        return None
+    try:
+        return bytes.fromhex(str(value))
+    except ValueError:
+        return None
+
+
+def _compile_subset(expected: Dict[str, Any]) -> Callable[[Any], Optional[Tuple[Any, Any]]]:
+    """Return a checker yielding the first ``(key, value)`` missing from a response."""
+    items = tuple(expected.items())
+
+    def check(actual: Any) -> Optional[Tuple[Any, Any]]:
+        if not items:
+            return None
+        if not isinstance(actual, dict):
+            return items[0]
+        get = actual.get
+        for k, v in items:
+            if get(k) != v:
+                return k, v
+        return None
+
+    return check
+
+
+def _check_snapshot(plan: _StepPlan, digest: bytes) -> None:
+    if plan.snapshot_digest is None or not hmac.compare_digest(digest, plan.snapshot_digest):
+        raise AssertionError(
+            f"Swagger snapshot hash mismatch: expected {plan.step['snapshot_hash']} but got {digest.hex()}"
+        )
+
+
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+
+# "<METHOD> </path or http(s)://url> [with body <json>]" commands are parsed
+# directly.  The method must be upper case and the target an explicit path
+# or URL, so prose such as "get the user list" still goes to the LLM.
+_FAST_COMMAND = re.compile(
+    r"^\s*(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+((?:/|(?i:https?)://)\S*)"
+    r"(?:\s+(?i:with\s+body)\s+(.+?))?\s*$",
+    re.DOTALL,
+)
+
+
+def _fast_translate(command: str, base_url: str) -> Optional[APIRequest]:
+    """Translate well-formed commands without the LLM, or return ``None``."""
+    match = _FAST_COMMAND.match(command)
+    if not match:
+        return None
+    method, target, raw_body = match.groups()
+    body: Any = None
+    if raw_body:
+        try:
+            body = _json_loads(raw_body)
+        except ValueError:
+            return None
+    if target.lower().startswith(("http://", "https://")):
+        url = target
+    else:
+        url = f"{base_url.rstrip('/')}/{target.lstrip('/')}"
+    return APIRequest(method=method, url=url, headers={}, body=body, expected_status=200)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if _orjson_available:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. non-string dict keys, which the stdlib coerces
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    if _orjson_available:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _translation_key(command: str, base_url: str) -> str:
+    return hashlib.blake2b(f"{command}\x00{base_url}".encode("utf-8"), digest_size=16).hexdigest()
 
 
 __all__ = ["APIDriver"]
\ No newline at end of file
@@ -22,24 +22,38 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import io
 import json
 import logging
 import os
 import shutil
 import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import yaml
-from fastapi import FastAPI, HTTPException, Depends, File, UploadFile, Form, Request, BackgroundTasks
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, StreamingResponse
+from openpyxl import Workbook
+from fastapi import FastAPI, HTTPException, Depends, File, UploadFile, Form, Request, Response, BackgroundTasks
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 from pydantic import BaseModel
 import uvicorn
 
+try:
+    import orjson  # type: ignore
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
 from ..utils.db_utils import Database
 from ..utils.ragas_utils import generate_test_cases_from_excel, generate_test_cases_from_brd, generate_test_cases_from_swagger, generate_test_cases_with_ragas
 from ..llm_integration.llm_agent import LLMAgent
@@ -48,13 +62,23 @@ from ..llm_integration.llm_agent import LLMAgent
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader; it is not available in every PyYAML build
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Load configuration
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load configuration from settings.yaml."""
+    """Load configuration from settings.yaml.
+
+    The parsed file is cached; treat the returned mapping as read-only.
+    """
     config_path = Path("settings.yaml")
     if config_path.exists():
         with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_YamlLoader) or {}
     return {}
 
 config = load_config()
@@ -66,18 +90,103 @@ db = Database(db_path)
 # Initialize LLM agent
 llm_agent = LLMAgent(config)
 
+# Cache-aside copy of db.get_test_cases(); writers call
+# _invalidate_test_cases() so the next read reloads from SQLite.
+_CASES_CACHE_TTL = float(config.get("dashboard", {}).get("cache_ttl", 60))
+_cases_cache_lock = threading.Lock()
+_cases_cache: Dict[str, Any] = {"version": 0, "loaded_version": -1, "expires": 0.0, "value": [], "generation": 0}
+
+def _get_test_cases() -> List[Dict[str, Any]]:
+    """Return all test cases, served from the TTL cache when it is fresh.
+
+    The returned list is shared between requests and must not be mutated.
+    """
+    return _get_test_cases_tagged()[0]
+
+def _get_test_cases_tagged() -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return the cached test cases together with an ETag for that snapshot.
+
+    The ETag changes whenever the cache is reloaded; it is ``None`` when a
+    concurrent write prevented the loaded rows from being cached.
+    """
+    with _cases_cache_lock:
+        version = _cases_cache["version"]
+        if _cases_cache["loaded_version"] == version and time.monotonic() < _cases_cache["expires"]:
+            logger.debug("get_test_cases cache_hit")
+            return _cases_cache["value"], _cases_etag(_cases_cache["generation"])
+    logger.debug("get_test_cases cache_miss")
+    test_cases = db.get_test_cases()
+    with _cases_cache_lock:
+        # Only publish if no write happened while the rows were loading
+        if _cases_cache["version"] == version:
+            _cases_cache.update(
+                loaded_version=version,
+                expires=time.monotonic() + _CASES_CACHE_TTL,
+                value=test_cases,
+                generation=_cases_cache["generation"] + 1,
+            )
+            return test_cases, _cases_etag(_cases_cache["generation"])
+    return test_cases, None
+
+# Distinguishes cache generations of this process from those of earlier runs
+_ETAG_EPOCH = f"{os.getpid():x}{time.time_ns():x}"
+
+def _cases_etag(generation: int) -> str:
+    """Build the ETag for one loaded generation of the test case cache."""
+    return f'W/"cases-{_ETAG_EPOCH}-{generation}"'
+
+def _invalidate_test_cases() -> None:
+    """Drop the cached test case list after a write."""
+    with _cases_cache_lock:
+        _cases_cache["version"] += 1
+
+def _not_modified(request: Request, etag: Optional[str]) -> bool:
+    """Whether the client's ``If-None-Match`` already names ``etag``."""
+    if etag is None:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+# Run counts per status; runs are written by the drivers, possibly in other
+# processes, so this is only refreshed on expiry.
+_RUN_STATS_TTL = float(config.get("dashboard", {}).get("stats_ttl", 30))
+_run_stats_lock = threading.Lock()
+_run_stats_cache: Dict[str, Any] = {"expires": 0.0, "value": {}}
+
+def _get_run_stats() -> Dict[str, int]:
+    """Return the number of test runs per status, cached for a short TTL."""
+    with _run_stats_lock:
+        if time.monotonic() < _run_stats_cache["expires"]:
+            return _run_stats_cache["value"]
+    run_stats = db.get_run_stats()
+    with _run_stats_lock:
+        _run_stats_cache.update(expires=time.monotonic() + _RUN_STATS_TTL, value=run_stats)
+    return run_stats
+
 # Create FastAPI app
 app = FastAPI(
     title="Automation Framework Dashboard",
     description="Comprehensive dashboard for AI-powered automation framework",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson serialises the large case/run lists several times faster
+    default_response_class=ORJSONResponse if _orjson_available else JSONResponse
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="dashboard/static"), name="static")
+# Assets live next to this module, whatever the working directory is
+_DASHBOARD_DIR = Path(__file__).parent
+
+# Mount static files; the directory is optional, so only requests fail
+# when it is missing rather than the import
+app.mount("/static", StaticFiles(directory=_DASHBOARD_DIR / "static", check_dir=False), name="static")
 
 # Templates
-templates = Jinja2Templates(directory="dashboard/templates")
+templates = Jinja2Templates(directory=str(_DASHBOARD_DIR / "templates"))
+# Keep compiled templates across restarts, and skip the per-render mtime
+# check unless auto-reload is enabled for development.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = config.get("dashboard", {}).get("auto_reload", True)
 
 # Pydantic models
 class TestCaseCreate(BaseModel):
@@ -116,17 +225,17 @@ async def index(request: Request, user: dict = Depends(get_current_user)):
     """Main dashboard page."""
     try:
         # Get statistics
-        test_cases = db.get_test_cases()
-        test_runs = db.get_test_runs()
+        test_cases = _get_test_cases()
+        run_stats = _get_run_stats()
         
         # Calculate statistics
         total_cases = len(test_cases)
-        total_runs = len(test_runs)
-        passed_runs = len([r for r in test_runs if r.get("status") == "passed"])
-        failed_runs = len([r for r in test_runs if r.get("status") == "failed"])
+        total_runs = sum(run_stats.values())
+        passed_runs = run_stats.get("passed", 0)
+        failed_runs = run_stats.get("failed", 0)
         
         # Get recent activity
-        recent_runs = sorted(test_runs, key=lambda x: x.get("started_at", ""), reverse=True)[:5]
+        recent_runs = db.get_recent_runs(5)
         
         return templates.TemplateResponse("index.html", {
             "request": request,
@@ -145,7 +254,7 @@ async def index(request: Request, user: dict = Depends(get_current_user)):
 async def test_cases_page(request: Request, user: dict = Depends(get_current_user)):
     """Test cases management page."""
     try:
-        test_cases = db.get_test_cases()
+        test_cases = _get_test_cases()
         return templates.TemplateResponse("test_cases.html", {
             "request": request,
             "user": user,
@@ -188,10 +297,14 @@ async def reports_page(request: Request, user: dict = Depends(get_current_user))
 
 # API Routes
 @app.get("/api/test-cases")
-async def get_test_cases_api(user: dict = Depends(get_current_user)):
+async def get_test_cases_api(request: Request, response: Response, user: dict = Depends(get_current_user)):
     """Get all test cases."""
     try:
-        test_cases = db.get_test_cases()
+        test_cases, etag = _get_test_cases_tagged()
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        if etag:
+            response.headers["ETag"] = etag
         return {"test_cases": test_cases}
     except Exception as exc:
         logger.error(f"Error getting test cases: {exc}")
@@ -201,8 +314,7 @@ async def get_test_cases_api(user: dict = Depends(get_current_user)):
 async def get_test_case_api(case_id: int, user: dict = Depends(get_current_user)):
     """Get specific test case."""
     try:
-        test_cases = db.get_test_cases()
-        test_case = next((tc for tc in test_cases if tc.get("id") == case_id), None)
+        test_case = db.get_test_case(case_id)
         
         if not test_case:
             raise HTTPException(status_code=404, detail="Test case not found")
@@ -218,6 +330,9 @@ async def get_test_case_api(case_id: int, user: dict = Depends(get_current_user)
 async def create_test_case_api(test_case: TestCaseCreate, user: dict = Depends(get_current_user)):
     """Create a new test case."""
     try:
+        # One timestamp for the case and all of its steps
+        created_at = datetime.utcnow().isoformat()
+        
         # Add test case to database
         case_data = {
             "user_story": test_case.user_story,
@@ -225,11 +340,12 @@ async def create_test_case_api(test_case: TestCaseCreate, user: dict = Depends(g
             "description": f"Test case for {test_case.user_story}",
             "created_by": user.get("username", "admin"),
             "source": "manual",
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": created_at,
             "version": 1
         }
         
         case_id = db.add_test_case(case_data)
+        _invalidate_test_cases()
         
         # Add steps
         for i, step in enumerate(test_case.steps):
@@ -238,9 +354,9 @@ async def create_test_case_api(test_case: TestCaseCreate, user: dict = Depends(g
                 "step_index": i,
                 "action": step.get("action", ""),
                 "target": step.get("target", ""),
-                "input_data": json.dumps(step.get("data", {})),
+                "input_data": orjson.dumps(step.get("data", {})).decode() if _orjson_available else json.dumps(step.get("data", {})),
                 "expected": step.get("expected", ""),
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": created_at
             }
             # Note: This would require adding a method to add steps to the database
         
@@ -254,8 +370,7 @@ async def update_test_case_api(case_id: int, test_case: TestCaseUpdate, user: di
     """Update an existing test case."""
     try:
         # Get existing test case
-        test_cases = db.get_test_cases()
-        existing_case = next((tc for tc in test_cases if tc.get("id") == case_id), None)
+        existing_case = db.get_test_case(case_id)
         
         if not existing_case:
             raise HTTPException(status_code=404, detail="Test case not found")
@@ -287,8 +402,7 @@ async def delete_test_case_api(case_id: int, user: dict = Depends(get_current_us
     """Delete a test case."""
     try:
         # Get existing test case
-        test_cases = db.get_test_cases()
-        existing_case = next((tc for tc in test_cases if tc.get("id") == case_id), None)
+        existing_case = db.get_test_case(case_id)
         
         if not existing_case:
             raise HTTPException(status_code=404, detail="Test case not found")
@@ -303,6 +417,33 @@ async def delete_test_case_api(case_id: int, user: dict = Depends(get_current_us
         raise HTTPException(status_code=500, detail=str(exc))
 
 # File Upload Routes
+# Test case generation is CPU-bound, so uploads parse in worker processes
+# rather than holding the GIL for every request.
+_PARSE_WORKERS = config.get("dashboard", {}).get("parse_workers") or os.cpu_count() or 1
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+async def _run_in_parse_pool(func: Any, *args: Any) -> Any:
+    """Run ``func(*args)`` in the shared process pool, creating it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=_PARSE_WORKERS)
+    return await asyncio.get_running_loop().run_in_executor(_parse_pool, func, *args)
+
+@app.on_event("shutdown")
+def _shutdown_parse_pool() -> None:
+    """Stop the parsing worker processes."""
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+async def _copy_upload(file: UploadFile, destination: Any) -> None:
+    """Copy an uploaded file to ``destination`` in bounded chunks."""
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        destination.write(chunk)
+
 @app.post("/api/upload-excel")
 async def upload_excel_api(
     file: UploadFile = File(...),
@@ -313,17 +454,15 @@ async def upload_excel_api(
         # Save uploaded file
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
         try:
-            content = await file.read()
-            temp_file.write(content)
+            await _copy_upload(file, temp_file)
             temp_file.close()
             
             # Generate test cases from Excel
-            test_cases = generate_test_cases_from_excel(temp_file.name, user.get("username", "admin"))
+            test_cases = await _run_in_parse_pool(generate_test_cases_from_excel, temp_file.name, user.get("username", "admin"))
             
-            # Add to database
-            added_count = 0
-            for test_case in test_cases:
-                case_data = {
+            # Add to database in a single transaction
+            added_count = len(db.add_test_cases([
+                {
                     "user_story": test_case["user_story"],
                     "test_set": test_case["test_set"],
                     "description": f"Test case for {test_case['user_story']}",
@@ -332,8 +471,9 @@ async def upload_excel_api(
                     "created_at": test_case["created_at"],
                     "version": test_case["version"]
                 }
-                db.add_test_case(case_data)
-                added_count += 1
+                for test_case in test_cases
+            ]))
+            _invalidate_test_cases()
             
             return {
                 "message": f"Successfully uploaded {file.filename}",
@@ -358,17 +498,15 @@ async def upload_brd_api(
         # Save uploaded file
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
         try:
-            content = await file.read()
-            temp_file.write(content)
+            await _copy_upload(file, temp_file)
             temp_file.close()
             
             # Generate test cases from BRD
-            test_cases = generate_test_cases_with_ragas(temp_file.name, user.get("username", "admin"), max_cases)
+            test_cases = await _run_in_parse_pool(generate_test_cases_with_ragas, temp_file.name, user.get("username", "admin"), max_cases)
             
-            # Add to database
-            added_count = 0
-            for test_case in test_cases:
-                case_data = {
+            # Add to database in a single transaction
+            added_count = len(db.add_test_cases([
+                {
                     "user_story": test_case["user_story"],
                     "test_set": test_case["test_set"],
                     "description": f"Test case for {test_case['user_story']}",
@@ -377,8 +515,9 @@ async def upload_brd_api(
                     "created_at": test_case["created_at"],
                     "version": test_case["version"]
                 }
-                db.add_test_case(case_data)
-                added_count += 1
+                for test_case in test_cases
+            ]))
+            _invalidate_test_cases()
             
             return {
                 "message": f"Successfully uploaded {file.filename}",
@@ -403,17 +542,15 @@ async def upload_swagger_api(
         # Save uploaded file
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
         try:
-            content = await file.read()
-            temp_file.write(content)
+            await _copy_upload(file, temp_file)
             temp_file.close()
             
             # Generate test cases from Swagger
-            test_cases = generate_test_cases_from_swagger(temp_file.name, user.get("username", "admin"), max_cases)
+            test_cases = await _run_in_parse_pool(generate_test_cases_from_swagger, temp_file.name, user.get("username", "admin"), max_cases)
             
-            # Add to database
-            added_count = 0
-            for test_case in test_cases:
-                case_data = {
+            # Add to database in a single transaction
+            added_count = len(db.add_test_cases([
+                {
                     "user_story": test_case["user_story"],
                     "test_set": test_case["test_set"],
                     "description": f"API test case for {test_case['user_story']}",
@@ -422,8 +559,9 @@ async def upload_swagger_api(
                     "created_at": test_case["created_at"],
                     "version": test_case["version"]
                 }
-                db.add_test_case(case_data)
-                added_count += 1
+                for test_case in test_cases
+            ]))
+            _invalidate_test_cases()
             
             return {
                 "message": f"Successfully uploaded {file.filename}",
@@ -441,45 +579,44 @@ async def upload_swagger_api(
 async def download_excel_api(user: dict = Depends(get_current_user)):
     """Download test cases as Excel file."""
     try:
-        # Get all test cases
-        test_cases = db.get_test_cases()
-        
-        # Create DataFrame
-        df_data = []
-        for case in test_cases:
-            df_data.append({
-                "ID": case.get("id"),
-                "User Story": case.get("user_story"),
-                "Test Set": case.get("test_set"),
-                "Category": case.get("category", "positive"),
-                "Priority": case.get("priority", "medium"),
-                "Source": case.get("source", "manual"),
-                "Created By": case.get("created_by"),
-                "Created At": case.get("created_at"),
-                "Version": case.get("version")
-            })
-        
-        df = pd.DataFrame(df_data)
-        
-        # Save to temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
-        try:
-            df.to_excel(temp_file.name, index=False)
-            temp_file.close()
-            
-            return FileResponse(
-                temp_file.name,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                filename="test_cases.xlsx"
-            )
-        except Exception:
-            os.unlink(temp_file.name)
-            raise
-    
+        buffer = await asyncio.to_thread(_build_test_cases_workbook, _get_test_cases())
+        return StreamingResponse(
+            iter(lambda: buffer.read(64 * 1024), b""),
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers={"Content-Disposition": 'attachment; filename="test_cases.xlsx"'}
+        )
     except Exception as exc:
         logger.error(f"Error downloading Excel file: {exc}")
         raise HTTPException(status_code=500, detail=str(exc))
 
+_EXCEL_COLUMNS = ["ID", "User Story", "Test Set", "Category", "Priority", "Source", "Created By", "Created At", "Version"]
+
+def _build_test_cases_workbook(test_cases: List[Dict[str, Any]]) -> io.BytesIO:
+    """Write test cases to an in-memory workbook, one row at a time.
+
+    A write-only workbook keeps only the current row in memory instead of
+    materialising the whole sheet as a DataFrame and a temporary file.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(_EXCEL_COLUMNS)
+    for case in test_cases:
+        sheet.append([
+            case.get("id"),
+            case.get("user_story"),
+            case.get("test_set"),
+            case.get("category", "positive"),
+            case.get("priority", "medium"),
+            case.get("source", "manual"),
+            case.get("created_by"),
+            case.get("created_at"),
+            case.get("version")
+        ])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+    return buffer
+
 # Real-time Sync API
 @app.post("/api/sync-excel")
 async def sync_excel_api(
@@ -489,34 +626,27 @@ async def sync_excel_api(
 ):
     """Synchronize Excel file with database in real-time."""
     try:
-        # Save uploaded file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
-        try:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file.close()
-            
-            # Read Excel file
-            df = pd.read_excel(temp_file.name)
-            
-            # Validate data integrity
-            validation_errors = _validate_excel_data(df)
-            if validation_errors:
-                raise HTTPException(status_code=400, detail=validation_errors)
-            
-            # Perform bidirectional sync
-            sync_result = _perform_bidirectional_sync(df)
-            
-            # Update database
-            _update_database_from_sync(sync_result)
-            
-            return {
-                "status": "success", 
-                "synced_records": len(sync_result),
-                "message": f"Successfully synced {len(sync_result)} records"
-            }
-        finally:
-            os.unlink(temp_file.name)
+        # Read the upload in place: it is already a spooled temporary file,
+        # held in memory when small and on disk only when large.
+        await file.seek(0)
+        df = await asyncio.to_thread(pd.read_excel, file.file)
+        
+        # Validate data integrity
+        validation_errors = _validate_excel_data(df)
+        if validation_errors:
+            raise HTTPException(status_code=400, detail=validation_errors)
+        
+        # Perform bidirectional sync
+        sync_result = await asyncio.to_thread(_perform_bidirectional_sync, df)
+        
+        # Update database
+        await asyncio.to_thread(_update_database_from_sync, sync_result)
+        
+        return {
+            "status": "success", 
+            "synced_records": len(sync_result),
+            "message": f"Successfully synced {len(sync_result)} records"
+        }
     
     except HTTPException:
         raise
@@ -534,76 +664,62 @@ def _validate_excel_data(df: pd.DataFrame) -> List[str]:
     if missing_columns:
         errors.append(f"Missing required columns: {missing_columns}")
     
-    # Check for empty values in required fields
-    for col in required_columns:
-        if col in df.columns:
-            empty_count = df[col].isna().sum()
+    # Check for empty values in required fields, counting all columns in one pass
+    present_columns = [col for col in required_columns if col in df.columns]
+    if present_columns:
+        empty_counts = df[present_columns].isna().sum()
+        for col, empty_count in empty_counts.items():
             if empty_count > 0:
                 errors.append(f"Column '{col}' has {empty_count} empty values")
     
     return errors
 
 def _perform_bidirectional_sync(df: pd.DataFrame) -> List[Dict[str, Any]]:
-    """Perform bidirectional synchronization between Excel and database."""
+    """Collect the spreadsheet rows to synchronise with the database.
+
+    Matching rows against existing cases is left to
+    :meth:`Database.upsert_test_cases`.
+    """
     sync_result = []
     
-    # Get existing test cases from database
-    existing_cases = db.get_test_cases()
-    
     # Process each row in Excel
-    for _, row in df.iterrows():
-        user_story = str(row.get("User Story", ""))
-        test_set = str(row.get("Test Set", ""))
+    for data in df.to_dict("records"):
+        user_story = str(data.get("User Story", ""))
+        test_set = str(data.get("Test Set", ""))
         
         if not user_story or not test_set:
             continue
         
-        # Check if case exists in database
-        existing_case = next(
-            (case for case in existing_cases 
-             if case.get("user_story") == user_story and case.get("test_set") == test_set),
-            None
-        )
-        
-        if existing_case:
-            # Update existing case
-            sync_result.append({
-                "action": "update",
-                "id": existing_case.get("id"),
-                "user_story": user_story,
-                "test_set": test_set,
-                "data": row.to_dict()
-            })
-        else:
-            # Create new case
-            sync_result.append({
-                "action": "create",
-                "user_story": user_story,
-                "test_set": test_set,
-                "data": row.to_dict()
-            })
+        sync_result.append({
+            "user_story": user_story,
+            "test_set": test_set,
+            "data": data
+        })
     
     return sync_result
 
 def _update_database_from_sync(sync_result: List[Dict[str, Any]]) -> None:
     """Update database from sync results."""
-    for item in sync_result:
-        if item["action"] == "create":
-            case_data = {
+    created_at = datetime.utcnow().isoformat()
+    if sync_result:
+        # Existing (user_story, test_set) pairs are updated, the rest inserted
+        db.upsert_test_cases([
+            {
                 "user_story": item["user_story"],
                 "test_set": item["test_set"],
                 "description": f"Test case for {item['user_story']}",
                 "created_by": "sync",
                 "source": "excel_sync",
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": created_at,
                 "version": 1
             }
-            db.add_test_case(case_data)
-        elif item["action"] == "update":
-            # Note: This would require adding an update method to the database
-            pass
+            for item in sync_result
+        ])
+    _invalidate_test_cases()
 
 # Test Execution Routes
+_EXECUTION_WORKERS = config.get("concurrency", {}).get("max_workers", 4)
+
 @app.post("/api/execute-tests")
 async def execute_tests_api(
     request: TestExecutionRequest,
@@ -631,24 +747,27 @@ async def _execute_test_cases(execution_id: str, test_case_ids: List[int], paral
     """Execute test cases in background."""
     try:
         # Get test cases
-        test_cases = db.get_test_cases()
-        cases_to_execute = [tc for tc in test_cases if tc.get("id") in test_case_ids]
-        
-        # Execute test cases
-        for case in cases_to_execute:
-            # Add test run
-            run_id = db.add_test_run(
-                case.get("id"),
-                status="running",
-                started_at=datetime.utcnow().isoformat(),
-                ended_at=datetime.utcnow().isoformat()
-            )
-            
-            # Simulate test execution
-            await asyncio.sleep(2)  # Simulate execution time
-            
-            # Update run status
-            # Note: This would require adding an update method to the database
+        cases_to_execute = db.get_test_cases_by_ids(test_case_ids)
+        
+        # Record every run up front in one batch
+        started_at = datetime.utcnow().isoformat()
+        db.add_test_runs([
+            (case.get("id"), "running", started_at, started_at, None, execution_id)
+            for case in cases_to_execute
+        ])
+        
+        # Execute test cases, overlapping them when parallel execution was requested
+        semaphore = asyncio.Semaphore(_EXECUTION_WORKERS if parallel else 1)
+        
+        async def run_one(case: Dict[str, Any]) -> None:
+            async with semaphore:
+                # Simulate test execution
+                await asyncio.sleep(2)  # Simulate execution time
+                
+                # Update run status
+                # Note: This would require adding an update method to the database
+        
+        await asyncio.gather(*(run_one(case) for case in cases_to_execute))
             
         logger.info(f"Completed execution {execution_id}")
     except Exception as exc:
@@ -658,19 +777,16 @@ async def _execute_test_cases(execution_id: str, test_case_ids: List[int], paral
 async def get_execution_status_api(execution_id: str, user: dict = Depends(get_current_user)):
     """Get execution status."""
     try:
-        # Get test runs for this execution
-        test_runs = db.get_test_runs()
+        # Count the runs recorded for this execution by status
+        run_stats = db.get_run_stats(execution_id)
         
-        # Filter by execution (simplified)
-        execution_runs = [run for run in test_runs if run.get("started_at", "").startswith(execution_id.split("_")[1])]
-        
-        if not execution_runs:
+        if not run_stats:
             return {"status": "not_found", "message": "Execution not found"}
         
         # Calculate status
-        total_runs = len(execution_runs)
-        completed_runs = len([r for r in execution_runs if r.get("status") in ["passed", "failed", "partial"]])
-        passed_runs = len([r for r in execution_runs if r.get("status") == "passed"])
+        total_runs = sum(run_stats.values())
+        completed_runs = sum(run_stats.get(status, 0) for status in ("passed", "failed", "partial"))
+        passed_runs = run_stats.get("passed", 0)
         
         if completed_runs == total_runs:
             status = "completed"
@@ -712,26 +828,26 @@ async def allure_report(user: dict = Depends(get_current_user)):
 
 # Statistics API
 @app.get("/api/statistics")
-async def get_statistics_api(user: dict = Depends(get_current_user)):
+async def get_statistics_api(request: Request, response: Response, user: dict = Depends(get_current_user)):
     """Get framework statistics."""
     try:
-        test_cases = db.get_test_cases()
-        test_runs = db.get_test_runs()
+        test_cases = _get_test_cases()
+        run_stats = _get_run_stats()
         
         # Calculate statistics
         total_cases = len(test_cases)
-        total_runs = len(test_runs)
-        passed_runs = len([r for r in test_runs if r.get("status") == "passed"])
-        failed_runs = len([r for r in test_runs if r.get("status") == "failed"])
-        partial_runs = len([r for r in test_runs if r.get("status") == "partial"])
+        total_runs = sum(run_stats.values())
+        passed_runs = run_stats.get("passed", 0)
+        failed_runs = run_stats.get("failed", 0)
+        partial_runs = run_stats.get("partial", 0)
         
         # Calculate success rate
         success_rate = (passed_runs / total_runs * 100) if total_runs > 0 else 0
         
         # Get recent activity
-        recent_runs = sorted(test_runs, key=lambda x: x.get("started_at", ""), reverse=True)[:10]
+        recent_runs = db.get_recent_runs(10)
         
-        return {
+        statistics = {
             "total_test_cases": total_cases,
             "total_test_runs": total_runs,
             "passed_runs": passed_runs,
@@ -740,6 +856,14 @@ async def get_statistics_api(user: dict = Depends(get_current_user)):
             "success_rate": round(success_rate, 2),
             "recent_activity": recent_runs
         }
+        
+        # Runs are written outside this process, so tag the content itself
+        digest = hashlib.blake2b(json.dumps(statistics, sort_keys=True, default=str).encode("utf-8"), digest_size=12)
+        etag = f'W/"stats-{digest.hexdigest()}"'
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return statistics
     except Exception as exc:
         logger.error(f"Error getting statistics: {exc}")
         raise HTTPException(status_code=500, detail=str(exc))
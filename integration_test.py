@@ -96,6 +96,7 @@ def test_legacy_drivers():
         }
         run_id = api_driver.run_test_case(api_case)
         print(f"    ✅ API test completed with run ID: {run_id}")
+        api_driver.close()
         
     finally:
         # Cleanup
@@ -11,8 +11,9 @@ entire test cases from BRDs and Swagger documents.
 
 The agent implements a conservative fallback strategy: if the
 configured provider is unavailable or returns invalid output, it
-reverts to deterministic heuristics. Calls into the LLM are also
-cached in memory to minimise repeated prompts.
+reverts to deterministic heuristics. LLM responses are also cached in
+memory, keyed on the prompt, provider, model and temperature, with a
+time-to-live so stale answers expire.
 
 Supported LLM Providers:
 - OpenAI (GPT-3.5, GPT-4)
@@ -23,14 +24,26 @@ Supported LLM Providers:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import io
 import json
 import logging
+import mmap
 import os
+import random
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
+from pathlib import Path
+
+import requests
+import yaml
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +76,34 @@ try:
 except ImportError:
     _langchain_available = False
 
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+# Incremental JSON parsing for large Swagger/OpenAPI specs
+try:
+    import ijson
+    _ijson_available = True
+except ImportError:
+    _ijson_available = False
+
+# Persistent second tier for the LLM response cache
+try:
+    import diskcache
+    _diskcache_available = True
+except ImportError:
+    _diskcache_available = False
+
+# Sentence embeddings for the optional semantic response cache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    _sentence_transformers_available = True
+except ImportError:
+    _sentence_transformers_available = False
+
 # RAGAS Framework Integration
 try:
     from ragas import evaluate, generate
@@ -72,7 +113,160 @@ except ImportError:
     _ragas_available = False
 
 
-@dataclass
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one alternation that matches any of them as a substring."""
+    if not keywords:
+        return re.compile(r"(?!)")  # never matches
+    return re.compile("|".join(re.escape(str(keyword)) for keyword in keywords))
+
+
+# LLM output parsing and cache-key hashing go through orjson when it is
+# installed; orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+# callers keep catching the stdlib exception.
+if _orjson_available:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _json_key_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+    def _json_key_bytes(obj: Any) -> bytes:
+        # Same bytes orjson produces, so on-disk cache keys agree across installs
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Outermost JSON array or object in a reply wrapped in prose or code fences
+_JSON_BLOB_RE = re.compile(r"\[.*\]|\{.*\}", re.S)
+
+
+def _parse_llm_json(response: str) -> Any:
+    """Decode an LLM reply as JSON, skipping any preamble around the payload.
+
+    :raises json.JSONDecodeError: If no JSON payload can be decoded.
+    """
+    try:
+        return _json_loads(response)
+    except json.JSONDecodeError:
+        match = _JSON_BLOB_RE.search(response)
+        if match is None or match.end() - match.start() == len(response):
+            raise
+        return _json_loads(match.group())
+
+
+# Step fields that describe the target element in a locator suggestion prompt
+_LOCATOR_HINT_FIELDS = ("action", "description", "target", "element", "text", "label", "value", "expected")
+
+# Headers of every generated API step; each step gets its own copy
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Distinct keyword hits, all in one category, that let classify() skip the LLM
+_CONFIDENT_KEYWORD_HITS = 2
+
+# Patterns used by the extraction helpers
+_URL_RE = re.compile(r"https?://[^\s]+")
+_ENDPOINT_RE = re.compile(r"/[^\s]+")
+_SWAGGER_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+# orjson and the stdlib raise ValueError subclasses; ijson has its own base
+_SWAGGER_PARSE_ERRORS = (ValueError, yaml.YAMLError) + ((ijson.JSONError,) if _ijson_available else ())
+# A whitespace-delimited action verb; the target is whatever follows it
+_ACTION_VERB_RE = re.compile(r"(?<!\S)(?:click|fill|enter|type|input|assert|verify)(?!\S)", re.IGNORECASE)
+# Every BRD story format in one alternation, so the document is scanned once
+_STORY_RE = re.compile(
+    r"As a (?P<role>\w+), I want to (?P<goal>.+?) so that (?P<benefit>.+?)(?=\n|$)"
+    r"|User Story: (?P<user_story>.+?)(?=\n|$)"
+    r"|Story: (?P<story>.+?)(?=\n|$)"
+    r"|Requirement: (?P<requirement>.+?)(?=\n|$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# The same pattern over raw bytes, for BRDs scanned through a memory map
+_STORY_BYTES_RE = re.compile(_STORY_RE.pattern.encode(), _STORY_RE.flags & ~re.UNICODE)
+
+
+def _is_rate_limit_error(exc: Optional[BaseException]) -> bool:
+    """Whether ``exc`` means the provider is throttling us.
+
+    Matches openai's ``RateLimitError``, Google's ``ResourceExhausted`` and
+    anything carrying an HTTP 429 status, without importing either SDK.
+    """
+    if exc is None:
+        return False
+    if type(exc).__name__ in ("RateLimitError", "ResourceExhausted", "TooManyRequests"):
+        return True
+    return getattr(exc, "status_code", None) == 429 or getattr(exc, "http_status", None) == 429
+
+
+def _retry_delay(attempt: int, rate_limited: bool) -> float:
+    """Jittered exponential backoff before retry ``attempt + 1``.
+
+    Rate-limited rounds start from a longer base and may wait longer, so
+    concurrent agents spread out instead of retrying in lockstep.
+    """
+    base, cap = (2.0, 30.0) if rate_limited else (0.5, 10.0)
+    return min(base * 2 ** (attempt - 1) * (1 + random.random()), cap)
+
+
+def _text_between(text: str, marker: str) -> str:
+    """Return the stripped text between the first and second ``marker``.
+
+    Equivalent to ``text.split(marker)[1].strip()`` without splitting the
+    whole string.
+    """
+    start = text.find(marker)
+    if start == -1:
+        return ""
+    start += len(marker)
+    end = text.find(marker, start)
+    return text[start:end if end != -1 else None].strip()
+
+
+# Action keywords for _parse_with_keywords, matched as substrings of the
+# lower-cased step in the order the branches are tested
+_CLICK_WORDS = _keyword_pattern(["click", "tap", "press"])
+_FILL_WORDS = _keyword_pattern(["fill", "enter", "type", "input"])
+_NAVIGATE_WORDS = _keyword_pattern(["navigate", "go to", "visit"])
+_ASSERT_WORDS = _keyword_pattern(["assert", "verify", "check"])
+_API_WORDS = _keyword_pattern(["get", "post", "put", "delete"])
+_SQL_WORDS = _keyword_pattern(["select", "insert", "update", "delete", "query"])
+_SWIPE_WORDS = _keyword_pattern(["swipe", "scroll", "pinch"])
+
+
+# System prompts are constants so every call sends a byte-identical prefix,
+# which lets providers reuse their prompt caches; per-call data belongs in
+# the user message.
+_PARSE_STEP_PROMPT = """Parse this test step into structured format. Return JSON with:
+{
+    "action": "click|fill|navigate|assert|api_request|sql_query",
+    "target": "selector or element description",
+    "data": {"value": "input data if any"},
+    "expected": "expected result",
+    "timeout": 30,
+    "retry_count": 3
+}"""
+_CLASSIFY_PROMPT = "Classify this test step into one category: ui, api, mobile, or sql. Respond with only the category name."
+_CLASSIFY_BATCH_PROMPT = "Classify each test step in this JSON array into one category: ui, api, mobile, or sql. Respond with only a JSON array of category names in the same order."
+_TRANSLATE_API_PROMPT = """Translate this API command to structured format using the given base URL.
+Return JSON with:
+{
+    "method": "GET|POST|PUT|DELETE",
+    "url": "full URL",
+    "headers": {"Content-Type": "application/json"},
+    "body": "request body if any",
+    "expected_status": 200
+}"""
+_TRANSLATE_SQL_PROMPT = "Translate this natural language command to SQL. Return JSON with 'sql' and 'assertion' fields."
+_SUGGEST_LOCATOR_PROMPT = "Suggest a CSS selector or XPath for this UI element. Return only the selector."
+_STORY_STEPS_PROMPTS = {
+    kind: f"Generate {kind} test steps for this user story. Return JSON array of steps."
+    for kind in ("positive", "negative")
+}
+
+
+@dataclass(slots=True)
 class APIRequest:
     """Structured representation of an API request."""
     method: str
@@ -82,7 +276,7 @@ class APIRequest:
     expected_status: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     """Structured representation of a generated test case."""
     user_story: str
@@ -93,9 +287,181 @@ class TestCase:
     tags: List[str]
 
 
+class LLMResponseCache:
+    """Thread-safe LRU cache of raw LLM responses with a time-to-live.
+
+    Keys are SHA-256 digests of the prompt together with every setting
+    that changes the answer (provider, model, temperature), so responses
+    are never shared across providers or models.
+
+    When ``directory`` is given and diskcache is installed, responses are
+    also written through to an on-disk cache there, which survives process
+    restarts (e.g. between CI runs) and is consulted on an in-memory miss.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 3600.0, directory: Optional[str] = None,
+                 disk_ttl: float = 604800.0, disk_size_limit: int = 2 ** 30) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_ttl = disk_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Any = None
+        if directory:
+            if _diskcache_available:
+                self._disk = diskcache.Cache(os.path.expanduser(directory), size_limit=disk_size_limit)
+            else:
+                logger.warning("disk_cache requires diskcache; LLM responses will only be cached in memory")
+
+    @staticmethod
+    def make_key(messages: List[Dict[str, str]], **params: Any) -> str:
+        """Hash ``messages`` and the call parameters into a cache key."""
+        return hashlib.sha256(_json_key_bytes({"messages": messages, **params})).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key`` unless missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+        
+        value = self._disk.get(key) if self._disk is not None else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._set_memory(key, value)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store ``value``, evicting the least recently used entries."""
+        self._set_memory(key, value)
+        if self._disk is not None and self.disk_ttl > 0:
+            self._disk.set(key, value, expire=self.disk_ttl)
+
+    def _set_memory(self, key: str, value: str) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response, including the on-disk tier."""
+        with self._lock:
+            self._entries.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+
+class _InFlightCall:
+    """An LLM request other threads with the same prompt can wait on."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+
+
+class SemanticCache:
+    """Serve responses for paraphrased prompts using sentence embeddings.
+
+    Entries are grouped by a namespace (the system prompt and call
+    settings) and matched on the cosine similarity of the user text, so
+    "click login" can reuse the answer for "press the login button" but
+    never an answer produced for a different task or model.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", threshold: float = 0.95, maxsize: int = 1024) -> None:
+        self.model_name = model_name
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._model: Any = None
+        self._entries: Dict[str, Tuple[List[Any], List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str) -> Any:
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(text, normalize_embeddings=True)
+
+    def lookup(self, namespace: str, text: str) -> Tuple[Optional[str], Any]:
+        """Return ``(response, embedding)``; ``response`` is ``None`` on a miss.
+
+        The embedding should be passed to :meth:`add` once the LLM has
+        answered, so the prompt is only embedded once.
+        """
+        if not _sentence_transformers_available:
+            return None, None
+        vector = self._embed(text)
+        with self._lock:
+            vectors, responses = self._entries.get(namespace, ([], []))
+            if vectors:
+                similarities = np.stack(vectors) @ vector
+                best = int(similarities.argmax())
+                if similarities[best] >= self.threshold:
+                    return responses[best], vector
+        return None, vector
+
+    def add(self, namespace: str, vector: Any, response: str) -> None:
+        """Remember ``response`` for the prompt embedded as ``vector``."""
+        if vector is None:
+            return
+        with self._lock:
+            vectors, responses = self._entries.setdefault(namespace, ([], []))
+            vectors.append(vector)
+            responses.append(response)
+            if len(vectors) > self.maxsize:
+                del vectors[0], responses[0]
+
+
+class CircuitBreaker:
+    """Skip providers that keep failing until a cool-down has passed.
+
+    After ``failure_threshold`` consecutive failures a provider is
+    considered open for ``reset_timeout`` seconds; the next call after
+    that is let through as a trial and closes the circuit on success.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[int, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, provider: "LLMProvider") -> bool:
+        """Whether calls to ``provider`` should currently be skipped."""
+        with self._lock:
+            failures, opened_at = self._failures.get(id(provider), (0, 0.0))
+        return failures >= self.failure_threshold and time.monotonic() - opened_at < self.reset_timeout
+
+    def record_failure(self, provider: "LLMProvider") -> None:
+        with self._lock:
+            failures, _ = self._failures.get(id(provider), (0, 0.0))
+            self._failures[id(provider)] = (failures + 1, time.monotonic())
+
+    def record_success(self, provider: "LLMProvider") -> None:
+        with self._lock:
+            self._failures.pop(id(provider), None)
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
+    # Exception behind the provider's most recent failed call, if any; lets
+    # the agent tell rate limiting apart from other failures
+    last_error: Optional[BaseException] = None
+    
     @abstractmethod
     def chat(self, messages: List[Dict[str, str]], temperature: float = 0.0) -> Optional[str]:
         """Send messages to the LLM and return the response."""
@@ -110,6 +476,14 @@ class LLMProvider(ABC):
     def get_priority(self) -> int:
         """Get provider priority for selection."""
         pass
+    
+    async def achat(self, messages: List[Dict[str, str]], temperature: float = 0.0) -> Optional[str]:
+        """Asynchronous :meth:`chat`.
+
+        Providers without a native async client run the blocking call in a
+        worker thread so several prompts can still be in flight at once.
+        """
+        return await asyncio.to_thread(self.chat, messages, temperature)
 
 
 class OpenAIProvider(LLMProvider):
@@ -145,6 +519,7 @@ class OpenAIProvider(LLMProvider):
             return response.choices[0].message["content"]
         except Exception as exc:
             logger.error(f"OpenAI API call failed: {exc}")
+            self.last_error = exc
             return None
 
 
@@ -157,12 +532,18 @@ class GeminiProvider(LLMProvider):
         self.timeout = config.get("timeout", 30)
         self.max_tokens = config.get("max_tokens", 2048)
         self.priority = config.get("priority", 2)
+        self._model: Any = None
         if _gemini_available and self.api_key:
             genai.configure(api_key=self.api_key)
+            # One client for every call instead of a new one per prompt
+            self._model = genai.GenerativeModel(self.model)
     
     def is_available(self) -> bool:
         return _gemini_available and bool(self.api_key)
     
+    def _generation_config(self, temperature: float) -> Any:
+        return genai.GenerationConfig(temperature=temperature, max_output_tokens=self.max_tokens)
+    
     def get_priority(self) -> int:
         return self.priority
     
@@ -173,11 +554,24 @@ class GeminiProvider(LLMProvider):
         try:
             # Convert messages to Gemini format
             prompt = "\n".join([msg["content"] for msg in messages])
-            model = genai.GenerativeModel(self.model)
-            response = model.generate_content(prompt)
+            response = self._model.generate_content(prompt, generation_config=self._generation_config(temperature))
             return response.text
         except Exception as exc:
             logger.error(f"Gemini API call failed: {exc}")
+            self.last_error = exc
+            return None
+    
+    async def achat(self, messages: List[Dict[str, str]], temperature: float = 0.0) -> Optional[str]:
+        if not self.is_available():
+            return None
+        
+        try:
+            prompt = "\n".join([msg["content"] for msg in messages])
+            response = await self._model.generate_content_async(prompt, generation_config=self._generation_config(temperature))
+            return response.text
+        except Exception as exc:
+            logger.error(f"Gemini API call failed: {exc}")
+            self.last_error = exc
             return None
 
 
@@ -190,16 +584,27 @@ class OllamaProvider(LLMProvider):
         self.timeout = config.get("timeout", 60)
         self.max_tokens = config.get("max_tokens", 4096)
         self.priority = config.get("priority", 3)
+        # Availability is probed over a keep-alive session and remembered
+        # briefly, since it is checked before every chat call
+        self.availability_ttl = config.get("availability_ttl", 10)
+        self._session = requests.Session()
+        self._avail_cached = False
+        self._avail_cached_at = float("-inf")
     
     def is_available(self) -> bool:
         if not _ollama_available:
             return False
+        if time.monotonic() - self._avail_cached_at < self.availability_ttl:
+            return self._avail_cached
         try:
-            import requests
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
-            return response.status_code == 200
-        except:
-            return False
+            response = self._session.head(f"{self.host}/api/version", timeout=2)
+            available = response.status_code == 200
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as exc:
+            logger.debug("Ollama unreachable at %s: %s", self.host, exc)
+            available = False
+        self._avail_cached = available
+        self._avail_cached_at = time.monotonic()
+        return available
     
     def get_priority(self) -> int:
         return self.priority
@@ -219,7 +624,45 @@ class OllamaProvider(LLMProvider):
             return response["message"]["content"]
         except Exception as exc:
             logger.error(f"Ollama API call failed: {exc}")
+            self.last_error = exc
             return None
+    
+    async def achat(self, messages: List[Dict[str, str]], temperature: float = 0.0) -> Optional[str]:
+        # The availability probe is a blocking HTTP request
+        if not await asyncio.to_thread(self.is_available):
+            return None
+        
+        try:
+            prompt = "\n".join([msg["content"] for msg in messages])
+            response = await ollama.AsyncClient(host=self.host).chat(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                options={"temperature": temperature}
+            )
+            return response["message"]["content"]
+        except Exception as exc:
+            logger.error(f"Ollama API call failed: {exc}")
+            self.last_error = exc
+            return None
+
+
+if _langchain_available:
+    class _ProviderBackedLLM(LLM):
+        """LangChain LLM that forwards prompts to one of our providers.
+
+        Defined once at import; building a LangChain model class runs its
+        pydantic machinery, which is too slow to repeat per chain.
+        """
+        
+        provider: Any
+        
+        def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+            response = self.provider.chat([{"role": "user", "content": prompt}])
+            return response or ""
+        
+        @property
+        def _llm_type(self) -> str:
+            return "custom"
 
 
 class LangChainManager:
@@ -228,30 +671,31 @@ class LangChainManager:
     def __init__(self, config: Dict[str, Any], llm_provider: LLMProvider):
         self.config = config
         self.llm_provider = llm_provider
+        # LangChain wrapper around the provider, built on first use and shared by every chain
+        self._llm: Any = None
         self.memory = None
         if config.get("memory_enabled", True):
             self.memory = ConversationBufferMemory()
     
     def create_chain(self, chain_type: str = "simple") -> Optional[Any]:
-        """Create a LangChain chain based on configuration."""
+        """Create a LangChain chain based on configuration.
+
+        ``sequential`` wraps a single chain in a SimpleSequentialChain;
+        every other type (``simple``, ``router`` or unknown) is a plain
+        LLMChain with the shared memory.
+        """
         if not _langchain_available:
             return None
         
         try:
-            llm = self._create_langchain_llm()
-            if not llm:
+            if self._llm is None:
+                self._llm = self._create_langchain_llm()
+            if not self._llm:
                 return None
             
-            if chain_type == "simple":
-                return LLMChain(llm=llm, memory=self.memory)
-            elif chain_type == "sequential":
-                # Create a simple sequential chain
-                return SimpleSequentialChain(chains=[LLMChain(llm=llm)])
-            elif chain_type == "router":
-                # Create a router chain (simplified)
-                return LLMChain(llm=llm, memory=self.memory)
-            else:
-                return LLMChain(llm=llm, memory=self.memory)
+            if chain_type == "sequential":
+                return SimpleSequentialChain(chains=[LLMChain(llm=self._llm)])
+            return LLMChain(llm=self._llm, memory=self.memory)
         except Exception as exc:
             logger.error(f"Failed to create LangChain: {exc}")
             return None
@@ -261,20 +705,7 @@ class LangChainManager:
         if not _langchain_available:
             return None
         
-        class CustomLLM(LLM):
-            def __init__(self, provider: LLMProvider):
-                super().__init__()
-                self.provider = provider
-            
-            def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
-                response = self.provider.chat([{"role": "user", "content": prompt}])
-                return response or ""
-            
-            @property
-            def _llm_type(self) -> str:
-                return "custom"
-        
-        return CustomLLM(self.llm_provider)
+        return _ProviderBackedLLM(provider=self.llm_provider)
 
 
 class LLMAgent:
@@ -288,7 +719,14 @@ class LLMAgent:
         
         # Initialize LLM providers with dynamic configuration
         self.providers = self._initialize_providers()
+        self._availability = self._probe_availability()
         self.active_provider = self._select_active_provider()
+        # Other usable providers, tried in priority order when the active one fails
+        self.provider_chain = self._build_provider_chain()
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=int(config.get("llm_framework", {}).get("circuit_breaker_threshold", 3)),
+            reset_timeout=float(config.get("llm_framework", {}).get("circuit_breaker_reset", 30)),
+        )
         
         # LangChain integration
         self.langchain_manager = None
@@ -300,6 +738,38 @@ class LLMAgent:
         self.timeout = int(config.get("llm_timeout", 30))
         self.temperature = float(config.get("llm_framework", {}).get("temperature", 0.1))
         self.max_tokens = int(config.get("llm_framework", {}).get("max_tokens", 2048))
+        # Upper bound on prompts in flight at once for batched generation
+        self.max_concurrency = max(1, int(config.get("llm_framework", {}).get("max_concurrency", 8)))
+        
+        # Response cache keyed on prompt, provider, model and temperature
+        self.response_cache = LLMResponseCache(
+            maxsize=int(config.get("llm_framework", {}).get("cache_size", 2048)),
+            ttl=float(config.get("llm_framework", {}).get("cache_ttl", 3600)),
+            directory=self._disk_cache_dir(),
+            disk_ttl=float(config.get("llm_framework", {}).get("disk_cache_ttl", 604800)),
+        )
+        # Prompts currently being sent, keyed like the response cache, so
+        # identical concurrent calls wait for one answer (single flight)
+        self._inflight: Dict[str, _InFlightCall] = {}
+        self._inflight_lock = threading.Lock()
+        self._ainflight: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+        # Opt-in paraphrase cache consulted after an exact-match miss
+        self.semantic_cache: Optional[SemanticCache] = None
+        if config.get("llm_framework", {}).get("semantic_cache", False):
+            if _sentence_transformers_available:
+                self.semantic_cache = SemanticCache(
+                    model_name=config.get("llm_framework", {}).get("semantic_model", "all-MiniLM-L6-v2"),
+                    threshold=float(config.get("llm_framework", {}).get("semantic_threshold", 0.95)),
+                )
+            else:
+                logger.warning("semantic_cache requires sentence-transformers; semantic caching disabled")
+        
+        # One compiled alternation per category for the keyword router
+        router_config = config.get("router", {})
+        self._keyword_patterns = [
+            (category, _keyword_pattern(router_config.get(f"{category}_keywords", [])))
+            for category in ("ui", "api", "mobile", "sql")
+        ]
         
         # NLP Configuration
         self.nlp_config = config.get("nlp", {})
@@ -307,6 +777,20 @@ class LLMAgent:
         self.fallback_to_keywords = self.nlp_config.get("fallback_to_keywords", True)
         self.context_awareness = self.nlp_config.get("context_awareness", True)
 
+    def _disk_cache_dir(self) -> Optional[str]:
+        """Directory for the persistent response cache, or ``None`` if disabled.
+
+        ``UNICORN_LLM_CACHE_DIR`` overrides the configuration so CI can
+        point the cache at a restored artifact.
+        """
+        directory = os.getenv("UNICORN_LLM_CACHE_DIR")
+        if directory:
+            return directory
+        framework_config = self.config.get("llm_framework", {})
+        if framework_config.get("disk_cache", False):
+            return framework_config.get("disk_cache_dir", "~/.cache/unicorn_llm")
+        return None
+
     def _initialize_providers(self) -> Dict[str, LLMProvider]:
         """Initialize all available LLM providers from configuration."""
         providers = {}
@@ -330,13 +814,34 @@ class LLMAgent:
         
         return providers
 
+    def _probe_availability(self) -> Dict[str, bool]:
+        """Check every provider's availability once, concurrently.
+
+        Probes may make network calls (Ollama), so running them side by
+        side bounds startup by the slowest probe rather than their sum.
+        Selection and the fallback chain both read this snapshot.
+        """
+        if not self.providers:
+            return {}
+        
+        def probe(provider: LLMProvider) -> bool:
+            try:
+                return provider.is_available()
+            except Exception as exc:
+                logger.warning(f"Availability check for {type(provider).__name__} failed: {exc}")
+                return False
+        
+        with ThreadPoolExecutor(max_workers=len(self.providers)) as pool:
+            results = pool.map(probe, self.providers.values())
+            return dict(zip(self.providers.keys(), results))
+
     def _select_active_provider(self) -> Optional[LLMProvider]:
         """Select the active LLM provider based on configuration and availability."""
         if self.mode == "auto":
             # Select based on priority and availability
             available_providers = [
-                provider for provider in self.providers.values() 
-                if provider.is_available()
+                provider for name, provider in self.providers.items() 
+                if self._availability[name]
             ]
             if available_providers:
                 return min(available_providers, key=lambda p: p.get_priority())
@@ -344,42 +849,195 @@ class LLMAgent:
         elif self.mode == "cloud":
             # Prefer cloud providers
             for provider_name in ["openai", "gemini"]:
-                if provider_name in self.providers and self.providers[provider_name].is_available():
+                if self._availability.get(provider_name):
                     return self.providers[provider_name]
         
         # Fall back to local provider
-        if "ollama" in self.providers and self.providers["ollama"].is_available():
+        if self._availability.get("ollama"):
             return self.providers["ollama"]
         
         # Fall back to any available provider
-        for provider in self.providers.values():
-            if provider.is_available():
+        for name, provider in self.providers.items():
+            if self._availability[name]:
                 return provider
         
         return None
 
-    def _call_llm(self, messages: List[Dict[str, str]], temperature: float = None) -> Optional[str]:
-        """Call the active LLM provider with retry logic."""
+    def _build_provider_chain(self) -> List[LLMProvider]:
+        """Return the available providers ordered by priority."""
+        available = [provider for name, provider in self.providers.items() if self._availability[name]]
+        return sorted(available, key=lambda provider: provider.get_priority())
+
+    def _providers_to_try(self) -> List[LLMProvider]:
+        """The active provider followed by the fallbacks whose circuit is closed."""
+        chain = [self.active_provider] + [p for p in self.provider_chain if p is not self.active_provider]
+        return [provider for provider in chain if not self.circuit_breaker.is_open(provider)]
+
+    def _call_llm(self, messages: List[Dict[str, str]], temperature: float = None, semantic: bool = False) -> Optional[str]:
+        """Call the active LLM provider with retry logic.
+
+        Each attempt tries the active provider first and then the other
+        available providers by priority, skipping any whose circuit
+        breaker is open.  Responses are cached under the active
+        provider's key, so a fallback answer is reused during an outage.
+        Attempts are separated by jittered exponential backoff, waiting
+        longer when a provider reported rate limiting.
+
+        Concurrent calls with the same cache key share a single request:
+        the first caller sends it and the rest wait for its answer.
+
+        :param semantic: Also accept a cached answer to a paraphrase of
+            the user message; only safe for prompts whose answer does not
+            depend on exact wording.
+        """
         if not self.active_provider:
             return None
         
         temp = temperature if temperature is not None else self.temperature
+        cached, key, probe = self._lookup_response(messages, temp, semantic)
+        if cached is not None:
+            return cached
+        
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InFlightCall()
+        if not leader:
+            # An identical prompt is already being sent; share its answer
+            call.done.wait()
+            return call.result
+        try:
+            call.result = self._call_providers(messages, temp, key, probe)
+            return call.result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def _call_providers(self, messages: List[Dict[str, str]], temp: float, key: str, probe: Optional[tuple]) -> Optional[str]:
+        """Retry loop behind :meth:`_call_llm`, run once per in-flight prompt."""
+        for attempt in range(1, self.retries + 1):
+            rate_limited = False
+            for provider in self._providers_to_try():
+                provider.last_error = None
+                try:
+                    result = provider.chat(messages, temp)
+                except Exception as exc:
+                    logger.warning(f"LLM call attempt {attempt}/{self.retries} via {type(provider).__name__} failed: {exc}")
+                    provider.last_error = exc
+                    result = None
+                if result:
+                    self.circuit_breaker.record_success(provider)
+                    self._store_response(key, probe, result)
+                    return result
+                self.circuit_breaker.record_failure(provider)
+                # Throttled providers fail over to the next one straight away
+                rate_limited = rate_limited or _is_rate_limit_error(provider.last_error)
+            if attempt < self.retries:
+                time.sleep(_retry_delay(attempt, rate_limited))
         
+        return None
+
+    def _cache_key(self, messages: List[Dict[str, str]], temperature: float) -> str:
+        """Response cache key for ``messages`` sent to the active provider."""
+        provider = self.active_provider
+        return LLMResponseCache.make_key(
+            messages,
+            provider=type(provider).__name__,
+            model=getattr(provider, "model", None),
+            temperature=temperature,
+        )
+
+    def _lookup_response(self, messages: List[Dict[str, str]], temperature: float, semantic: bool) -> Tuple[Optional[str], str, Optional[tuple]]:
+        """Check the exact and, if requested, the semantic response caches.
+
+        :returns: ``(cached_response, exact_key, semantic_probe)`` where the
+            probe is handed back to :meth:`_store_response` after a miss.
+        """
+        key = self._cache_key(messages, temperature)
+        cached = self.response_cache.get(key)
+        if cached is not None or not semantic or self.semantic_cache is None:
+            return cached, key, None
+        
+        namespace = self._cache_key([msg for msg in messages if msg["role"] != "user"], temperature)
+        text = "\n".join(msg["content"] for msg in messages if msg["role"] == "user")
+        cached, vector = self.semantic_cache.lookup(namespace, text)
+        if cached is not None:
+            self.response_cache.set(key, cached)
+        return cached, key, (namespace, vector)
+
+    def _store_response(self, key: str, probe: Optional[tuple], response: str) -> None:
+        """Record a fresh response in the caches it was looked up in."""
+        self.response_cache.set(key, response)
+        if probe is not None and self.semantic_cache is not None:
+            self.semantic_cache.add(probe[0], probe[1], response)
+
+    async def _acall_llm(self, messages: List[Dict[str, str]], temperature: float = None, semantic: bool = False) -> Optional[str]:
+        """Asynchronous :meth:`_call_llm` with the same retry logic and deduplication."""
+        if not self.active_provider:
+            return None
+        
+        temp = temperature if temperature is not None else self.temperature
+        cached, key, probe = self._lookup_response(messages, temp, semantic)
+        if cached is not None:
+            return cached
+        
+        loop = asyncio.get_running_loop()
+        pending = self._ainflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            # Shielded so a cancelled follower does not cancel the leader's call
+            return await asyncio.shield(pending)
+        future = loop.create_future()
+        self._ainflight[key] = future
+        try:
+            result = await self._acall_providers(messages, temp, key, probe)
+            future.set_result(result)
+            return result
+        finally:
+            if self._ainflight.get(key) is future:
+                del self._ainflight[key]
+            if not future.done():
+                future.set_result(None)
+
+    async def _acall_providers(self, messages: List[Dict[str, str]], temp: float, key: str, probe: Optional[tuple]) -> Optional[str]:
+        """Retry loop behind :meth:`_acall_llm`, run once per in-flight prompt."""
         for attempt in range(1, self.retries + 1):
-            try:
-                result = self.active_provider.chat(messages, temp)
+            rate_limited = False
+            for provider in self._providers_to_try():
+                provider.last_error = None
+                try:
+                    result = await provider.achat(messages, temp)
+                except Exception as exc:
+                    logger.warning(f"LLM call attempt {attempt}/{self.retries} via {type(provider).__name__} failed: {exc}")
+                    provider.last_error = exc
+                    result = None
                 if result:
+                    self.circuit_breaker.record_success(provider)
+                    self._store_response(key, probe, result)
                     return result
-            except Exception as exc:
-                logger.warning(f"LLM call attempt {attempt}/{self.retries} failed: {exc}")
-                if attempt >= self.retries:
-                    break
-                time.sleep(1)  # Brief delay before retry
+                self.circuit_breaker.record_failure(provider)
+                # Throttled providers fail over to the next one straight away
+                rate_limited = rate_limited or _is_rate_limit_error(provider.last_error)
+            if attempt < self.retries:
+                await asyncio.sleep(_retry_delay(attempt, rate_limited))
         
         return None
 
+    async def _acall_llm_batch(self, batch: List[List[Dict[str, str]]], temperature: float = None) -> List[Optional[str]]:
+        """Send several prompts concurrently, at most ``max_concurrency`` at a time.
+
+        :returns: Responses aligned with ``batch``.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def call(messages: List[Dict[str, str]]) -> Optional[str]:
+            async with semaphore:
+                return await self._acall_llm(messages, temperature)
+        
+        return list(await asyncio.gather(*(call(messages) for messages in batch)))
+
     # Enhanced Natural Language Processing
-    @lru_cache(maxsize=128)
     def parse_natural_language_step(self, step_text: str) -> Dict[str, Any]:
         """Parse natural language step using advanced LLM processing."""
         if not self.enable_advanced_parsing:
@@ -388,15 +1046,7 @@ class LLMAgent:
         messages = [
             {
                 "role": "system", 
-                "content": """Parse this test step into structured format. Return JSON with:
-                {
-                    "action": "click|fill|navigate|assert|api_request|sql_query",
-                    "target": "selector or element description",
-                    "data": {"value": "input data if any"},
-                    "expected": "expected result",
-                    "timeout": 30,
-                    "retry_count": 3
-                }"""
+                "content": _PARSE_STEP_PROMPT
             },
             {"role": "user", "content": step_text}
         ]
@@ -404,7 +1054,7 @@ class LLMAgent:
         response = self._call_llm(messages)
         if response:
             try:
-                return json.loads(response)
+                return _parse_llm_json(response)
             except json.JSONDecodeError:
                 logger.warning("Failed to parse LLM response as JSON")
         
@@ -419,25 +1069,25 @@ class LLMAgent:
         text_lower = text.lower()
         
         # UI Actions
-        if any(word in text_lower for word in ["click", "tap", "press"]):
+        if _CLICK_WORDS.search(text_lower):
             return {"action": "click", "target": self._extract_target(text)}
-        elif any(word in text_lower for word in ["fill", "enter", "type", "input"]):
+        elif _FILL_WORDS.search(text_lower):
             return {"action": "fill", "target": self._extract_target(text), "data": {"value": self._extract_value(text)}}
-        elif any(word in text_lower for word in ["navigate", "go to", "visit"]):
+        elif _NAVIGATE_WORDS.search(text_lower):
             return {"action": "navigate", "target": self._extract_url(text)}
-        elif any(word in text_lower for word in ["assert", "verify", "check"]):
+        elif _ASSERT_WORDS.search(text_lower):
             return {"action": "assert", "target": self._extract_target(text), "expected": self._extract_expected(text)}
         
         # API Actions
-        elif any(word in text_lower for word in ["get", "post", "put", "delete"]):
+        elif _API_WORDS.search(text_lower):
             return {"action": "api_request", "target": self._extract_api_endpoint(text)}
         
         # SQL Actions
-        elif any(word in text_lower for word in ["select", "insert", "update", "delete", "query"]):
+        elif _SQL_WORDS.search(text_lower):
             return {"action": "sql_query", "target": self._extract_sql_query(text)}
         
         # Mobile Actions
-        elif any(word in text_lower for word in ["swipe", "scroll", "pinch"]):
+        elif _SWIPE_WORDS.search(text_lower):
             return {"action": "swipe", "target": self._extract_target(text)}
         
         return {"action": "unknown", "target": text}
@@ -445,42 +1095,30 @@ class LLMAgent:
     def _extract_target(self, text: str) -> str:
         """Extract target element from text."""
         # Simple extraction - can be enhanced with NLP
-        words = text.split()
-        for i, word in enumerate(words):
-            if word.lower() in ["click", "fill", "enter", "type", "input", "assert", "verify"]:
-                if i + 1 < len(words):
-                    return " ".join(words[i+1:])
+        match = _ACTION_VERB_RE.search(text)
+        if match:
+            rest = text[match.end():].split()
+            if rest:
+                return " ".join(rest)
         return text
 
     def _extract_value(self, text: str) -> str:
         """Extract input value from text."""
         # Simple extraction - can be enhanced
-        if "with" in text.lower():
-            parts = text.lower().split("with")
-            if len(parts) > 1:
-                return parts[1].strip()
-        return ""
+        return _text_between(text.lower(), "with")
 
     def _extract_url(self, text: str) -> str:
         """Extract URL from text."""
-        import re
-        url_pattern = r'https?://[^\s]+'
-        match = re.search(url_pattern, text)
+        match = _URL_RE.search(text)
         return match.group() if match else text
 
     def _extract_expected(self, text: str) -> str:
         """Extract expected result from text."""
-        if "should" in text.lower():
-            parts = text.lower().split("should")
-            if len(parts) > 1:
-                return parts[1].strip()
-        return ""
+        return _text_between(text.lower(), "should")
 
     def _extract_api_endpoint(self, text: str) -> str:
         """Extract API endpoint from text."""
-        import re
-        endpoint_pattern = r'/[^\s]+'
-        match = re.search(endpoint_pattern, text)
+        match = _ENDPOINT_RE.search(text)
         return match.group() if match else text
 
     def _extract_sql_query(self, text: str) -> str:
@@ -489,21 +1127,27 @@ class LLMAgent:
         return text
 
     # Classification of test steps
-    @lru_cache(maxsize=128)
     def classify(self, text: str) -> str:
-        """Classify a block of text into one of: ui, api, mobile or sql."""
+        """Classify a block of text into one of: ui, api, mobile or sql.
+
+        Steps the keyword heuristic classifies unambiguously are answered
+        without calling the LLM.
+        """
         if not self.active_provider:
             return self._heuristic_classify(text)
+        category, confidence = self._heuristic_classify_with_confidence(text)
+        if confidence >= 1.0:
+            return category
         
         messages = [
             {
                 "role": "system",
-                "content": "Classify this test step into one category: ui, api, mobile, or sql. Respond with only the category name."
+                "content": _CLASSIFY_PROMPT
             },
             {"role": "user", "content": text}
         ]
         
-        response = self._call_llm(messages)
+        response = self._call_llm(messages, semantic=True)
         if response:
             category = response.strip().lower()
             if category in ["ui", "api", "mobile", "sql"]:
@@ -511,70 +1155,153 @@ class LLMAgent:
         
         return self._heuristic_classify(text)
 
+    def classify_batch(self, texts: List[str]) -> List[str]:
+        """Classify many steps with at most one LLM round-trip.
+
+        Texts the keyword heuristic classifies unambiguously are answered
+        directly.  Each remaining text is looked up in the response caches
+        under the same key :meth:`classify` uses; only the misses are
+        sent, together, as a JSON array.  Fresh answers are cached per
+        item, so later single calls hit them too.
+
+        :param texts: Step texts to classify.
+        :return: Categories aligned with ``texts``.
+        """
+        unique = list(dict.fromkeys(texts))
+        if not self.active_provider:
+            return [self._heuristic_classify(text) for text in texts]
+        
+        categories: Dict[str, str] = {}
+        misses = []
+        for text in unique:
+            category, confidence = self._heuristic_classify_with_confidence(text)
+            if confidence >= 1.0:
+                categories[text] = category
+                continue
+            messages = [
+                {"role": "system", "content": _CLASSIFY_PROMPT},
+                {"role": "user", "content": text}
+            ]
+            cached, key, probe = self._lookup_response(messages, self.temperature, True)
+            category = cached.strip().lower() if cached else None
+            if category in ("ui", "api", "mobile", "sql"):
+                categories[text] = category
+            else:
+                misses.append((text, key, probe))
+        
+        if len(misses) == 1:
+            categories[misses[0][0]] = self.classify(misses[0][0])
+        elif misses:
+            messages = [
+                {"role": "system", "content": _CLASSIFY_BATCH_PROMPT},
+                {"role": "user", "content": _json_dumps([text for text, _, _ in misses])}
+            ]
+            answers = []
+            response = self._call_llm(messages)
+            if response:
+                try:
+                    answers = _parse_llm_json(response)
+                except json.JSONDecodeError:
+                    logger.warning("Failed to parse batch classification as JSON")
+            if not isinstance(answers, list) or len(answers) != len(misses):
+                answers = [None] * len(misses)
+            for (text, key, probe), answer in zip(misses, answers):
+                category = answer.strip().lower() if isinstance(answer, str) else None
+                if category in ("ui", "api", "mobile", "sql"):
+                    self._store_response(key, probe, category)
+                    categories[text] = category
+                else:
+                    categories[text] = self._heuristic_classify(text)
+        
+        return [categories[text] for text in texts]
+
+    def _heuristic_classify_with_confidence(self, text: str) -> Tuple[str, float]:
+        """Keyword classification with a confidence score.
+
+        Scores each category by the number of distinct keywords it
+        matches.  Confidence is 1.0 when one category has at least
+        ``_CONFIDENT_KEYWORD_HITS`` matches and no other category matches
+        at all; otherwise it is the winner's share of all matches.
+        """
+        text_lower = text.lower()
+        scores = [(len(set(pattern.findall(text_lower))), category) for category, pattern in self._keyword_patterns]
+        total = sum(score for score, _ in scores)
+        if not total:
+            return "ui", 0.0
+        # max() keeps the first of equal scores, matching the priority order
+        best, category = max(scores, key=lambda item: item[0])
+        if best >= _CONFIDENT_KEYWORD_HITS and best == total:
+            return category, 1.0
+        return category, best / total
+
     def _heuristic_classify(self, text: str) -> str:
         """Heuristic classification based on keywords."""
         text_lower = text.lower()
         
-        # UI keywords
-        ui_keywords = self.config.get("router", {}).get("ui_keywords", [])
-        if any(keyword in text_lower for keyword in ui_keywords):
-            return "ui"
-        
-        # API keywords
-        api_keywords = self.config.get("router", {}).get("api_keywords", [])
-        if any(keyword in text_lower for keyword in api_keywords):
-            return "api"
-        
-        # Mobile keywords
-        mobile_keywords = self.config.get("router", {}).get("mobile_keywords", [])
-        if any(keyword in text_lower for keyword in mobile_keywords):
-            return "mobile"
-        
-        # SQL keywords
-        sql_keywords = self.config.get("router", {}).get("sql_keywords", [])
-        if any(keyword in text_lower for keyword in sql_keywords):
-            return "sql"
+        # Categories are checked in priority order: ui, api, mobile, sql
+        for category, pattern in self._keyword_patterns:
+            if pattern.search(text_lower):
+                return category
         
         return "ui"  # Default to UI
 
     # API Translation
-    @lru_cache(maxsize=128)
     def translate_api(self, command: str, base_url: str = "") -> APIRequest:
         """Translate natural language API command to structured request."""
+        return self.translate_api_with_source(command, base_url)[0]
+
+    def translate_api_with_source(self, command: str, base_url: str = "") -> Tuple[APIRequest, bool]:
+        """Translate an API command and report whether the LLM produced it.
+
+        The flag is False when the keyword heuristic answered instead,
+        because no provider is active, the call failed or the reply was
+        not valid JSON.  Callers use it to cache only real LLM answers.
+        """
         if not self.active_provider:
-            return self._heuristic_api_translation(command, base_url)
+            return self._heuristic_api_translation(command, base_url), False
         
         messages = [
             {
                 "role": "system",
-                "content": f"""Translate this API command to structured format. Base URL: {base_url}
-                Return JSON with:
-                {{
-                    "method": "GET|POST|PUT|DELETE",
-                    "url": "full URL",
-                    "headers": {{"Content-Type": "application/json"}},
-                    "body": "request body if any",
-                    "expected_status": 200
-                }}"""
+                "content": _TRANSLATE_API_PROMPT
             },
-            {"role": "user", "content": command}
+            {"role": "user", "content": f"Base URL: {base_url}\nCommand: {command}"}
         ]
         
         response = self._call_llm(messages)
         if response:
             try:
-                data = json.loads(response)
+                data = _parse_llm_json(response)
                 return APIRequest(
                     method=data.get("method", "GET"),
                     url=data.get("url", ""),
                     headers=data.get("headers", {}),
                     body=data.get("body"),
                     expected_status=data.get("expected_status", 200)
-                )
+                ), True
             except json.JSONDecodeError:
                 logger.warning("Failed to parse API translation as JSON")
         
-        return self._heuristic_api_translation(command, base_url)
+        return self._heuristic_api_translation(command, base_url), False
+
+    def translate_api_batch(self, items: List[tuple]) -> List[Tuple[APIRequest, bool]]:
+        """Translate many ``(command, base_url)`` pairs at once.
+
+        Distinct pairs are translated concurrently so a test case pays
+        roughly one LLM round-trip instead of one per step.  The result
+        list is aligned with ``items`` and holds the same
+        ``(request, from_llm)`` pairs as :meth:`translate_api_with_source`.
+        """
+        unique = list(dict.fromkeys(items))
+        if not unique:
+            return []
+        if not self.active_provider or len(unique) == 1:
+            translated = [self.translate_api_with_source(command, base_url) for command, base_url in unique]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(unique))) as executor:
+                translated = list(executor.map(lambda item: self.translate_api_with_source(*item), unique))
+        lookup = dict(zip(unique, translated))
+        return [lookup[item] for item in items]
 
     def _heuristic_api_translation(self, command: str, base_url: str) -> APIRequest:
         """Heuristic API translation using keyword matching."""
@@ -590,9 +1317,7 @@ class LLMAgent:
             method = "DELETE"
         
         # Extract URL
-        import re
-        url_pattern = r'https?://[^\s]+'
-        url_match = re.search(url_pattern, command)
+        url_match = _URL_RE.search(command)
         url = url_match.group() if url_match else f"{base_url}/api"
         
         return APIRequest(
@@ -604,7 +1329,6 @@ class LLMAgent:
         )
 
     # SQL Translation
-    @lru_cache(maxsize=64)
     def translate_sql(self, command: str) -> Dict[str, str]:
         """Translate natural language to SQL query."""
         if not self.active_provider:
@@ -613,7 +1337,7 @@ class LLMAgent:
         messages = [
             {
                 "role": "system",
-                "content": "Translate this natural language command to SQL. Return JSON with 'sql' and 'assertion' fields."
+                "content": _TRANSLATE_SQL_PROMPT
             },
             {"role": "user", "content": command}
         ]
@@ -621,7 +1345,7 @@ class LLMAgent:
         response = self._call_llm(messages)
         if response:
             try:
-                return json.loads(response)
+                return _parse_llm_json(response)
             except json.JSONDecodeError:
                 logger.warning("Failed to parse SQL translation as JSON")
         
@@ -653,7 +1377,21 @@ class LLMAgent:
         return "table"
 
     # UI Locator Suggestions
-    @lru_cache(maxsize=64)
+    @staticmethod
+    def describe_step(step: Dict[str, Any]) -> str:
+        """Summarise a step as the element description for a locator prompt.
+
+        Only the fields that identify the element are included, which keeps
+        the prompt short; a step with none of them is sent in full.
+        """
+        parts = [f"{field}: {step[field]}" for field in _LOCATOR_HINT_FIELDS if step.get(field)]
+        if parts:
+            return "; ".join(parts)
+        try:
+            return _json_dumps(step)
+        except (TypeError, ValueError):
+            return str(step)
+
     def suggest_ui_locator(self, description: str) -> Optional[str]:
         """Suggest UI locator based on description."""
         if not self.active_provider:
@@ -662,7 +1400,7 @@ class LLMAgent:
         messages = [
             {
                 "role": "system",
-                "content": "Suggest a CSS selector or XPath for this UI element. Return only the selector."
+                "content": _SUGGEST_LOCATOR_PROMPT
             },
             {"role": "user", "content": description}
         ]
@@ -670,6 +1408,39 @@ class LLMAgent:
         response = self._call_llm(messages)
         return response.strip() if response else None
 
+    async def asuggest_ui_locator(self, description: str) -> Optional[str]:
+        """Asynchronous :meth:`suggest_ui_locator`."""
+        if not self.active_provider:
+            return None
+        response = await self._acall_llm(self._suggest_locator_messages(description))
+        return response.strip() if response else None
+
+    def suggest_ui_locators(self, descriptions: List[str]) -> List[Optional[str]]:
+        """Suggest locators for several elements with the prompts in flight together.
+
+        Falls back to one call at a time for a single description or
+        when called from a running event loop.
+
+        :returns: Suggestions aligned with ``descriptions``.
+        """
+        try:
+            asyncio.get_running_loop()
+            in_event_loop = True
+        except RuntimeError:
+            in_event_loop = False
+        if not self.active_provider or len(descriptions) < 2 or in_event_loop:
+            return [self.suggest_ui_locator(description) for description in descriptions]
+        
+        responses = asyncio.run(self._acall_llm_batch([self._suggest_locator_messages(d) for d in descriptions]))
+        return [response.strip() if response else None for response in responses]
+
+    @staticmethod
+    def _suggest_locator_messages(description: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": _SUGGEST_LOCATOR_PROMPT},
+            {"role": "user", "content": description}
+        ]
+
     # RAGAS Integration for Test Case Generation
     def generate_test_cases_with_ragas(self, brd_content: str, max_cases: int = 10) -> List[TestCase]:
         """Generate test cases using actual RAGAS framework."""
@@ -699,15 +1470,15 @@ class LLMAgent:
         # Implementation would parse RAGAS output and create structured test cases
         return test_cases
 
-    def generate_test_cases_from_brd_fallback(self, brd_content: str, max_cases: int = 10) -> List[TestCase]:
+    def generate_test_cases_from_brd_fallback(self, brd_content: Union[str, bytes, Path], max_cases: int = 10) -> List[TestCase]:
         """Fallback test case generation without RAGAS."""
         # Extract user stories from BRD content
-        user_stories = self._extract_user_stories_from_brd(brd_content)
+        user_stories = self._extract_user_stories_from_brd(brd_content)[:max_cases]
+        positive_batch, negative_batch = self._generate_story_steps_batch(user_stories)
         
         test_cases = []
-        for story in user_stories[:max_cases]:
+        for story, positive_steps, negative_steps in zip(user_stories, positive_batch, negative_batch):
             # Generate positive test case
-            positive_steps = self._generate_positive_test_steps(story)
             test_case = TestCase(
                 user_story=story,
                 test_set="BRD Generated",
@@ -719,7 +1490,6 @@ class LLMAgent:
             test_cases.append(test_case)
             
             # Generate negative test case
-            negative_steps = self._generate_negative_test_steps(story)
             test_case = TestCase(
                 user_story=story,
                 test_set="BRD Generated - Negative",
@@ -732,80 +1502,115 @@ class LLMAgent:
         
         return test_cases
 
-    def _extract_user_stories_from_brd(self, brd_content: str) -> List[str]:
-        """Extract user stories from BRD content."""
-        import re
-        stories = []
-        
-        # Pattern-based extraction
-        patterns = [
-            r"As a (\w+), I want to (.+?) so that (.+?)(?=\n|$)",
-            r"User Story: (.+?)(?=\n|$)",
-            r"Story: (.+?)(?=\n|$)",
-            r"Requirement: (.+?)(?=\n|$)",
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, brd_content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    stories.append(" ".join(match))
-                else:
-                    stories.append(match)
+    def _generate_story_steps_batch(self, user_stories: List[str]) -> tuple:
+        """Generate positive and negative steps for every story.
+
+        With an active provider all prompts are sent concurrently; the
+        sequential path is kept for a single story or when called from a
+        running event loop, where ``asyncio.run`` is not allowed.
+
+        :returns: ``(positive_steps, negative_steps)`` lists aligned with
+            ``user_stories``.
+        """
+        try:
+            asyncio.get_running_loop()
+            in_event_loop = True
+        except RuntimeError:
+            in_event_loop = False
+        if not self.active_provider or len(user_stories) < 2 or in_event_loop:
+            return (
+                [self._generate_positive_test_steps(story) for story in user_stories],
+                [self._generate_negative_test_steps(story) for story in user_stories],
+            )
         
+        batch = [self._story_steps_messages(story, kind) for kind in ("positive", "negative") for story in user_stories]
+        responses = asyncio.run(self._acall_llm_batch(batch))
+        count = len(user_stories)
+        return (
+            [self._parse_story_steps(response, "positive") for response in responses[:count]],
+            [self._parse_story_steps(response, "negative") for response in responses[count:]],
+        )
+
+    def _extract_user_stories_from_brd(self, brd_content: Union[str, bytes, Path]) -> List[str]:
+        """Extract user stories from BRD content.
+
+        All story formats are matched in a single pass, so stories are
+        returned in document order and a line is only reported once (a
+        "User Story:" line is not also reported as a "Story:" line).
+
+        :param brd_content: BRD text, its raw UTF-8 bytes, or a path to the
+            document. A path is memory-mapped and scanned in place so only
+            the matched spans are decoded.
+        :return: The user stories found.
+        """
+        if isinstance(brd_content, Path):
+            with open(brd_content, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._match_user_stories(_STORY_BYTES_RE, mm)
+        if isinstance(brd_content, (bytes, bytearray)):
+            return self._match_user_stories(_STORY_BYTES_RE, brd_content)
+        return self._match_user_stories(_STORY_RE, brd_content)
+
+    @staticmethod
+    def _match_user_stories(pattern: re.Pattern, content: Any) -> List[str]:
+        stories = []
+        for match in pattern.finditer(content):
+            if match.group("role") is not None:
+                parts = match.group("role", "goal", "benefit")
+            else:
+                parts = (match.group("user_story") or match.group("story") or match.group("requirement"),)
+            if isinstance(parts[0], bytes):
+                parts = [part.decode("utf-8", errors="replace") for part in parts]
+            stories.append(" ".join(parts))
         return stories
 
     def _generate_positive_test_steps(self, user_story: str) -> List[Dict[str, Any]]:
         """Generate positive test steps from user story."""
         if not self.active_provider:
-            return [{"action": "click", "target": "element", "expected": "success"}]
-        
-        messages = [
-            {
-                "role": "system",
-                "content": "Generate positive test steps for this user story. Return JSON array of steps."
-            },
-            {"role": "user", "content": user_story}
-        ]
-        
-        response = self._call_llm(messages)
-        if response:
-            try:
-                return json.loads(response)
-            except json.JSONDecodeError:
-                pass
+            return self._parse_story_steps(None, "positive")
         
-        return [{"action": "click", "target": "element", "expected": "success"}]
+        response = self._call_llm(self._story_steps_messages(user_story, "positive"))
+        return self._parse_story_steps(response, "positive")
 
     def _generate_negative_test_steps(self, user_story: str) -> List[Dict[str, Any]]:
         """Generate negative test steps from user story."""
         if not self.active_provider:
-            return [{"action": "click", "target": "invalid_element", "expected": "error"}]
+            return self._parse_story_steps(None, "negative")
         
-        messages = [
+        response = self._call_llm(self._story_steps_messages(user_story, "negative"))
+        return self._parse_story_steps(response, "negative")
+
+    def _story_steps_messages(self, user_story: str, kind: str) -> List[Dict[str, str]]:
+        """Build the prompt asking for ``kind`` (positive/negative) steps."""
+        return [
             {
                 "role": "system",
-                "content": "Generate negative test steps for this user story. Return JSON array of steps."
+                "content": _STORY_STEPS_PROMPTS[kind]
             },
             {"role": "user", "content": user_story}
         ]
-        
-        response = self._call_llm(messages)
+
+    def _parse_story_steps(self, response: Optional[str], kind: str) -> List[Dict[str, Any]]:
+        """Decode generated steps, falling back to a single placeholder step."""
         if response:
             try:
-                return json.loads(response)
+                return _parse_llm_json(response)
             except json.JSONDecodeError:
                 pass
         
+        if kind == "positive":
+            return [{"action": "click", "target": "element", "expected": "success"}]
         return [{"action": "click", "target": "invalid_element", "expected": "error"}]
 
     def generate_test_cases_from_swagger(self, swagger_content: str, max_cases: int = 10) -> List[TestCase]:
         """Generate API test cases from Swagger/OpenAPI specification."""
         # Extract endpoints from Swagger
-        endpoints = self._extract_endpoints_from_swagger(swagger_content)
+        endpoints = self._extract_endpoints_from_swagger(swagger_content, limit=max_cases)
         
         test_cases = []
-        for endpoint in endpoints[:max_cases]:
+        for endpoint in endpoints:
             # Generate positive test case
             positive_steps = self._generate_api_test_steps(endpoint, "positive")
             test_case = TestCase(
@@ -832,50 +1637,59 @@ class LLMAgent:
         
         return test_cases
 
-    def _extract_endpoints_from_swagger(self, swagger_content: str) -> List[Dict[str, Any]]:
-        """Extract endpoints from Swagger/OpenAPI content."""
-        import re
+    def _extract_endpoints_from_swagger(self, swagger_content: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Extract endpoints from Swagger/OpenAPI content.
+
+        Walks ``paths.<path>.<method>`` and emits one endpoint per
+        operation.  JSON specs are streamed with ijson when it is
+        installed, so parsing stops once ``limit`` endpoints are found;
+        anything else is loaded as YAML.
+
+        :param swagger_content: The JSON or YAML specification text.
+        :param limit: Stop after this many endpoints.
+        :return: Endpoint dicts with ``path``, ``method`` and ``summary``.
+        """
         endpoints = []
-        
-        # Simple pattern matching - can be enhanced with proper JSON parsing
-        path_pattern = r'"([^"]+)"\s*:\s*{'
-        method_pattern = r'"(get|post|put|delete|patch)"\s*:\s*{'
-        
-        paths = re.findall(path_pattern, swagger_content, re.IGNORECASE)
-        methods = re.findall(method_pattern, swagger_content, re.IGNORECASE)
-        
-        for path in paths:
-            for method in methods:
-                endpoints.append({
-                    "path": path,
-                    "method": method.upper(),
-                    "summary": f"{method.upper()} {path}"
-                })
-        
+        try:
+            for path, path_item in self._iter_swagger_paths(swagger_content):
+                if not isinstance(path_item, dict):
+                    continue
+                for method, operation in path_item.items():
+                    if method.lower() not in _SWAGGER_METHODS:
+                        continue
+                    summary = operation.get("summary") if isinstance(operation, dict) else None
+                    endpoints.append({
+                        "path": path,
+                        "method": method.upper(),
+                        "summary": summary or f"{method.upper()} {path}"
+                    })
+                    if limit is not None and len(endpoints) >= limit:
+                        return endpoints
+        except _SWAGGER_PARSE_ERRORS as exc:
+            logger.warning(f"Failed to parse Swagger specification: {exc}")
         return endpoints
 
+    @staticmethod
+    def _iter_swagger_paths(swagger_content: str) -> Any:
+        """Yield ``(path, path_item)`` pairs from a JSON or YAML spec."""
+        if swagger_content.lstrip()[:1] in ("{", "["):
+            if _ijson_available:
+                return ijson.kvitems(io.BytesIO(swagger_content.encode("utf-8")), "paths")
+            spec = _json_loads(swagger_content)
+        else:
+            spec = yaml.load(swagger_content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        paths = spec.get("paths") if isinstance(spec, dict) else None
+        return paths.items() if isinstance(paths, dict) else ()
+
     def _generate_api_test_steps(self, endpoint: Dict[str, Any], test_type: str) -> List[Dict[str, Any]]:
         """Generate API test steps for endpoint."""
+        method = endpoint['method']
+        path = endpoint['path']
+        target = f"{method} {path}"
+        data = {"method": method, "url": f"{{base_url}}{path}", "headers": dict(_JSON_HEADERS)}
         if test_type == "positive":
-            return [{
-                "action": "api_request",
-                "target": f"{endpoint['method']} {endpoint['path']}",
-                "data": {
-                    "method": endpoint['method'],
-                    "url": f"{{base_url}}{endpoint['path']}",
-                    "headers": {"Content-Type": "application/json"}
-                },
-                "expected": f"Response with status 200/201 for {endpoint['method']} {endpoint['path']}"
-            }]
+            expected = f"Response with status 200/201 for {target}"
         else:
-            return [{
-                "action": "api_request",
-                "target": f"{endpoint['method']} {endpoint['path']}",
-                "data": {
-                    "method": endpoint['method'],
-                    "url": f"{{base_url}}{endpoint['path']}",
-                    "headers": {"Content-Type": "application/json"},
-                    "body": "invalid_data"
-                },
-                "expected": f"Response with status 400/500 for {endpoint['method']} {endpoint['path']}"
-            }]
\ No newline at end of file
+            data["body"] = "invalid_data"
+            expected = f"Response with status 400/500 for {target}"
+        return [{"action": "api_request", "target": target, "data": data, "expected": expected}]
\ No newline at end of file
@@ -9,47 +9,118 @@ optional arguments for the user story name and author.  See
 """
 
 import argparse
+import hashlib
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, List, Tuple
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+    _pyarrow_available = True
+except ImportError:
+    _pyarrow_available = False
 
 from src.automation_framework.config import Config
 from src.automation_framework.mcp_router import MCPRouter, TestCase
 from src.automation_framework.versioning.version_manager import VersionManager
 from src.automation_framework.reporting.reporter import Reporter
+from src.automation_framework.utils.brd_utils import BRD_COLUMNS, frame_to_cases, read_brd_excel
+
+# Bump whenever _read_csv or BRD_COLUMNS change what a cached frame holds
+_BRD_CACHE_VERSION = "1"
 
 
-def read_brd(file_path: str) -> List[Dict[str, any]]:
+def read_brd(file_path: str, cache_dir: "str | None" = None) -> List[Dict[str, any]]:
     """Read an Excel or CSV file containing test cases.  Expected columns:
 
     * identifier – unique id of the test case
     * description – natural language description of the test
     * type – optional (ui, api, mobile, sql)
     * steps – JSON string representing a list of step dictionaries
+
+    When ``cache_dir`` is given, parsed CSV files are kept there as
+    Parquet so an unchanged file is not parsed again.
     """
     path = Path(file_path)
     if path.suffix.lower() in (".xlsx", ".xls"):
-        df = pd.read_excel(path)
+        df = read_brd_excel(path)
     else:
-        df = pd.read_csv(path)
-    test_cases: List[Dict[str, any]] = []
-    for _, row in df.iterrows():
-        steps = row.get("steps")
-        if isinstance(steps, str):
-            try:
-                import json
-                parsed = json.loads(steps)
-            except Exception:
-                parsed = []
-        else:
-            parsed = steps if isinstance(steps, list) else []
-        test_cases.append({
-            "identifier": str(row.get("identifier")),
-            "description": row.get("description"),
-            "type": row.get("type"),
-            "steps": parsed,
-        })
-    return test_cases
+        df = _load_cached_frame(path, cache_dir) if cache_dir else None
+        if df is None:
+            df = _read_csv(path)
+            if cache_dir:
+                _store_cached_frame(path, df, cache_dir)
+    return frame_to_cases(df)
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    """Read a BRD CSV, with Arrow's multithreaded parser when available.
+
+    Only the BRD columns are converted.  Identifiers are read as strings
+    so values such as ``007`` keep their leading zeros.
+    """
+    if not _pyarrow_available:
+        return pd.read_csv(path, dtype={"identifier": str})
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(
+            column_types={"identifier": pa.string()},
+            include_columns=list(BRD_COLUMNS),
+            include_missing_columns=True,
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas()
+
+
+def _cache_entry(path: Path, cache_dir: str) -> Tuple[Path, Dict[bytes, bytes]]:
+    """Return the Parquet location for ``path`` and the metadata it must carry.
+
+    The file is named after the source path; its size, modification time
+    and the cache version are stored in the Parquet metadata, so an edited
+    file replaces its entry instead of accumulating new ones.
+    """
+    resolved = str(path.resolve())
+    stat = path.stat()
+    name = hashlib.blake2b(resolved.encode("utf-8"), digest_size=16).hexdigest() + ".parquet"
+    key = {
+        b"brd_source": resolved.encode("utf-8"),
+        b"brd_size": str(stat.st_size).encode(),
+        b"brd_mtime_ns": str(stat.st_mtime_ns).encode(),
+        b"brd_cache_version": _BRD_CACHE_VERSION.encode(),
+    }
+    return Path(cache_dir).expanduser() / name, key
+
+
+def _load_cached_frame(path: Path, cache_dir: str) -> "pd.DataFrame | None":
+    """Return the cached frame of a BRD CSV if the file is unchanged since."""
+    if not _pyarrow_available:
+        return None
+    try:
+        cache, key = _cache_entry(path, cache_dir)
+        metadata = pq.read_schema(cache).metadata or {}
+        if any(metadata.get(name) != value for name, value in key.items()):
+            return None
+        return pq.read_table(cache).to_pandas()
+    except (OSError, ValueError, pa.ArrowException):
+        return None
+
+
+def _store_cached_frame(path: Path, df: "pd.DataFrame", cache_dir: str) -> None:
+    """Save a Parquet copy of a parsed BRD CSV so re-running it skips parsing."""
+    if not _pyarrow_available:
+        return
+    try:
+        cache, key = _cache_entry(path, cache_dir)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **key})
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, cache)
+    except (OSError, ValueError, TypeError, pa.ArrowException):
+        # Unwritable cache dir or a column Arrow cannot type; just re-parse next time
+        pass
 
 
 def main() -> None:
@@ -57,6 +128,11 @@ def main() -> None:
     parser.add_argument("file", help="Path to BRD/test file (Excel or CSV)")
     parser.add_argument("user_story", help="Name of the user story or BRD")
     parser.add_argument("--author", default="anonymous", help="Author uploading the test set")
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Keep parsed CSV files here as Parquet (requires pyarrow); off by default",
+    )
     args = parser.parse_args()
     # Load configuration and helper classes
     config = Config()
@@ -64,7 +140,7 @@ def main() -> None:
     reporter = Reporter(config)
     router = MCPRouter(config, reporter)
     # Read test cases from file
-    test_cases_data = read_brd(args.file)
+    test_cases_data = read_brd(args.file, cache_dir=args.cache_dir)
     # Add version to store test cases with metadata
     metadata = version_manager.add_version(args.user_story, test_cases_data, args.author)
     print(f"Added version {metadata['version_number']} (similarity {metadata['similarity']*100:.0f}%);")
@@ -13,14 +13,17 @@ framework to run in environments without mobile capabilities.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..utils import wait_utils
 from ..utils.locator_repository import LocatorRepository
 from ..utils.db_utils import Database
+from ..utils.time_utils import iso_timestamp as _iso
 from ..llm_integration.llm_agent import LLMAgent
 
 try:
@@ -52,27 +55,41 @@ class _DummyMobileDriver:
 class MobileDriver:
     """Execute mobile test cases using Appium with self‑healing support."""
 
+    # Idle Appium sessions kept between test cases, keyed by server URL and
+    # capabilities.  A driver takes a session out while running a case, so
+    # two drivers never share one concurrently.
+    _session_pool: Dict[Tuple[str, str], Any] = {}
+    _session_pool_lock = threading.Lock()
+
     def __init__(self, config: Any, db: Database) -> None:
         self.config = config
         self.db = db
         self.llm = LLMAgent(config)
         self.loc_repo = LocatorRepository(config)
         self.driver: Optional[Any] = None
+        # Locators resolved for the current run, keyed by step key; None
+        # records a key known to have no stored locator
+        self._locator_cache: Dict[str, Optional[Dict[str, Any]]] = {}
         # Connection details
+        mobile_config = config.get("mobile", {})
+        if not isinstance(mobile_config, dict):
+            mobile_config = {}
         try:
-            host = config.get("mobile", {}).get("host", "localhost")  # type: ignore[assignment]
-            port = int(config.get("mobile", {}).get("port", 4723))  # type: ignore[assignment]
-            self.remote_url = f"http://{host}:{port}/wd/hub"
-        except Exception:
-            self.remote_url = "http://localhost:4723/wd/hub"
-        try:
-            self.desired_caps = config.get("mobile", {}).get("desired_capabilities", {})  # type: ignore[assignment]
-        except Exception:
-            self.desired_caps = {}
+            port = int(mobile_config.get("port", 4723))
+        except (TypeError, ValueError):
+            port = 4723
+        self.remote_url = f"http://{mobile_config.get('host', 'localhost')}:{port}/wd/hub"
+        self.desired_caps = mobile_config.get("desired_capabilities", {})
+        self.reuse_session = bool(mobile_config.get("reuse_session", True))
 
     def _ensure_driver(self) -> None:
         if self.driver is not None:
             return
+        if self.reuse_session:
+            with MobileDriver._session_pool_lock:
+                self.driver = MobileDriver._session_pool.pop(self._session_key(), None)
+            if self.driver is not None:
+                return
         if _appium_available:
             try:
                 self.driver = appium_webdriver.Remote(command_executor=self.remote_url, desired_capabilities=self.desired_caps)
@@ -90,6 +107,58 @@ class MobileDriver:
                 pass
             self.driver = None
 
+    def _session_key(self) -> Tuple[str, str]:
+        return self.remote_url, json.dumps(self.desired_caps, sort_keys=True, default=str)
+
+    def _release_driver(self) -> None:
+        """Return the session to the pool with the app reset, or quit it.
+
+        Only live Appium sessions are pooled; a session whose app cannot
+        be restarted (including when no appPackage/bundleId is set) is
+        quit so the next case starts from a clean state.
+        """
+        driver = self.driver
+        if not self.reuse_session or driver is None or isinstance(driver, _DummyMobileDriver):
+            self.quit()
+            return
+        app_id = self.desired_caps.get("appPackage") or self.desired_caps.get("bundleId")
+        if not app_id:
+            # Without an app id the app cannot be reset, so a pooled
+            # session would leak this case's state into the next one
+            self.quit()
+            return
+        try:
+            driver.terminate_app(app_id)
+            driver.activate_app(app_id)
+        except Exception as exc:
+            logging.getLogger(__name__).warning("Could not reset app %s, ending session: %s", app_id, exc)
+            self.quit()
+            return
+        key = self._session_key()
+        with MobileDriver._session_pool_lock:
+            pooled = key not in MobileDriver._session_pool
+            if pooled:
+                MobileDriver._session_pool[key] = driver
+        self.driver = None
+        if not pooled:
+            # Another driver already parked a session for these capabilities
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    @classmethod
+    def close_sessions(cls) -> None:
+        """Quit every pooled Appium session."""
+        with cls._session_pool_lock:
+            drivers = list(cls._session_pool.values())
+            cls._session_pool.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
     def run_test_case(self, case: Dict[str, Any]) -> int:
         """Execute a mobile test case and record results.
 
@@ -100,6 +169,7 @@ class MobileDriver:
         ``failed`` or ``partial``).
         """
         self._ensure_driver()
+        driver = self.driver
         # Insert case if necessary
         test_case_id = case.get("id")
         if not test_case_id:
@@ -115,20 +185,23 @@ class MobileDriver:
         failed_steps = 0
         skipped_steps = 0
         error_message: Optional[str] = None
+        # Step results are buffered and written together with the final
+        # run update so the whole run costs a single commit.
+        pending_steps: List[Tuple[int, str, Optional[str], str, str]] = []
+        # Outcome of each step so far, consulted for ``depends_on``
+        step_statuses: Dict[int, str] = {}
         steps = case.get("steps", []) or []
-        for idx, step in enumerate(steps):
+        step_keys = self._prefetch_locators(steps)
+        for idx, (step, step_key) in enumerate(zip(steps, step_keys)):
             step_start = time.time()
             status = "passed"
             message: Optional[str] = None
             try:
                 # Honour dependent steps: skip if dependency failed or skipped
                 dep = step.get("depends_on")
-                if dep is not None and isinstance(dep, int):
-                    prev_results = self.db.get_run_steps(run_id) if run_id else []
-                    for r in prev_results:
-                        if r.get("step_index") == dep and r.get("status") in {"failed", "skipped"}:
-                            raise ValueError(f"Step depends_on {dep} which did not pass")
-                self._execute_step(step)
+                if isinstance(dep, int) and step_statuses.get(dep) in {"failed", "skipped"}:
+                    raise ValueError(f"Step depends_on {dep} which did not pass")
+                self._execute_step(step, step_key, driver)
             except ValueError as ve:
                 status = "skipped"
                 message = str(ve)
@@ -141,7 +214,8 @@ class MobileDriver:
             else:
                 passed_steps += 1
             step_end = time.time()
-            self.db.add_run_step(run_id, idx, status, message, _iso(step_start), _iso(step_end))
+            step_statuses[idx] = status
+            pending_steps.append((idx, status, message, _iso(step_start), _iso(step_end)))
         end_time = time.time()
         executed = passed_steps + failed_steps
         if executed == 0 and skipped_steps > 0:
@@ -152,46 +226,78 @@ class MobileDriver:
             overall_status = "failed"
         else:
             overall_status = "partial"
-        # Update run record
-        self.db.conn.cursor().execute(
-            """
-            UPDATE test_runs
-            SET status = ?, ended_at = ?, error_message = ?
-            WHERE id = ?
-            """,
-            (overall_status, _iso(end_time), error_message, run_id),
-        )
-        self.db.conn.commit()
-        # Quit driver after run
-        self.quit()
+        # Flush step results and update the run record in one transaction
+        self.db.finish_test_run(run_id, overall_status, _iso(end_time), error_message, pending_steps)
+        # Keep the session for the next case when reuse is enabled
+        self._release_driver()
         return run_id
 
-    def _execute_step(self, step: Dict[str, Any]) -> None:
-        """Execute a single mobile step."""
+    def _prefetch_locators(self, steps: List[Dict[str, Any]]) -> List[str]:
+        """Resolve the stored locators for a case up front.
+
+        Every step key is looked up with one query and kept in
+        ``_locator_cache`` for the run, so steps and their retries do not
+        query the repository again.  Steps with neither an inline nor a
+        stored locator have suggestions requested from the LLM
+        concurrently and stored together.
+
+        :returns: The step keys, aligned with ``steps``.
+        """
+        step_keys = [LocatorRepository.compute_step_key(step) for step in steps]
+        stored = self.loc_repo.get_locators("mobile", step_keys)
+        self._locator_cache = {step_key: stored.get(step_key) for step_key in step_keys}
+        pending: Dict[str, str] = {}
+        for step, step_key in zip(steps, step_keys):
+            if not step.get("locator") and step_key not in pending and not self._locator_cache[step_key]:
+                pending[step_key] = LLMAgent.describe_step(step)
+        if len(pending) < 2:
+            # A single lookup gains nothing from batching; _execute_step handles it
+            return step_keys
+        suggestions = self.llm.suggest_ui_locators(list(pending.values()))
+        suggested = {
+            step_key: {"type": "accessibility_id", "value": suggestion}
+            for step_key, suggestion in zip(pending, suggestions)
+            if suggestion
+        }
+        self.loc_repo.add_locators("mobile", suggested)
+        self._locator_cache.update(suggested)
+        return step_keys
+
+    def _execute_step(
+        self, step: Dict[str, Any], step_key: Optional[str] = None, driver: Any = None
+    ) -> None:
+        """Execute a single mobile step.
+
+        :param step_key: The step's precomputed locator key, if known.
+        :param driver: The session resolved once by ``run_test_case``; when
+            omitted the driver is started on demand.
+        """
         action = step.get("action")
         if not action:
             raise ValueError("Step missing 'action'")
-        self._ensure_driver()
-        driver = self.driver
+        if driver is None:
+            self._ensure_driver()
+            driver = self.driver
         if not driver:
             raise RuntimeError("Driver not initialised")
         # Determine locator
         locator = step.get("locator")
-        step_key = LocatorRepository.compute_step_key(step)
-        stored = self.loc_repo.get_locator("mobile", step_key)
+        if step_key is None:
+            step_key = LocatorRepository.compute_step_key(step)
+        if step_key in self._locator_cache:
+            stored = self._locator_cache[step_key]
+        else:
+            stored = self.loc_repo.get_locator("mobile", step_key)
         if stored:
             locator = stored
         if not locator:
             # Use LLM to suggest a locator based on description
-            try:
-                description = json.dumps(step, ensure_ascii=False)
-            except Exception:
-                description = str(step)
-            suggestion = self.llm.suggest_ui_locator(description)
+            suggestion = self.llm.suggest_ui_locator(LLMAgent.describe_step(step))
             if suggestion:
                 # Assume suggestion is an accessibility id or id; treat as accessibility id
                 locator = {"type": "accessibility_id", "value": suggestion}
                 self.loc_repo.add_locator("mobile", step_key, locator)
+                self._locator_cache[step_key] = locator
         # Wait for element if required; if no locator and the action
         # requires one, raise a ValueError to mark the step as skipped.
         if locator:
@@ -217,6 +323,9 @@ class MobileDriver:
             raise ValueError(f"Unsupported action: {action}")
 
 
+atexit.register(MobileDriver.close_sessions)
+
+
 def _find_element(driver: Any, locator: Optional[Dict[str, str]]) -> Any:
     """Helper to find a mobile element based on a locator dict."""
     if not locator:
@@ -231,8 +340,4 @@ def _find_element(driver: Any, locator: Optional[Dict[str, str]]) -> Any:
     return _DummyMobileElement()
 
 
-def _iso(ts: float) -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts))
-
-
 __all__ = ["MobileDriver"]
\ No newline at end of file
@@ -9,36 +9,18 @@ Run it after installing dependencies to verify that the framework is
 functioning correctly.
 """
 
-import json
 from pathlib import Path
 
 from src.automation_framework.config import Config
 from src.automation_framework.mcp_router import MCPRouter, TestCase
 from src.automation_framework.versioning.version_manager import VersionManager
 from src.automation_framework.reporting.reporter import Reporter
+from src.automation_framework.utils.brd_utils import frame_to_cases, read_brd_excel
 
 
 def load_sample_cases() -> list[dict[str, any]]:
     sample_file = Path(__file__).parent / "tests" / "sample_brd.xlsx"
-    import pandas as pd
-    df = pd.read_excel(sample_file)
-    cases = []
-    for _, row in df.iterrows():
-        steps = row.get("steps")
-        if isinstance(steps, str):
-            try:
-                parsed = json.loads(steps)
-            except Exception:
-                parsed = []
-        else:
-            parsed = steps if isinstance(steps, list) else []
-        cases.append({
-            "identifier": row.get("identifier"),
-            "description": row.get("description"),
-            "type": row.get("type"),
-            "steps": parsed,
-        })
-    return cases
+    return frame_to_cases(read_brd_excel(sample_file))
 
 
 def run_self_test() -> None:
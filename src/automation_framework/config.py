@@ -28,6 +28,10 @@ except ImportError:
 from .utils.logger import get_logger
 
 
+# Marks a dotted key absent from the YAML data in Config's lookup cache
+_MISSING = object()
+
+
 class Config:
     """Load YAML and environment based configuration values."""
 
@@ -43,6 +47,7 @@ class Config:
         self.yaml_path = Path(yaml_path)
 
         self.data: dict[str, Any] = {}
+        self._resolved: dict[str, Any] = {}
         if self.yaml_path.exists():
             try:
                 with open(self.yaml_path, "r", encoding="utf-8") as f:
@@ -63,14 +68,20 @@ class Config:
         env_val = os.getenv(env_key)
         if env_val is not None:
             return env_val
-        # Walk through nested dicts using dotted notation
-        current: Any = self.data
-        for part in dotted_key.split("."):
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return default
-        return current
+        # Walk through nested dicts using dotted notation; the YAML data is
+        # fixed after loading, so each key's result is memoised
+        try:
+            current = self._resolved[dotted_key]
+        except KeyError:
+            current = self.data
+            for part in dotted_key.split("."):
+                if isinstance(current, dict) and part in current:
+                    current = current[part]
+                else:
+                    current = _MISSING
+                    break
+            self._resolved[dotted_key] = current
+        return default if current is _MISSING else current
 
     def require(self, dotted_key: str) -> Any:
         """Retrieve a configuration value or log an error if missing."""
@@ -8,12 +8,22 @@ parses natural‑language or JSON commands into HTTP requests using
 response status code and JSON body can be asserted via simple rules.
 """
 
+import copy
+import dataclasses
+import json
+from functools import lru_cache
 from typing import Any, Dict
 
 import requests
 
+try:
+    import orjson  # type: ignore
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
 from .mcp_base import MCPBase
-from ..utils.natural_language_api import execute_request
+from ..utils.natural_language_api import APIRequest, execute_request, parse_api_command
 try:
     # LLM client may not be available at import time (circular import)
     from ..utils.llm_client import LLMClient  # type: ignore
@@ -21,6 +31,24 @@ except Exception:
     LLMClient = None  # type: ignore
 
 
+# Retries and repeated steps reuse the parse
+_cached_parse = lru_cache(maxsize=512)(parse_api_command)
+
+
+def _parse_api_command(command: str, base_url: str) -> APIRequest:
+    """Return a memoised parse with its own copies of headers and body.
+
+    The cached APIRequest is shared across threads, so callers get fresh
+    containers and can never mutate the cached entry.
+    """
+    cached = _cached_parse(command, base_url)
+    return dataclasses.replace(
+        cached,
+        headers=dict(cached.headers) if cached.headers is not None else None,
+        body=copy.deepcopy(cached.body),
+    )
+
+
 class APIMCP(MCPBase):
     """MCP implementation for REST API interactions.
 
@@ -48,7 +76,6 @@ class APIMCP(MCPBase):
             raise ValueError("API step missing 'command'")
         base_url = self.config.get("api.base_url", "")
         # Use LLM translation if available
-        from ..utils.natural_language_api import parse_api_command
         if self.llm and hasattr(self.llm, "translate_api"):
             try:
                 translation = self.llm.translate_api(command, base_url)
@@ -57,19 +84,14 @@ class APIMCP(MCPBase):
         else:
             translation = None
         if translation is None:
-            req_obj = parse_api_command(command, base_url)
-            translation = type("Tmp", (), {})()
-            translation.method = req_obj.method
-            translation.url = req_obj.url
-            translation.headers = req_obj.headers
-            translation.body = req_obj.body
-            translation.expected_status = req_obj.expected_status
+            # The parsed APIRequest already has every field execute_request reads
+            translation = _parse_api_command(command, base_url)
         expected_status = int(step.get("expected_status", translation.expected_status))
         # Execute the request
         try:
             resp = execute_request(translation)
             self.reporter.attach_text(
-                f"{translation.method} {translation.url}\nHeaders: {translation.headers}\nBody: {translation.body}",
+                f"{translation.method} {translation.url}\nHeaders: {_format_payload(translation.headers)}\nBody: {_format_payload(translation.body)}",
                 name="api_request",
             )
             self.reporter.attach_text(
@@ -88,4 +110,16 @@ class APIMCP(MCPBase):
         except Exception as exc:
             # Attach error and re-raise to trigger retry or alerting
             self.reporter.attach_text(f"API step error: {exc}", name="api_error")
-            raise
\ No newline at end of file
+            raise
+
+
+def _format_payload(value: Any) -> str:
+    """Render headers or a body for an Allure attachment as JSON where possible."""
+    if isinstance(value, (dict, list)):
+        try:
+            if _orjson_available:
+                return orjson.dumps(value).decode("utf-8")
+            return json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            pass
+    return str(value)
\ No newline at end of file
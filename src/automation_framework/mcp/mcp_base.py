@@ -11,11 +11,15 @@ domain‑specific actions (UI, API, Mobile, SQL).  Each step is a
 dictionary describing the action and any inputs.
 """
 
+import random
 import time
 from typing import Any, Dict, List
 
 from ..utils.logger import get_logger
 
+# Upper bound in seconds for a single backoff wait between step retries
+_MAX_RETRY_DELAY = 30
+
 
 class MCPBase:
     """Base class for all MCPs providing retry and logging behaviour."""
@@ -67,7 +71,17 @@ class MCPBase:
                     if attempt >= self.max_retries:
                         self.logger.error("Step %s failed after %s attempts", idx + 1, attempt)
                         raise
-                    time.sleep(self.retry_interval)
+                    time.sleep(self._retry_delay(attempt))
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Return the wait before retrying after failed attempt ``attempt``.
+
+        The configured interval doubles with each attempt, is capped at
+        ``_MAX_RETRY_DELAY`` and is jittered so that concurrent MCPs do
+        not retry in lockstep.
+        """
+        delay = min(self.retry_interval * (2 ** (attempt - 1)), _MAX_RETRY_DELAY)
+        return delay * random.uniform(0.5, 1.0)
 
     def _execute_step(self, step: Dict[str, Any]) -> None:
         """Execute a single step.  Must be implemented by subclasses."""
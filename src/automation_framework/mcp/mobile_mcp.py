@@ -11,7 +11,14 @@ elements, sending text and swiping.  When an action fails the
 framework retries and captures a screenshot for the Allure report.
 """
 
-from typing import Any, Dict, Tuple
+import hashlib
+import io
+import queue
+import re
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     from appium import webdriver  # type: ignore
@@ -35,18 +42,119 @@ except ImportError:
         def quit(self):
             pass
 
+try:
+    from PIL import Image  # type: ignore
+    _pillow_available = True
+except ImportError:
+    _pillow_available = False
+
 from .mcp_base import MCPBase
 from ..utils.locator_repo import LocatorRepo
 from ..utils import wait_utils
 
 
+# Appium strategies for each supported locator type; raw locators name
+# their type as the key, checked in this order
+_BY_MAP = {
+    "id": "id",
+    "accessibility_id": "accessibility id",
+    "xpath": "xpath",
+    "class_chain": "-ios class chain",
+    "android_uiautomator": "-android uiautomator",
+}
+_LOC_KEYS = tuple(_BY_MAP)
+
+# Candidate locator types each platform can merge into one native query
+_MERGEABLE_TYPES = {
+    "android": frozenset({"id", "accessibility_id", "android_uiautomator"}),
+    "ios": frozenset({"id", "accessibility_id"}),
+}
+
+# Elements kept per MobileMCP for reuse by later steps with the same locator
+_ELEMENT_CACHE_SIZE = 128
+
+
+def _quote(value: str) -> str:
+    """Quote a string literal for a UiSelector or iOS predicate."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _compose_compound_locator(candidates: List[Dict[str, str]], platform: str) -> Optional[Tuple[str, str]]:
+    """Merge candidate locators into one native query matching any of them.
+
+    Android candidates become ``;``-separated UiAutomator selectors and
+    iOS candidates an ``OR`` predicate.  Short Android ids (without the
+    ``<package>:id/`` prefix that Appium's ``id`` strategy adds) are
+    matched on the resource id suffix.  Returns ``(by, value)``, or None
+    when fewer than two candidates can be expressed natively.
+    """
+    mergeable = _MERGEABLE_TYPES.get(platform)
+    if mergeable is None:
+        return None
+    parts: List[str] = []
+    for cand in candidates:
+        loc_type, value = cand["type"], str(cand["value"])
+        if loc_type not in mergeable:
+            continue
+        if platform == "ios":
+            parts.append(f"name == {_quote(value)}")
+        elif loc_type == "id" and ":id/" in value:
+            parts.append(f"new UiSelector().resourceId({_quote(value)})")
+        elif loc_type == "id":
+            parts.append(f"new UiSelector().resourceIdMatches({_quote('.*:id/' + re.escape(value) + '$')})")
+        elif loc_type == "accessibility_id":
+            parts.append(f"new UiSelector().description({_quote(value)})")
+        else:
+            parts.append(value.rstrip(";"))
+    if platform == "ios":
+        by, separator = "-ios predicate string", " OR "
+    else:
+        by, separator = "-android uiautomator", "; "
+    if len(parts) < 2:
+        return None
+    return by, separator.join(parts)
+
+
+def _compress_screenshot(png: bytes) -> Tuple[bytes, str]:
+    """Re-encode a PNG screenshot as JPEG for the report when Pillow is available.
+
+    Full-resolution device screenshots are several megabytes as PNG and
+    a fraction of that as JPEG.  Returns the bytes and their extension;
+    the PNG is returned unchanged if it cannot be re-encoded.
+    """
+    if not _pillow_available:
+        return png, "png"
+    try:
+        with Image.open(io.BytesIO(png)) as image:
+            buf = io.BytesIO()
+            image.convert("RGB").save(buf, "JPEG", quality=80, optimize=True)
+    except Exception:
+        return png, "png"
+    return buf.getvalue(), "jpg"
+
+
 class MobileMCP(MCPBase):
     """Appium‑based MCP for mobile automation."""
 
-    def __init__(self, config, reporter) -> None:
+    def __init__(self, config, reporter, device: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(config, reporter)
+        # Per-device capability overrides (deviceName, udid, systemPort,
+        # ...) and optionally its own ``server_url``; see MobileMCPPool
+        self.device = device or {}
+        # Digest of the last self-heal screenshot attached, so identical
+        # consecutive captures across retries are attached only once
+        self._last_shot_hash: Optional[bytes] = None
+        # Elements found by earlier steps, keyed by (locator type, value) in
+        # LRU order; reused while the server still reports them displayed
+        self._element_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        # The step most recently keyed for the locator repository and its key
+        self._keyed_step: Optional[Dict[str, Any]] = None
+        self._keyed_step_key: Optional[str] = None
         self.driver: webdriver.Remote | None = None
         self._connect()
+        # Locator writes run on one background thread so the SQLite commit
+        # overlaps the next Appium round trip instead of blocking the step
+        self._persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mobile-locators")
         # Initialise locator repository
         try:
             self.locator_repo = LocatorRepo(config)
@@ -63,7 +171,12 @@ class MobileMCP(MCPBase):
                 "app": self.config.get("mobile.app_path"),
                 "autoGrantPermissions": True,
             }
-            server_url = self.config.get("mobile.server_url", "http://localhost:4723/wd/hub")
+            if str(options["platformName"]).lower() == "ios":
+                # Let WebDriverAgent hand out element UUIDs it can resolve
+                # again cheaply, so cached elements stay usable
+                options["useNativeCachingStrategy"] = False
+            options.update({key: value for key, value in self.device.items() if key != "server_url"})
+            server_url = self.device.get("server_url") or self.config.get("mobile.server_url", "http://localhost:4723/wd/hub")
             try:
                 self.driver = webdriver.Remote(server_url, options)
             except Exception:
@@ -75,34 +188,116 @@ class MobileMCP(MCPBase):
 
     def _find_element(self, locator: Dict[str, Any]):
         """Locate an element using a locator dictionary."""
-        loc_type = None
-        loc_value = None
         # Accept both repository style ({type:..., value:...}) and raw locators
         if "type" in locator and "value" in locator:
             loc_type = locator["type"]
             loc_value = locator["value"]
         else:
-            # Determine type based on keys
-            for key in ("id", "accessibility_id", "xpath", "class_chain", "android_uiautomator"):
-                if key in locator:
-                    loc_type = key
-                    loc_value = locator[key]
-                    break
+            loc_type = next((key for key in _LOC_KEYS if key in locator), None)
+            loc_value = locator[loc_type] if loc_type else None
         if not loc_type or not loc_value:
             raise ValueError(f"Unsupported locator: {locator}")
-        by_map = {
-            "id": "id",
-            "accessibility_id": "accessibility id",
-            "xpath": "xpath",
-            "class_chain": "-ios class chain",
-            "android_uiautomator": "-android uiautomator",
-        }
-        by = by_map.get(loc_type)
+        by = _BY_MAP.get(loc_type)
         if not by:
             raise ValueError(f"Unsupported locator type: {loc_type}")
         return self.driver.find_element(by=by, value=loc_value)
 
+    def _cached_element(self, cand: Dict[str, str]) -> Any:
+        """Return the cached element for a candidate if it is still usable.
+
+        The element must still be displayed and enabled.  Stale, hidden
+        or disabled elements are evicted and None is returned, in which
+        case the caller resolves the locator again.
+        """
+        key = (cand["type"], str(cand["value"]))
+        element = self._element_cache.get(key)
+        if element is None:
+            return None
+        try:
+            if element.is_displayed() and element.is_enabled():
+                self._element_cache.move_to_end(key)
+                return element
+        except Exception as exc:
+            self.logger.debug("Cached mobile element %s is stale: %s", key, exc)
+        del self._element_cache[key]
+        return None
+
+    def _remember_element(self, cand: Dict[str, str], element: Any) -> None:
+        if not (hasattr(element, "is_displayed") and hasattr(element, "is_enabled")):
+            return
+        key = (cand["type"], str(cand["value"]))
+        self._element_cache[key] = element
+        self._element_cache.move_to_end(key)
+        if len(self._element_cache) > _ELEMENT_CACHE_SIZE:
+            self._element_cache.popitem(last=False)
+
+    def _find_any_candidate(self, candidates: List[Dict[str, str]]) -> Optional[Tuple[Dict[str, str], Any]]:
+        """Resolve the mergeable candidates with a single native query.
+
+        The candidates are merged into one query sent once, without
+        waiting.  The first element returned is attributed to the first
+        candidate whose identifying attribute it carries.  Returns
+        ``(candidate, element)``, or None when nothing is on screen yet
+        (or the query fails) so the caller falls back to waiting on each
+        candidate in turn.
+        """
+        if not hasattr(self.driver, "find_elements"):
+            return None
+        platform = str(self.config.get("mobile.platform_name", "Android")).lower()
+        mergeable = _MERGEABLE_TYPES.get(platform, frozenset())
+        merged: List[Dict[str, str]] = []
+        for cand in candidates:
+            if cand["type"] in mergeable and cand not in merged:
+                merged.append(cand)
+        compound = _compose_compound_locator(merged, platform)
+        if compound is None:
+            return None
+        by, value = compound
+        try:
+            elements = self.driver.find_elements(by=by, value=value)
+            if not elements:
+                return None
+            element = elements[0]
+            return self._attribute_candidate(element, merged, platform), element
+        except Exception as exc:
+            self.logger.debug("Compound mobile locator query failed: %s", exc)
+            return None
+
+    @staticmethod
+    def _attribute_candidate(element: Any, merged: List[Dict[str, str]], platform: str) -> Dict[str, str]:
+        """Return the merged candidate that located ``element``.
+
+        Attributes are read lazily, so the usual case (the preferred
+        candidate matched) costs one request.  Raw UiAutomator candidates
+        cannot be checked and are assumed to match when reached.
+        """
+        attributes: Dict[str, str] = {}
+
+        def attribute(name: str) -> str:
+            if name not in attributes:
+                attributes[name] = str(element.get_attribute(name) or "")
+            return attributes[name]
+
+        for cand in merged:
+            value = str(cand["value"])
+            if platform == "ios":
+                if attribute("name") == value:
+                    return cand
+            elif cand["type"] == "id":
+                resource_id = attribute("resource-id")
+                if resource_id == value or resource_id.endswith(":id/" + value):
+                    return cand
+            elif cand["type"] == "accessibility_id":
+                if attribute("content-desc") == value:
+                    return cand
+            else:
+                return cand
+        return merged[0]
+
     def _execute_step(self, step: Dict[str, Any]) -> None:
+        # Bound by Appium HTTP round trips rather than Python work, so the
+        # step issues no requests beyond the action itself unless the step
+        # opts in to waiting for the app to go idle (``wait_for_idle``).
         action = step.get("action")
         if not action:
             raise ValueError("Mobile step missing 'action'")
@@ -111,7 +306,13 @@ class MobileMCP(MCPBase):
         stored_locator: Optional[Dict[str, str]] = None
         if getattr(self, "locator_repo", None):
             try:
-                step_key = self.locator_repo.compute_step_key(step)
+                # MCPBase retries hand the same step object back, so its
+                # key is computed once per step rather than per attempt
+                if step is self._keyed_step:
+                    step_key = self._keyed_step_key
+                else:
+                    step_key = self.locator_repo.compute_step_key(step)
+                    self._keyed_step, self._keyed_step_key = step, step_key
                 stored = self.locator_repo.get_locator("mobile", step_key)
                 if stored:
                     stored_locator = stored
@@ -138,6 +339,19 @@ class MobileMCP(MCPBase):
         if action in ("tap", "send_keys", "tap_coordinates") and "x" in step and "y" in step:
             candidates.append({"type": "coordinates", "value": f"{step.get('x')},{step.get('y')}"})
 
+        # Resolve an element without the per-candidate waits when possible:
+        # a still-usable element from an earlier step, or else one merged
+        # query over all candidates.  The resolved candidate is tried first.
+        resolved: Optional[Tuple[Dict[str, str], Any]] = None
+        if candidates:
+            cached_element = self._cached_element(candidates[0])
+            if cached_element is not None:
+                resolved = candidates[0], cached_element
+            else:
+                resolved = self._find_any_candidate(candidates)
+        if resolved is not None:
+            candidates = [resolved[0]] + [cand for cand in candidates if cand is not resolved[0]]
+
         # Execute action using first successful locator
         last_error: Optional[Exception] = None
         chosen_locator: Optional[Dict[str, str]] = None
@@ -152,9 +366,17 @@ class MobileMCP(MCPBase):
                         break
                     else:
                         continue
-                # Wait for element to be present
-                wait_utils.wait_for_element_mobile(self.driver, cand, self.config)
-                element = self._find_element(cand)
+                if resolved is not None and cand is resolved[0]:
+                    element = resolved[1]
+                    self._remember_element(cand, element)
+                    # Skipped wait_for_element_mobile, so still let any
+                    # spinner or overlay clear before acting
+                    wait_utils.wait_for_mobile_indicators(self.driver, self.config)
+                else:
+                    # Wait for element to be present
+                    wait_utils.wait_for_element_mobile(self.driver, cand, self.config)
+                    element = self._find_element(cand)
+                    self._remember_element(cand, element)
                 if action == "tap":
                     element.click()
                 elif action == "send_keys":
@@ -183,8 +405,7 @@ class MobileMCP(MCPBase):
             end: Tuple[int, int] = tuple(step.get("end"))  # type: ignore
             duration = step.get("duration", 800)
             self.driver.swipe(start_x=start[0], start_y=start[1], end_x=end[0], end_y=end[1], duration=duration)
-            # After swipe wait for spinners
-            wait_utils.wait_for_element_mobile(self.driver, {"type": "id", "value": ""}, self.config, timeout=1)
+            self._wait_for_idle(step)
             return
 
         # Handle explicit tap_coordinates action if no locator used
@@ -193,7 +414,7 @@ class MobileMCP(MCPBase):
                 coords = (step.get("x"), step.get("y"))
                 self.driver.tap([coords])
                 # chosen_locator remains None; skip repository update
-                wait_utils.wait_for_element_mobile(self.driver, {"type": "id", "value": ""}, self.config, timeout=1)
+                self._wait_for_idle(step)
                 return
 
         # If no locator succeeded and action isn't swipe, throw error
@@ -206,14 +427,18 @@ class MobileMCP(MCPBase):
         # Persist locator if it's different from stored
         if getattr(self, "locator_repo", None) and step_key and chosen_locator and chosen_locator.get("type") != "coordinates":
             if stored_locator is None or chosen_locator != stored_locator:
-                try:
-                    self.locator_repo.add_locator("mobile", step_key, chosen_locator)
-                except Exception as exc:
-                    self.logger.debug("Failed to persist mobile locator: %s", exc)
+                future = self._persist_executor.submit(self.locator_repo.add_locator, "mobile", step_key, chosen_locator)
+                future.add_done_callback(self._log_persist_failure)
 
-        # Wait for global spinners after action
-        wait_utils.wait_for_element_mobile(self.driver, chosen_locator or {"type": "id", "value": ""}, self.config, timeout=1)
+        self._wait_for_idle(step)
 
+    def _wait_for_idle(self, step: Dict[str, Any]) -> None:
+        """Wait for global spinners after an action when the step asks to.
+
+        Assertions leave the app untouched, so they never wait.
+        """
+        if step.get("wait_for_idle", False) and step.get("action") != "assert_text":
+            wait_utils.wait_for_mobile_idle(self.driver, self.config)
 
     def _self_heal(self, step: Dict[str, Any], exc: Exception) -> bool:
         """Attempt to recover from a mobile step failure.
@@ -237,13 +462,24 @@ class MobileMCP(MCPBase):
             # Only available if Appium driver supports get_screenshot_as_png
             if hasattr(self.driver, "get_screenshot_as_png"):
                 data = self.driver.get_screenshot_as_png()
-                self.reporter.attach_bytes(data, name="mobile_healing_screenshot", extension="png")
+                shot_hash = hashlib.blake2b(data, digest_size=16).digest()
+                if shot_hash != self._last_shot_hash:
+                    self._last_shot_hash = shot_hash
+                    data, extension = _compress_screenshot(data)
+                    self.reporter.attach_bytes(data, name="mobile_healing_screenshot", extension=extension)
         except Exception as heal_exc:
             self.logger.debug("Mobile self‑heal failed: %s", heal_exc)
             return False
         return False
 
+    def _log_persist_failure(self, future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            self.logger.debug("Failed to persist mobile locator: %s", exc)
+
     def close(self) -> None:
+        # Let queued locator writes finish before the session goes away
+        self._persist_executor.shutdown(wait=True)
         if self.driver:
             self.driver.quit()
             self.driver = None
@@ -252,4 +488,36 @@ class MobileMCP(MCPBase):
         try:
             self.close()
         except Exception:
-            pass
\ No newline at end of file
+            pass
+
+
+class MobileMCPPool:
+    """A fixed set of MobileMCPs, one per device, lent out one test case at a time.
+
+    Each entry of ``devices`` holds the capabilities that set that device
+    apart (``deviceName``, ``udid``, ``systemPort``, ``wdaLocalPort``, ...)
+    and may name its own ``server_url``.  Sessions are created up front
+    so that test cases running in parallel each get a dedicated device.
+    """
+
+    def __init__(self, config, reporter, devices: List[Dict[str, Any]]) -> None:
+        self._members = [MobileMCP(config, reporter, device=device) for device in devices]
+        self._idle: "queue.Queue[MobileMCP]" = queue.Queue()
+        for mcp in self._members:
+            self._idle.put(mcp)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    @contextmanager
+    def acquire(self) -> Iterator[MobileMCP]:
+        """Borrow an idle MobileMCP, blocking until one is released."""
+        mcp = self._idle.get()
+        try:
+            yield mcp
+        finally:
+            self._idle.put(mcp)
+
+    def close(self) -> None:
+        for mcp in self._members:
+            mcp.close()
\ No newline at end of file
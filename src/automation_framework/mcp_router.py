@@ -12,20 +12,22 @@ instances and aggregates reporting results.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 import json
 from typing import Any, Dict, List, Optional
 
 from .mcp.ui_mcp import UIMCP
 from .mcp.api_mcp import APIMCP
-from .mcp.mobile_mcp import MobileMCP
+from .mcp.mobile_mcp import MobileMCP, MobileMCPPool
 from .mcp.sql_mcp import SQLMCP
 from .reporting.reporter import Reporter
 from .utils.logger import get_logger
 from .utils.alerts import send_slack_alert, send_email_alert
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestCase:
     identifier: str
     steps: List[Dict[str, Any]]
@@ -65,6 +67,9 @@ class MCPRouter:
         self._api_mcp: Optional[APIMCP] = None
         self._mobile_mcp: Optional[MobileMCP] = None
         self._sql_mcp: Optional[SQLMCP] = None
+        # One MobileMCP per entry of ``mobile.devices``, created whenever
+        # any device is configured; run_all only parallelises from two up
+        self._mobile_pool: Optional[MobileMCPPool] = None
 
     def _classify(self, tc: TestCase) -> str:
         """Determine which MCP should execute the given test case.
@@ -124,18 +129,42 @@ class MCPRouter:
         corresponding MCP.  Exceptions propagate to the caller so that
         upstream code can implement retry or alerting policies.
         """
-        mcp_type = self._classify(tc)
+        self._run_classified(tc, self._classify(tc))
+
+    def _run_classified(self, tc: TestCase, mcp_type: str) -> None:
         self.logger.info("Routing test case %s to %s MCP", tc.identifier, mcp_type.upper())
+        if mcp_type == "mobile" and self._get_mobile_pool() is not None:
+            with self._mobile_pool.acquire() as mcp, self.reporter.start_test(tc.identifier, mcp_type):
+                mcp.run(tc.steps)
+            return
         mcp = self._get_mcp(mcp_type)
         with self.reporter.start_test(tc.identifier, mcp_type):
             mcp.run(tc.steps)
 
+    def _get_mobile_pool(self) -> Optional[MobileMCPPool]:
+        if self._mobile_pool is None:
+            devices = self.config.get("mobile.devices") or []
+            if not devices:
+                return None
+            self._mobile_pool = MobileMCPPool(self.config, self.reporter, devices)
+        return self._mobile_pool
+
     def run_all(self, test_cases: List[TestCase]) -> None:
         """Execute multiple test cases, optionally in parallel.
 
         If an executor has been supplied and concurrency is enabled in
         the configuration, this method will submit each test case to
-        the executor.  Otherwise the cases are executed sequentially.
+        the executor.  Otherwise API cases run on a thread pool of
+        ``mcp.api_workers`` threads, mobile cases run in parallel across
+        the devices listed in ``mobile.devices`` and the remaining cases
+        run sequentially.  A case that fails to classify or run is
+        alerted and skipped.
+
+        ``mcp.api_workers`` defaults to 1, so parallel API cases are
+        opt-in: their threads share one :class:`APIMCP` and one
+        :class:`Reporter`, whose Allure step context is not isolated
+        per thread, so steps of concurrent cases may interleave in the
+        report.
         """
         use_concurrency = bool(self.executor)
         if use_concurrency:
@@ -153,14 +182,56 @@ class MCPRouter:
                     send_slack_alert(message, self.config)
                     send_email_alert("Test case failure", message, self.config)
         else:
+            # API cases only share the stateless API MCP and mobile cases
+            # can each borrow a device from the pool, so both run on
+            # thread pools; UI and SQL cases (bound to a single driver
+            # session or connection) run serially alongside them.
+            classified = []
             for tc in test_cases:
+                # A case that cannot be classified is alerted and skipped
+                # like one that fails to run, instead of aborting the suite
                 try:
-                    self.run_test_case(tc)
+                    classified.append((tc, self._classify(tc)))
                 except Exception as exc:
-                    self.logger.error("Test case execution failed: %s", exc)
-                    message = f"Test case failed: {exc}"
-                    send_slack_alert(message, self.config)
-                    send_email_alert("Test case failure", message, self.config)
+                    self._alert_failure(exc)
+            by_type: Dict[str, List[TestCase]] = {}
+            for tc, mcp_type in classified:
+                by_type.setdefault(mcp_type, []).append(tc)
+            workers = {
+                "api": min(int(self.config.get("mcp.api_workers", 1)), len(by_type.get("api", []))),
+                "mobile": min(len(self.config.get("mobile.devices") or []), len(by_type.get("mobile", []))),
+            }
+            parallel = {mcp_type for mcp_type, count in workers.items() if count > 1}
+            futures = []
+            with ExitStack() as stack:
+                for mcp_type in parallel:
+                    # Create the shared MCP or device pool before worker
+                    # threads race to do so
+                    if mcp_type == "mobile":
+                        self._get_mobile_pool()
+                    else:
+                        self._get_mcp(mcp_type)
+                    pool = stack.enter_context(ThreadPoolExecutor(max_workers=workers[mcp_type]))
+                    futures.extend(pool.submit(self._run_guarded, tc, mcp_type) for tc in by_type[mcp_type])
+                for tc, mcp_type in classified:
+                    if mcp_type not in parallel:
+                        self._run_guarded(tc, mcp_type)
+                for f in futures:
+                    f.result()
+
+    def _run_guarded(self, tc: TestCase, mcp_type: str) -> None:
+        """Run a classified test case, alerting instead of raising on failure."""
+        try:
+            self._run_classified(tc, mcp_type)
+        except Exception as exc:
+            self._alert_failure(exc)
+
+    def _alert_failure(self, exc: Exception) -> None:
+        """Log a failed test case and notify the configured alert channels."""
+        self.logger.error("Test case execution failed: %s", exc)
+        message = f"Test case failed: {exc}"
+        send_slack_alert(message, self.config)
+        send_email_alert("Test case failure", message, self.config)
 
     def close(self) -> None:
         """Close any underlying drivers held by MCPs."""
@@ -168,5 +239,7 @@ class MCPRouter:
             self._ui_mcp.close()
         if self._mobile_mcp:
             self._mobile_mcp.close()
+        if self._mobile_pool:
+            self._mobile_pool.close()
         if self._sql_mcp:
             self._sql_mcp.close()
\ No newline at end of file
@@ -57,8 +57,13 @@ class Reporter:
             self.logger.debug("Text attachment %s:\n%s", name, text)
 
     def attach_bytes(self, data: bytes, name: str = "attachment", extension: str = "bin") -> None:
-        """Attach binary data to the report."""
+        """Attach binary data to the report.
+
+        The Allure attachment type follows ``extension`` (``png``,
+        ``jpg``, ...), falling back to PNG for unknown extensions.
+        """
         if allure:
-            allure.attach(data, name=name, attachment_type=allure.attachment_type.PNG)
+            attachment_type = getattr(allure.attachment_type, extension.upper(), allure.attachment_type.PNG)
+            allure.attach(data, name=name, attachment_type=attachment_type)
         else:
             self.logger.debug("Binary attachment %s (%d bytes)", name, len(data))
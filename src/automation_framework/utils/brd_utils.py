@@ -0,0 +1,83 @@
+"""
+BRD Utilities
+-------------
+
+Helpers shared by the CLI (``main.py``) and the self-test script for
+turning a BRD workbook or CSV frame into test case dictionaries.  A BRD
+sheet has the columns ``identifier``, ``description``, ``type`` and
+``steps``, where ``steps`` holds a JSON list of step dictionaries.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+
+try:
+    import orjson  # type: ignore
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+# pandas 2.2 added the Rust-based calamine reader, far faster than openpyxl
+try:
+    import python_calamine  # type: ignore  # noqa: F401
+    _calamine_available = True
+except ImportError:
+    _calamine_available = False
+
+
+# Only these columns are used; the rest of the sheet is never decoded
+BRD_COLUMNS = ("identifier", "description", "type", "steps")
+
+
+def read_brd_excel(path: Path) -> pd.DataFrame:
+    """Read the BRD columns of a workbook, with calamine when pandas supports it."""
+    options = {"usecols": lambda name: name in BRD_COLUMNS, "dtype": {"identifier": str}}
+    if _calamine_available:
+        try:
+            return pd.read_excel(path, engine="calamine", **options)
+        except ValueError:
+            # pandas before 2.2 rejects the engine name; use the default reader
+            pass
+    return pd.read_excel(path, **options)
+
+
+def parse_steps(steps: Any) -> List[Dict[str, Any]]:
+    """Decode a cell holding a JSON list of steps; anything else yields no steps."""
+    if isinstance(steps, str):
+        try:
+            return orjson.loads(steps) if _orjson_available else json.loads(steps)
+        except Exception:
+            return []
+    return steps if isinstance(steps, list) else []
+
+
+def frame_to_cases(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a BRD frame into test case dictionaries.
+
+    Missing BRD columns yield ``None`` values.  Identifiers are
+    returned as strings and ``steps`` cells are decoded with
+    :func:`parse_steps`.
+    """
+    # Columns are pulled out as plain lists once; iterrows builds a Series
+    # (and coerces dtypes) for every row
+    columns = [
+        df[name].tolist() if name in df.columns else [None] * len(df)
+        for name in BRD_COLUMNS
+    ]
+    return [
+        {
+            "identifier": str(identifier),
+            "description": description,
+            "type": case_type,
+            "steps": parse_steps(steps),
+        }
+        for identifier, description, case_type, steps in zip(*columns)
+    ]
+
+
+__all__ = ["BRD_COLUMNS", "read_brd_excel", "parse_steps", "frame_to_cases"]
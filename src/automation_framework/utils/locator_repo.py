@@ -45,8 +45,11 @@ from __future__ import annotations
 import datetime as _dt
 import json
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .logger import get_logger
 
@@ -63,6 +66,17 @@ class LocatorRepo:
     query the entire history using :meth:`list_locators`.
     """
 
+    # Most recently used hits shared by every instance in the process,
+    # keyed by (database file, context, step key) and holding the expiry
+    # time and locator.  Misses are not cached, so a locator stored by
+    # any writer is found on the next lookup.  add_locator refreshes its
+    # own entries; rows changed by other writers (such as
+    # utils/locator_repository.py) are picked up once the TTL expires.
+    _LOCATOR_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _LOCATOR_CACHE_SIZE = 4096
+    _LOCATOR_CACHE_TTL = 60.0
+    _cache_lock = threading.Lock()
+
     def __init__(self, config: Any, db_path: Optional[str] = None) -> None:
         self.logger = get_logger(self.__class__.__name__)
         # Determine the path to the locator repository database.  A
@@ -77,8 +91,13 @@ class LocatorRepo:
         else:
             db_file = db_path
         Path(db_file).parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(db_file)
+        self._cache_scope = str(Path(db_file).resolve())
+        # The connection may be used from a background writer thread (see
+        # MobileMCP); _lock keeps statements on the shared cursor from
+        # interleaving.
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
         self.cursor = self.conn.cursor()
+        self._lock = threading.Lock()
         self._ensure_schema()
 
     def _ensure_schema(self) -> None:
@@ -132,7 +151,7 @@ class LocatorRepo:
                 return f"{action}:{step[key]}"
         # Fallback to serialising the entire step
         try:
-            step_json = json.dumps({k: step[k] for k in sorted(step)}, sort_keys=True)
+            step_json = json.dumps(step, sort_keys=True)
         except Exception:
             step_json = str(step)
         return f"{action}:{step_json}"
@@ -144,22 +163,42 @@ class LocatorRepo:
         if no locator is stored.  Context should be ``"ui"`` or
         ``"mobile"``.  If multiple active locators exist (which should
         not happen due to the unique index) the one with the highest
-        version number is returned.
+        version number is returned.  Stored locators are served from
+        the process-wide cache for up to ``_LOCATOR_CACHE_TTL`` seconds.
         """
-        self.cursor.execute(
-            """
-            SELECT locator_type, locator_value
-            FROM locators
-            WHERE context = ? AND step_key = ? AND is_active = 1
-            ORDER BY version DESC
-            LIMIT 1
-            """,
-            (context, step_key),
-        )
-        row = self.cursor.fetchone()
-        if not row:
+        cache_key = (self._cache_scope, context, step_key)
+        with LocatorRepo._cache_lock:
+            cached = LocatorRepo._LOCATOR_CACHE.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    LocatorRepo._LOCATOR_CACHE.move_to_end(cache_key)
+                    return dict(cached[1])
+                del LocatorRepo._LOCATOR_CACHE[cache_key]
+        with self._lock:
+            self.cursor.execute(
+                """
+                SELECT locator_type, locator_value
+                FROM locators
+                WHERE context = ? AND step_key = ? AND is_active = 1
+                ORDER BY version DESC
+                LIMIT 1
+                """,
+                (context, step_key),
+            )
+            row = self.cursor.fetchone()
+        if row is None:
             return None
-        return {"type": row[0], "value": row[1]}
+        locator = {"type": row[0], "value": row[1]}
+        self._cache_put(cache_key, locator)
+        return dict(locator)
+
+    @classmethod
+    def _cache_put(cls, cache_key: Tuple[str, str, str], locator: Dict[str, Any]) -> None:
+        with cls._cache_lock:
+            cls._LOCATOR_CACHE[cache_key] = (time.monotonic() + cls._LOCATOR_CACHE_TTL, locator)
+            cls._LOCATOR_CACHE.move_to_end(cache_key)
+            if len(cls._LOCATOR_CACHE) > cls._LOCATOR_CACHE_SIZE:
+                cls._LOCATOR_CACHE.popitem(last=False)
 
     def add_locator(self, context: str, step_key: str, locator: Dict[str, str]) -> None:
         """Insert a new locator version and mark previous active ones inactive.
@@ -174,28 +213,30 @@ class LocatorRepo:
         locator_value = locator.get("value")
         if not locator_type or not locator_value:
             raise ValueError("Locator must have 'type' and 'value' fields")
-        # Deactivate previous active locator (if any)
-        self.cursor.execute(
-            "UPDATE locators SET is_active = 0, updated_at = ? WHERE context = ? AND step_key = ? AND is_active = 1",
-            (_dt.datetime.now().isoformat(), context, step_key),
-        )
-        # Determine next version
-        self.cursor.execute(
-            "SELECT MAX(version) FROM locators WHERE context = ? AND step_key = ?",
-            (context, step_key),
-        )
-        row = self.cursor.fetchone()
-        next_version = (row[0] + 1) if row and row[0] is not None else 1
-        now = _dt.datetime.now().isoformat()
-        self.cursor.execute(
-            """
-            INSERT INTO locators (context, step_key, locator_type, locator_value,
-                                  version, is_active, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, 1, ?, ?)
-            """,
-            (context, step_key, locator_type, locator_value, next_version, now, now),
-        )
-        self.conn.commit()
+        with self._lock:
+            # Deactivate previous active locator (if any)
+            self.cursor.execute(
+                "UPDATE locators SET is_active = 0, updated_at = ? WHERE context = ? AND step_key = ? AND is_active = 1",
+                (_dt.datetime.now().isoformat(), context, step_key),
+            )
+            # Determine next version
+            self.cursor.execute(
+                "SELECT MAX(version) FROM locators WHERE context = ? AND step_key = ?",
+                (context, step_key),
+            )
+            row = self.cursor.fetchone()
+            next_version = (row[0] + 1) if row and row[0] is not None else 1
+            now = _dt.datetime.now().isoformat()
+            self.cursor.execute(
+                """
+                INSERT INTO locators (context, step_key, locator_type, locator_value,
+                                      version, is_active, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+                """,
+                (context, step_key, locator_type, locator_value, next_version, now, now),
+            )
+            self.conn.commit()
+        self._cache_put((self._cache_scope, context, step_key), {"type": locator_type, "value": locator_value})
         self.logger.info(
             "Recorded locator for context=%s, key=%s (type=%s, value=%s, version=%s)",
             context,
@@ -226,8 +267,9 @@ class LocatorRepo:
         if clauses:
             query += " WHERE " + " AND ".join(clauses)
         query += " ORDER BY context, step_key, version DESC"
-        self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
+        with self._lock:
+            self.cursor.execute(query, params)
+            rows = self.cursor.fetchall()
         return [
             {
                 "context": r[0],
@@ -8,18 +8,47 @@ executable HTTP requests.  The translator covers a limited set of
 patterns to demonstrate the concept of LLM‑driven API generation.
 """
 
+import atexit
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+try:
+    import httpx  # type: ignore
+    _httpx_available = True
+except ImportError:
+    _httpx_available = False
 
-@dataclass
+try:
+    import h2  # type: ignore  # noqa: F401  (enables httpx HTTP/2)
+    _http2_available = True
+except ImportError:
+    _http2_available = False
+
+# Shared session so that requests to the same host reuse TCP/TLS
+# connections, including when API test cases run on a thread pool.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Methods either HTTP client accepts for an APIRequest
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+
+# httpx client shared by every execute_request call, created on first use
+_client: Optional["httpx.Client"] = None
+_client_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class APIRequest:
     method: str
     url: str
@@ -91,13 +120,36 @@ def parse_api_command(command: str, base_url: str = "") -> APIRequest:
     return APIRequest("GET", command, None, None, 200)
 
 
-def execute_request(req: APIRequest) -> requests.Response:
-    """Execute an APIRequest using the `requests` library."""
-    method_func = getattr(requests, req.method.lower(), None)
-    if not method_func:
+def _get_client() -> "httpx.Client":
+    """Return the shared httpx client, multiplexing over HTTP/2 when h2 is installed."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=_http2_available,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                    timeout=httpx.Timeout(30.0),
+                    # Match requests, which follows redirects by default
+                    follow_redirects=True,
+                )
+                atexit.register(_client.close)
+    return _client
+
+
+def execute_request(req: APIRequest) -> Any:
+    """Execute an APIRequest over a pooled connection.
+
+    Uses ``httpx`` when installed and otherwise the shared ``requests``
+    session.  Either response exposes ``status_code``, ``text`` and
+    ``json()``.
+    """
+    method = req.method.upper()
+    if method not in _HTTP_METHODS:
         raise ValueError(f"Unsupported HTTP method: {req.method}")
-    resp = method_func(req.url, headers=req.headers, json=req.body)
-    return resp
+    if _httpx_available:
+        return _get_client().request(method, req.url, headers=req.headers, json=req.body)
+    return _session.request(method, req.url, headers=req.headers, json=req.body)
 
 
 __all__ = ["APIRequest", "parse_api_command", "execute_request"]
\ No newline at end of file
@@ -20,7 +20,7 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -129,6 +129,112 @@ def wait_for_element_ui(page: Any, selector: str, config: Any, timeout: int = 30
         wait_for_page_stable(page, config)
 
 
+def wait_until(predicate: Callable[[], bool], timeout: float, interval: float = 0.05) -> bool:
+    """Poll ``predicate`` until it is true or ``timeout`` seconds pass.
+
+    The predicate is evaluated once before any delay, so a condition
+    that already holds costs no waiting at all.  Returns whether the
+    condition was met.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def _mobile_indicator_locator(indicator: str, mobile_by: Any) -> Tuple[str, str]:
+    """Map a wait repository indicator string to an Appium ``(by, value)`` pair."""
+    if indicator.startswith("//"):
+        return mobile_by.XPATH, indicator
+    if indicator.startswith("id="):
+        return mobile_by.ID, indicator[len("id="):]
+    if indicator.startswith("accessibility_id="):
+        return mobile_by.ACCESSIBILITY_ID, indicator[len("accessibility_id="):]
+    # treat as id
+    return mobile_by.ID, indicator
+
+
+# XCUITest app state for an app running in the foreground
+_IOS_APP_RUNNING_IN_FOREGROUND = 4
+
+
+def _mobile_app_settled(driver: Any) -> Optional[Callable[[], bool]]:
+    """Return a cheap predicate that is true once the app under test is settled.
+
+    On Android the foreground activity must read the same on two
+    consecutive samples; on iOS the app must be running in the
+    foreground.  Neither walks the element tree.  Returns None when the
+    driver offers no such signal.
+    """
+    capabilities = getattr(driver, "capabilities", None) or {}
+    platform = str(capabilities.get("platformName", "")).lower()
+    if platform == "android" and hasattr(driver, "current_activity"):
+        last: List[Optional[str]] = [None]
+
+        def activity_stable() -> bool:
+            current = driver.current_activity
+            settled = current is not None and current == last[0]
+            last[0] = current
+            return settled
+
+        return activity_stable
+    bundle_id = capabilities.get("bundleId")
+    if platform == "ios" and bundle_id and hasattr(driver, "query_app_state"):
+        return lambda: driver.query_app_state(bundle_id) == _IOS_APP_RUNNING_IN_FOREGROUND
+    return None
+
+
+def wait_for_mobile_idle(driver: Any, config: Any, timeout: float = 2) -> None:
+    """Wait until the app has settled and no known spinner or overlay is shown.
+
+    The app state is polled first through :func:`_mobile_app_settled`,
+    then :func:`wait_for_mobile_indicators` checks the wait repository,
+    so an idle screen costs one round trip per indicator.  Drivers
+    without ``find_elements`` (e.g. dummy drivers) return immediately.
+    """
+    try:
+        from appium.webdriver.common.mobileby import MobileBy  # type: ignore
+    except Exception:
+        return
+    if not driver or not hasattr(driver, "find_elements"):
+        return
+    settled = _mobile_app_settled(driver)
+    if settled is not None:
+        try:
+            wait_until(settled, timeout)
+        except Exception as exc:
+            logger.debug("Mobile app state check failed: %s", exc)
+    wait_for_mobile_indicators(driver, config, timeout)
+
+
+def wait_for_mobile_indicators(driver: Any, config: Any, timeout: float = 1) -> None:
+    """Wait for every known mobile spinner and overlay to disappear.
+
+    Each indicator from the wait repository is checked with
+    ``find_elements``, which returns at once when it is absent.  Drivers
+    without ``find_elements`` (e.g. dummy drivers) return immediately.
+    """
+    try:
+        from appium.webdriver.common.mobileby import MobileBy  # type: ignore
+    except Exception:
+        return
+    if not driver or not hasattr(driver, "find_elements"):
+        return
+    repo_path = config.get("wait_repo.path", "./wait_repo.yaml") if hasattr(config, "get") else "./wait_repo.yaml"
+    repo = _load_wait_repo(repo_path)
+    indicators: List[str] = repo.get("mobile", {}).get("spinners", []) + repo.get("mobile", {}).get("overlays", [])
+    for indicator in indicators:
+        by_ind, val_ind = _mobile_indicator_locator(indicator, MobileBy)
+        try:
+            if not wait_until(lambda: not driver.find_elements(by=by_ind, value=val_ind), timeout):
+                logger.debug("Mobile indicator %s still present after %ss", indicator, timeout)
+        except Exception as exc:
+            logger.debug("wait_for_mobile_indicators(%s) failed: %s", indicator, exc)
+
+
 def wait_for_element_mobile(driver: Any, locator: Dict[str, str], config: Any, timeout: int = 30) -> None:
     """Wait for a mobile element to be present and enabled.
 
@@ -175,19 +281,7 @@ def wait_for_element_mobile(driver: Any, locator: Dict[str, str], config: Any, t
         for indicator in indicators:
             try:
                 # indicator may be an id, accessibility id or xpath; detect prefix
-                if indicator.startswith("//"):
-                    by_ind = MobileBy.XPATH
-                    val_ind = indicator
-                elif indicator.startswith("id="):
-                    by_ind = MobileBy.ID
-                    val_ind = indicator[len("id="):]
-                elif indicator.startswith("accessibility_id="):
-                    by_ind = MobileBy.ACCESSIBILITY_ID
-                    val_ind = indicator[len("accessibility_id="):]
-                else:
-                    # treat as id
-                    by_ind = MobileBy.ID
-                    val_ind = indicator
+                by_ind, val_ind = _mobile_indicator_locator(indicator, MobileBy)
                 WebDriverWait(driver, 1).until_not(EC.presence_of_element_located((by_ind, val_ind)))
             except Exception:
                 pass
@@ -197,5 +291,8 @@ __all__ = [
     "wait_for_page_stable",
     "wait_for_element_ui",
     "wait_for_element_mobile",
+    "wait_for_mobile_idle",
+    "wait_for_mobile_indicators",
+    "wait_until",
     "add_indicator",
 ]
\ No newline at end of file
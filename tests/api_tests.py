@@ -8,6 +8,7 @@ LLM agent.  The test uses the public jsonplaceholder API to fetch a
 single post and verifies the returned status code.
 """
 
+import importlib
 import os
 import sys
 import yaml
@@ -16,8 +17,16 @@ import allure
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from api.api_driver import APIDriver  # type: ignore
-from utils.db_utils import Database  # type: ignore
+# The repository root is itself a package and the drivers import their
+# siblings relatively (``..utils``), so load them through that package
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+_api_driver = importlib.import_module(f"{_PACKAGE}.api.api_driver")
+APIDriver = _api_driver.APIDriver
+_fast_translate = _api_driver._fast_translate
+Database = importlib.import_module(f"{_PACKAGE}.utils.db_utils").Database
 
 
 @pytest.fixture(scope="module")
@@ -123,4 +132,50 @@ def test_api_dependent_step(config: dict, db: Database) -> None:
     with allure.step("Run API dependent test case"):
         run_id = driver.run_test_case(case)
     runs = db.get_test_runs()
-    assert runs[-1]["status"] in {"partial", "failed"}
\ No newline at end of file
+    assert runs[-1]["status"] in {"partial", "failed"}
+
+def test_api_concurrent_dependent_step(config: dict, db: Database) -> None:
+    """Run steps on a thread pool and ensure dependents of a failed step are skipped."""
+    cfg = dict(config)
+    cfg["api"] = dict(config.get("api", {}), max_workers=4)
+    driver = APIDriver(cfg, db)
+    case = {
+        "user_story": "API Concurrent",
+        "test_set": "Negative",
+        "steps": [
+            {"command": "get /status/400", "expected_status": 200},
+            {"command": "get /status/200", "expected_status": 200},
+            {"command": "get /status/200", "expected_status": 200, "depends_on": 0},
+        ],
+        "created_by": "pytest",
+        "source": "manual",
+        "created_at": "",
+        "version": 1,
+    }
+    with allure.step("Run API concurrent test case"):
+        run_id = driver.run_test_case(case)
+    driver.close()
+    steps = db.get_run_steps(run_id)
+    assert [s["step_index"] for s in steps] == [0, 1, 2]
+    assert steps[2]["status"] == "skipped"
+
+
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        ("GET /users", ("GET", "https://api.test/users", None)),
+        ("DELETE users/1", None),
+        ("POST /users with body {\"name\": \"Ada\"}", ("POST", "https://api.test/users", {"name": "Ada"})),
+        ("PUT https://other.test/items/2", ("PUT", "https://other.test/items/2", None)),
+        ("get /users", None),
+        ("GET the list of users", None),
+        ("POST /users with body {not json}", None),
+    ],
+)
+def test_fast_translate(command: str, expected) -> None:
+    """Only upper-case methods with an explicit path or URL bypass the LLM."""
+    req = _fast_translate(command, "https://api.test/")
+    if expected is None:
+        assert req is None
+    else:
+        assert (req.method, req.url, req.body) == expected
@@ -0,0 +1,37 @@
+"""
+BRD Tests
+---------
+
+These tests exercise the BRD helpers shared by ``main.py`` and the
+self-test script against the bundled sample workbook and in-memory
+frames.
+"""
+
+import importlib
+import os
+import sys
+import pandas as pd
+
+# The repository root is itself a package, so load its modules through it
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+brd_utils = importlib.import_module(f"{_PACKAGE}.src.automation_framework.utils.brd_utils")
+
+
+def test_frame_to_cases_fills_missing_columns_and_decodes_steps() -> None:
+    """Absent columns become None and only JSON lists yield steps."""
+    df = pd.DataFrame({"identifier": [7, "TC_2"], "steps": ['[{"action": "goto"}]', "not json"]})
+    assert brd_utils.frame_to_cases(df) == [
+        {"identifier": "7", "description": None, "type": None, "steps": [{"action": "goto"}]},
+        {"identifier": "TC_2", "description": None, "type": None, "steps": []},
+    ]
+
+
+def test_sample_workbook_round_trip() -> None:
+    """The sample BRD reads into one case per row with its steps decoded."""
+    df = brd_utils.read_brd_excel(os.path.join(_ROOT, "tests", "sample_brd.xlsx"))
+    cases = brd_utils.frame_to_cases(df)
+    assert len(cases) == len(df)
+    assert all(isinstance(case["identifier"], str) and case["steps"] for case in cases)
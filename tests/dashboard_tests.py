@@ -0,0 +1,86 @@
+"""
+Dashboard Tests
+---------------
+
+These tests exercise the conditional GET support of the dashboard API:
+a request repeating the returned ``ETag`` in ``If-None-Match`` gets a
+304 until the underlying data changes.
+"""
+
+import importlib
+import os
+import sys
+import pytest
+
+TestClient = pytest.importorskip("fastapi.testclient").TestClient
+
+# The repository root is itself a package, so load its modules through it
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+Database = importlib.import_module(f"{_PACKAGE}.utils.db_utils").Database
+
+
+@pytest.fixture(scope="function")
+def dashboard_app(tmp_path, monkeypatch):
+    # The app reads settings.yaml and opens its database relative to the
+    # working directory on import, so import it from an empty directory
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data", exist_ok=True)
+    dashboard_app = importlib.import_module(f"{_PACKAGE}.dashboard.app")
+    db = Database(os.path.join(tmp_path, "test_db.sqlite"))
+    monkeypatch.setattr(dashboard_app, "db", db)
+    monkeypatch.setitem(dashboard_app._run_stats_cache, "expires", 0.0)
+    dashboard_app._invalidate_test_cases()
+    yield dashboard_app
+    db.close()
+
+
+@pytest.fixture(scope="function")
+def client(dashboard_app) -> TestClient:
+    return TestClient(dashboard_app.app)
+
+
+def _add_case(dashboard_app, user_story: str) -> None:
+    dashboard_app.db.add_test_case(
+        {
+            "user_story": user_story,
+            "test_set": "Positive",
+            "steps": [],
+            "created_by": "pytest",
+            "source": "manual",
+            "created_at": "",
+            "version": 1,
+        }
+    )
+    dashboard_app._invalidate_test_cases()
+
+
+def test_test_cases_etag_round_trip(dashboard_app, client: TestClient) -> None:
+    """A matching If-None-Match gets 304 until a write invalidates the cache."""
+    _add_case(dashboard_app, "Story")
+    first = client.get("/api/test-cases")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    cached = client.get("/api/test-cases", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    _add_case(dashboard_app, "Another story")
+    changed = client.get("/api/test-cases", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()["test_cases"]) == 2
+
+
+def test_statistics_etag_round_trip(dashboard_app, client: TestClient) -> None:
+    """The statistics tag follows the payload, so new data yields a fresh 200."""
+    first = client.get("/api/statistics")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert client.get("/api/statistics", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+    _add_case(dashboard_app, "Story")
+    changed = client.get("/api/statistics", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["total_test_cases"] == 1
@@ -0,0 +1,129 @@
+"""
+Database Tests
+--------------
+
+These tests exercise the batched write paths of :class:`Database`
+against a temporary SQLite file.
+"""
+
+import importlib
+import os
+import sqlite3
+import sys
+import threading
+import pytest
+
+# The repository root is itself a package, so load its modules through it
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+Database = importlib.import_module(f"{_PACKAGE}.utils.db_utils").Database
+
+
+@pytest.fixture(scope="function")
+def db(tmp_path) -> Database:
+    db_path = os.path.join(tmp_path, "test_db.sqlite")
+    database = Database(db_path)
+    yield database
+    database.close()
+
+
+def _add_case(db: Database, user_story: str = "Story", test_set: str = "Positive", description: str = "") -> int:
+    return db.add_test_case(
+        {
+            "user_story": user_story,
+            "test_set": test_set,
+            # add_test_case derives the description from the step actions
+            "steps": [{"action": description}] if description else [],
+            "created_by": "pytest",
+            "source": "manual",
+            "created_at": "",
+            "version": 1,
+        }
+    )
+
+
+def test_finish_test_run_writes_buffered_steps(db: Database) -> None:
+    """Buffered step rows and the final status land together."""
+    case_id = _add_case(db)
+    run_id = db.add_test_run(case_id, "running", "t0", "t0")
+    db.finish_test_run(run_id, "passed", "t2", None, [(0, "passed", None, "t0", "t1"), (1, "passed", None, "t1", "t2")])
+    run = db.get_test_runs(case_id)[0]
+    assert (run["status"], run["ended_at"]) == ("passed", "t2")
+    assert [step["step_index"] for step in db.get_run_steps(run_id)] == [0, 1]
+
+
+def test_finish_test_run_rolls_back_on_error(db: Database) -> None:
+    """A failing step row leaves neither steps nor status updates behind."""
+    case_id = _add_case(db)
+    run_id = db.add_test_run(case_id, "running", "t0", "t0")
+    with pytest.raises(Exception):
+        # status is NOT NULL, so the second step row is rejected
+        db.finish_test_run(run_id, "passed", "t2", None, [(0, "passed", None, "t0", "t1"), (1, None, None, "t1", "t2")])
+    assert db.get_run_steps(run_id) == []
+    assert db.get_test_runs(case_id)[0]["status"] == "running"
+
+
+def test_finish_test_runs_batches_several_runs(db: Database) -> None:
+    """Runs queued by the background writer are finished in one call."""
+    case_id = _add_case(db)
+    first = db.add_test_run(case_id, "running", "t0", "t0")
+    second = db.add_test_run(case_id, "running", "t0", "t0")
+    db.finish_test_runs(
+        [
+            (first, "passed", "t2", None, [(0, "passed", None, "t0", "t1"), (1, "passed", None, "t1", "t2")]),
+            (second, "failed", "t3", "boom", [(0, "failed", "boom", "t0", "t3")]),
+        ]
+    )
+    runs = {run["id"]: run for run in db.get_test_runs(case_id)}
+    assert (runs[first]["status"], runs[first]["ended_at"]) == ("passed", "t2")
+    assert (runs[second]["status"], runs[second]["error_message"]) == ("failed", "boom")
+    assert [step["step_index"] for step in db.get_run_steps(first)] == [0, 1]
+    assert [step["message"] for step in db.get_run_steps(second)] == ["boom"]
+
+
+def test_upsert_test_cases_updates_inserts_and_skips_unchanged(db: Database) -> None:
+    """Changed descriptions bump the version; unchanged ones and new cases do not."""
+    _add_case(db, "Story", "Positive", "old")
+    _add_case(db, "Story", "Negative", "same")
+    db.upsert_test_cases(
+        [
+            {"user_story": "Story", "test_set": "Positive", "description": "new", "created_by": "pytest", "source": "excel"},
+            {"user_story": "Story", "test_set": "Negative", "description": "same", "created_by": "pytest", "source": "excel"},
+            {"user_story": "Other", "test_set": "Positive", "description": "added", "created_by": "pytest", "source": "excel"},
+        ]
+    )
+    cases = {(case["user_story"], case["test_set"]): case for case in db.get_test_cases()}
+    assert len(cases) == 3
+    assert (cases[("Story", "Positive")]["description"], cases[("Story", "Positive")]["version"]) == ("new", 2)
+    assert cases[("Story", "Negative")]["version"] == 1
+    assert (cases[("Other", "Positive")]["description"], cases[("Other", "Positive")]["version"]) == ("added", 1)
+
+
+def test_upsert_test_cases_updates_only_the_oldest_match(db: Database) -> None:
+    """When a story/set pair holds several cases only the first one is updated."""
+    first = _add_case(db, "Story", "Positive", "a")
+    second = _add_case(db, "Story", "Positive", "b")
+    db.upsert_test_cases(
+        [{"user_story": "Story", "test_set": "Positive", "description": "c", "created_by": "pytest", "source": "excel"}]
+    )
+    cases = {case["id"]: case for case in db.get_test_cases()}
+    assert (cases[first]["description"], cases[first]["version"]) == ("c", 2)
+    assert (cases[second]["description"], cases[second]["version"]) == ("b", 1)
+
+
+def test_close_releases_per_thread_read_connections(tmp_path) -> None:
+    """Read connections opened by worker threads are closed with the database."""
+    database = Database(os.path.join(tmp_path, "test_db.sqlite"))
+    workers = [threading.Thread(target=database.get_test_cases) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    connections = list(database._read_conns)
+    assert len(connections) == 3
+    database.close()
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,174 @@
+"""
+LLM Agent Tests
+---------------
+
+These tests exercise the provider plumbing of :class:`LLMAgent` with
+scripted in-process providers, so no network access or API keys are
+needed.
+"""
+
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import pytest
+
+# The repository root is itself a package, so load its modules through it
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+_llm_agent = importlib.import_module(f"{_PACKAGE}.llm_integration.llm_agent")
+CircuitBreaker = _llm_agent.CircuitBreaker
+LLMAgent = _llm_agent.LLMAgent
+LLMProvider = _llm_agent.LLMProvider
+
+
+class ScriptedProvider(LLMProvider):
+    """Provider answering from a callable and counting its calls."""
+
+    def __init__(self, reply, priority: int = 1, delay: float = 0.0) -> None:
+        self.reply = reply
+        self.priority = priority
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def chat(self, messages, temperature=0.0):
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return self.reply(messages)
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_priority(self) -> int:
+        return self.priority
+
+
+def _failing(messages):
+    raise RuntimeError("provider down")
+
+
+@pytest.fixture(scope="function")
+def agent(monkeypatch) -> LLMAgent:
+    monkeypatch.delenv("UNICORN_LLM_CACHE_DIR", raising=False)
+    return LLMAgent({"llm_mode": "local", "llm_providers": [], "llm_retries": 1})
+
+
+def _use_providers(agent: LLMAgent, *providers: ScriptedProvider) -> None:
+    agent.active_provider = providers[0]
+    agent.provider_chain = sorted(providers, key=lambda provider: provider.get_priority())
+
+
+def test_circuit_breaker_opens_and_lets_a_trial_through() -> None:
+    """The circuit opens after the threshold and half-opens after the timeout."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    provider = ScriptedProvider(lambda messages: "ok")
+    breaker.record_failure(provider)
+    assert not breaker.is_open(provider)
+    breaker.record_failure(provider)
+    assert breaker.is_open(provider)
+    time.sleep(0.06)
+    assert not breaker.is_open(provider)
+    breaker.record_success(provider)
+    breaker.record_failure(provider)
+    assert not breaker.is_open(provider)
+
+
+def test_call_llm_fails_over_and_skips_open_circuits(agent: LLMAgent) -> None:
+    """A failing active provider falls through to the next one until its circuit opens."""
+    primary = ScriptedProvider(_failing, priority=1)
+    fallback = ScriptedProvider(lambda messages: "fallback answer", priority=2)
+    _use_providers(agent, primary, fallback)
+    agent.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    for index in range(3):
+        # Distinct prompts so the response cache does not answer
+        assert agent._call_llm([{"role": "user", "content": f"prompt {index}"}]) == "fallback answer"
+    assert primary.calls == 2
+    assert fallback.calls == 3
+
+
+def test_classify_batch_sends_misses_in_one_call(agent: LLMAgent) -> None:
+    """Distinct ambiguous steps are classified with one request and then cached."""
+    provider = ScriptedProvider(lambda messages: json.dumps(["api", "sql"]))
+    _use_providers(agent, provider)
+    texts = ["check the orders", "check the totals", "check the orders"]
+    assert agent.classify_batch(texts) == ["api", "sql", "api"]
+    assert provider.calls == 1
+    # Per-item answers were cached under the key classify() uses
+    assert agent.classify("check the totals") == "sql"
+    assert provider.calls == 1
+
+
+def test_classify_batch_falls_back_on_a_bad_reply(agent: LLMAgent) -> None:
+    """A reply of the wrong length yields the keyword heuristic for every miss."""
+    provider = ScriptedProvider(lambda messages: json.dumps(["api"]))
+    _use_providers(agent, provider)
+    texts = ["check the orders", "check the totals"]
+    assert agent.classify_batch(texts) == [agent._heuristic_classify(text) for text in texts]
+
+
+def test_call_llm_single_flight(agent: LLMAgent) -> None:
+    """Concurrent identical prompts share one provider call."""
+    provider = ScriptedProvider(lambda messages: "shared", delay=0.2)
+    _use_providers(agent, provider)
+    messages = [{"role": "user", "content": "same prompt"}]
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(agent._call_llm(messages))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["shared"] * 5
+    assert provider.calls == 1
+
+
+def test_translate_api_with_source_flags_heuristic_fallback(agent: LLMAgent) -> None:
+    """Only a parsed LLM reply is reported as coming from the LLM."""
+    _use_providers(agent, ScriptedProvider(lambda messages: "not json"))
+    _, from_llm = agent.translate_api_with_source("fetch the users", "https://example.test")
+    assert from_llm is False
+    _use_providers(agent, ScriptedProvider(lambda messages: json.dumps({"method": "GET", "url": "https://example.test/users"})))
+    request, from_llm = agent.translate_api_with_source("list the users", "https://example.test")
+    assert from_llm is True
+    assert (request.method, request.url) == ("GET", "https://example.test/users")
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        json.dumps(
+            {
+                "openapi": "3.0.0",
+                "paths": {
+                    "/users": {"get": {"summary": "List users"}, "post": {}, "parameters": []},
+                    "/users/{id}": {"delete": {"summary": "Delete user"}},
+                },
+            }
+        ),
+        "openapi: 3.0.0\n"
+        "paths:\n"
+        "  /users:\n"
+        "    get:\n"
+        "      summary: List users\n"
+        "    post: {}\n"
+        "    parameters: []\n"
+        "  /users/{id}:\n"
+        "    delete:\n"
+        "      summary: Delete user\n",
+    ],
+    ids=["json", "yaml"],
+)
+def test_extract_endpoints_from_swagger(agent: LLMAgent, spec: str) -> None:
+    """Only real operations are emitted, one per path and method."""
+    assert agent._extract_endpoints_from_swagger(spec) == [
+        {"path": "/users", "method": "GET", "summary": "List users"},
+        {"path": "/users", "method": "POST", "summary": "POST /users"},
+        {"path": "/users/{id}", "method": "DELETE", "summary": "Delete user"},
+    ]
+    assert len(agent._extract_endpoints_from_swagger(spec, limit=2)) == 2
@@ -0,0 +1,63 @@
+"""
+Locator Repository Tests
+------------------------
+
+These tests exercise the process-wide lookup cache of
+:class:`LocatorRepo` against a temporary SQLite file, with a second
+repository instance standing in for another writer.
+"""
+
+import importlib
+import os
+import sys
+import time
+import types
+import pytest
+
+# The repository root is itself a package, so load its modules through it
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+locator_repo = importlib.import_module(f"{_PACKAGE}.src.automation_framework.utils.locator_repo")
+LocatorRepo = locator_repo.LocatorRepo
+
+
+@pytest.fixture(scope="function")
+def repos(tmp_path):
+    path = str(tmp_path / "locators.db")
+    reader, writer = LocatorRepo({}, db_path=path), LocatorRepo({}, db_path=path)
+    yield reader, writer
+    reader.close()
+    writer.close()
+
+
+def _write_directly(repo: LocatorRepo, value: str) -> None:
+    """Store a locator without going through add_locator's cache refresh."""
+    repo.cursor.execute("UPDATE locators SET is_active = 0 WHERE step_key = 'click:Login'")
+    repo.cursor.execute(
+        "INSERT INTO locators (context, step_key, locator_type, locator_value, version, is_active, created_at, updated_at)"
+        " VALUES ('ui', 'click:Login', 'css', ?, 1, 1, '', '')",
+        (value,),
+    )
+    repo.conn.commit()
+
+
+def test_get_locator_does_not_cache_misses(repos) -> None:
+    """A locator stored after a miss is found on the next lookup."""
+    reader, writer = repos
+    assert reader.get_locator("ui", "click:Login") is None
+    _write_directly(writer, "#login")
+    assert reader.get_locator("ui", "click:Login") == {"type": "css", "value": "#login"}
+
+
+def test_get_locator_hits_expire(repos, monkeypatch) -> None:
+    """Cached hits are served until the TTL expires, then reloaded."""
+    reader, writer = repos
+    writer.add_locator("ui", "click:Login", {"type": "css", "value": "#login"})
+    assert reader.get_locator("ui", "click:Login")["value"] == "#login"
+    _write_directly(writer, "#sign-in")
+    assert reader.get_locator("ui", "click:Login")["value"] == "#login"
+    later = time.monotonic() + LocatorRepo._LOCATOR_CACHE_TTL + 1
+    monkeypatch.setattr(locator_repo, "time", types.SimpleNamespace(monotonic=lambda: later))
+    assert reader.get_locator("ui", "click:Login")["value"] == "#sign-in"
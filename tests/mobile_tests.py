@@ -8,16 +8,28 @@ tests simply verify that the driver can execute steps without raising
 exceptions and that results are recorded appropriately.
 """
 
+import importlib
 import os
 import sys
+import threading
 import yaml
 import pytest
 import allure
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from mobile.mobile_driver import MobileDriver  # type: ignore
-from utils.db_utils import Database  # type: ignore
+# The repository root is itself a package and the drivers import their
+# siblings relatively (``..utils``), so load them through that package
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+MobileDriver = importlib.import_module(f"{_PACKAGE}.mobile.mobile_driver").MobileDriver
+Database = importlib.import_module(f"{_PACKAGE}.utils.db_utils").Database
+Config = importlib.import_module(f"{_PACKAGE}.src.automation_framework.config").Config
+_mobile_mcp = importlib.import_module(f"{_PACKAGE}.src.automation_framework.mcp.mobile_mcp")
+MobileMCPPool = _mobile_mcp.MobileMCPPool
+_compose_compound_locator = _mobile_mcp._compose_compound_locator
 
 
 @pytest.fixture(scope="module")
@@ -95,4 +107,89 @@ def test_mobile_dependent_step(config: dict, db: Database) -> None:
     with allure.step("Run mobile dependent test case"):
         run_id = driver.run_test_case(case)
     runs = db.get_test_runs()
-    assert runs[-1]["status"] in {"partial", "skipped"}
\ No newline at end of file
+    assert runs[-1]["status"] in {"partial", "skipped"}
+
+
+def test_mobile_dependent_step(config: dict, db: Database) -> None:
+    """Ensure mobile driver skips dependent steps when prerequisite fails."""
+    driver = MobileDriver(config, db)
+    case = {
+        "user_story": "Mobile Dependent",
+        "test_set": "Negative",
+        "steps": [
+            {"action": "tap"},  # missing locator will cause skip
+            {"action": "tap", "locator": {"type": "accessibility_id", "value": "Login"}, "depends_on": 0},
+        ],
+        "created_by": "pytest",
+        "source": "manual",
+        "created_at": "",
+        "version": 1,
+    }
+    with allure.step("Run mobile dependent test case"):
+        run_id = driver.run_test_case(case)
+    runs = db.get_test_runs()
+    assert runs[-1]["status"] in {"partial", "skipped"}
+
+
+@pytest.mark.parametrize(
+    "candidates, platform, expected",
+    [
+        (
+            [{"type": "id", "value": "login"}, {"type": "accessibility_id", "value": "Log in"}],
+            "android",
+            'new UiSelector().resourceIdMatches(".*:id/login$"); new UiSelector().description("Log in")',
+        ),
+        (
+            [{"type": "id", "value": "com.app:id/login"}, {"type": "id", "value": "a.b"}],
+            "android",
+            'new UiSelector().resourceId("com.app:id/login"); new UiSelector().resourceIdMatches(".*:id/a\\\\.b$")',
+        ),
+        (
+            [{"type": "accessibility_id", "value": 'Say "hi"'}, {"type": "id", "value": "login"}],
+            "ios",
+            'name == "Say \\"hi\\"" OR name == "login"',
+        ),
+        ([{"type": "id", "value": "login"}], "android", None),
+        ([{"type": "xpath", "value": "//a"}, {"type": "id", "value": "login"}], "android", None),
+    ],
+)
+def test_compose_compound_locator(candidates, platform: str, expected) -> None:
+    """Mergeable candidates collapse into one query; fewer than two do not."""
+    compound = _compose_compound_locator(candidates, platform)
+    assert (compound[1] if compound else None) == expected
+
+
+@pytest.fixture(scope="function")
+def mcp_config(tmp_path) -> Config:
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "locator_repo": {"path": str(tmp_path / "locators.db")},
+                "wait_repo": {"path": str(tmp_path / "wait_repo.yaml")},
+            }
+        ),
+        encoding="utf-8",
+    )
+    return Config(str(path))
+
+
+def test_mobile_mcp_pool_acquire_release(mcp_config: Config) -> None:
+    """Each device is lent to one borrower at a time and returned on exit."""
+    pool = MobileMCPPool(mcp_config, None, [{"deviceName": "a"}, {"deviceName": "b"}])
+    try:
+        assert len(pool) == 2
+        with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+            assert {first.device["deviceName"], second.device["deviceName"]} == {"a", "b"}
+            borrowed = []
+            waiter = threading.Thread(target=lambda: borrowed.append(pool.acquire().__enter__()))
+            waiter.start()
+            waiter.join(timeout=0.2)
+            # Both devices are out, so the third borrower has to wait
+            assert waiter.is_alive()
+        waiter.join(timeout=2)
+        assert not waiter.is_alive()
+        assert borrowed[0] in (first, second)
+    finally:
+        pool.close()
@@ -0,0 +1,45 @@
+"""
+Router Tests
+------------
+
+These tests exercise :meth:`MCPRouter.run_all` with the MCP execution
+and alert channels replaced, so no drivers or network access are
+needed.
+"""
+
+import importlib
+import os
+import sys
+import pytest
+import yaml
+
+# The repository root is itself a package, so load its modules through it
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+Config = importlib.import_module(f"{_PACKAGE}.src.automation_framework.config").Config
+mcp_router = importlib.import_module(f"{_PACKAGE}.src.automation_framework.mcp_router")
+MCPRouter = mcp_router.MCPRouter
+
+
+@pytest.fixture(scope="function")
+def router(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({"router": {"api_keywords": ["http"]}}), encoding="utf-8")
+    router = MCPRouter(Config(str(path)), reporter=None, llm_client=object())
+    router.ran = []
+    router.alerts = []
+    monkeypatch.setattr(router, "_run_classified", lambda tc, mcp_type: router.ran.append((tc.identifier, mcp_type)))
+    monkeypatch.setattr(mcp_router, "send_slack_alert", lambda message, config: router.alerts.append(message))
+    monkeypatch.setattr(mcp_router, "send_email_alert", lambda subject, message, config: None)
+    return router
+
+
+def test_run_all_skips_a_case_that_cannot_be_classified(router) -> None:
+    """A case with a non-string type is alerted and the rest of the suite still runs."""
+    bad = mcp_router.TestCase(identifier="bad", steps=[], type=float("nan"))
+    good = mcp_router.TestCase(identifier="good", steps=[{"action": "call http endpoint"}], type="API")
+    router.run_all([bad, good])
+    assert router.ran == [("good", "api")]
+    assert len(router.alerts) == 1
@@ -10,6 +10,7 @@ Running this test will generate an Allure report under the
 ``reports/allure`` directory when executed with ``pytest --alluredir reports/allure``.
 """
 
+import importlib
 import os
 import yaml
 import pytest
@@ -21,8 +22,14 @@ import allure
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from web.web_driver import WebDriver  # type: ignore
-from utils.db_utils import Database  # type: ignore
+# The repository root is itself a package and the drivers import their
+# siblings relatively (``..utils``), so load them through that package
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(_ROOT))
+_PACKAGE = os.path.basename(_ROOT)
+
+WebDriver = importlib.import_module(f"{_PACKAGE}.web.web_driver").WebDriver
+Database = importlib.import_module(f"{_PACKAGE}.utils.db_utils").Database
 
 
 @pytest.fixture(scope="module")
@@ -15,11 +15,14 @@ The schema consists of the following tables:
 * ``test_steps`` – individual steps belonging to a test case.  Steps
   are stored in the order they should be executed.
 * ``test_runs`` – execution records for a test case.  Each run stores
-  its status (pass/fail/skip), timestamps and an optional error message.
+  its status (pass/fail/skip), timestamps, an optional error message
+  and the optional ID of the execution request that started it.
 * ``run_steps`` – step level results for a particular run, including
   status and messages.
 * ``versions`` – version history for test cases keyed by user story
   and test set.  This table supports rollbacks and audit trails.
+* ``llm_cache`` – serialised LLM translations keyed by a content hash
+  so repeated runs do not re-prompt the model.
 
 All timestamps are stored in UTC ISO‑8601 format.  Caller code is
 responsible for converting to local timezones if required.
@@ -28,20 +31,82 @@ responsible for converting to local timezones if required.
 from __future__ import annotations
 
 import datetime as _dt
+import functools
 import logging
 import sqlite3
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Columns returned for each test case, in SELECT order
+_TEST_CASE_COLUMNS = ("id", "user_story", "test_set", "description", "created_by", "source", "created_at", "version")
+# Columns returned for each test run, in SELECT order
+_TEST_RUN_COLUMNS = ("id", "test_case_id", "status", "started_at", "ended_at", "error_message", "execution_id")
+
+
+def _synchronised(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Serialise access to the shared connection across threads."""
+
+    @functools.wraps(method)
+    def wrapper(self: "Database", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _concurrent_read(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Run a read-only method on the calling thread's own connection.
+
+    Falls back to the shared connection and its lock for in-memory
+    databases, which cannot be opened a second time.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "Database", *args: Any, **kwargs: Any) -> Any:
+        if self._shared_reads:
+            with self._lock:
+                return method(self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Database:
-    """Encapsulate SQLite access for the automation framework."""
+    """Encapsulate SQLite access for the automation framework.
+
+    The write connection may be shared with a background writer thread;
+    every writing method holds an internal lock so statements from
+    different threads never interleave inside one transaction.  Read-only
+    methods use a per-thread connection and do not wait for writers.
+    """
 
     def __init__(self, db_path: str) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.conn = sqlite3.connect(db_path)
+        self._lock = threading.RLock()
+        self._db_path = db_path
+        # Reads use one connection per thread so they run alongside writes
+        # under WAL; an in-memory database exists only on self.conn.
+        self._shared_reads = db_path in ("", ":memory:")
+        self._local = threading.local()
+        # Every per-thread read connection, so close() can release them all
+        self._read_conns: List[sqlite3.Connection] = []
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
         # enable foreign keys
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets readers proceed during writes and, with synchronous=NORMAL,
+        # commits no longer fsync the main database file every time.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        # 64 MiB page cache (negative values are KiB) instead of the ~2 MiB default
+        self.conn.execute("PRAGMA cache_size = -65536")
+        self.conn.execute("PRAGMA mmap_size = 268435456")
         self._ensure_schema()
+        # Reused by the step/run write paths instead of allocating a cursor
+        # per call; safe because every public method holds ``self._lock``.
+        self._write_cursor = self.conn.cursor()
 
     def _ensure_schema(self) -> None:
         """Create the database schema if it does not exist."""
@@ -61,6 +126,10 @@ class Database:
             )
             """
         )
+        # Not unique: the same story/set pair may hold several generated cases
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_test_cases_story_set ON test_cases(user_story, test_set)"
+        )
         # Steps belonging to test cases
         cursor.execute(
             """
@@ -87,10 +156,22 @@ class Database:
                 started_at TEXT NOT NULL,
                 ended_at TEXT NOT NULL,
                 error_message TEXT,
+                execution_id TEXT,
                 FOREIGN KEY (test_case_id) REFERENCES test_cases(id) ON DELETE CASCADE
             )
             """
         )
+        # Databases created before execution_id existed need the column added
+        run_columns = {row[1] for row in cursor.execute("PRAGMA table_info(test_runs)")}
+        if "execution_id" not in run_columns:
+            cursor.execute("ALTER TABLE test_runs ADD COLUMN execution_id TEXT")
+        # Lets get_recent_runs read the newest rows without sorting the table
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_test_runs_started ON test_runs(started_at DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_test_runs_execution ON test_runs(execution_id)"
+        )
         # Step results for each run
         cursor.execute(
             """
@@ -121,13 +202,49 @@ class Database:
             )
             """
         )
+        # Cached LLM translations; created_at is epoch seconds for TTL checks
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+            """
+        )
         self.conn.commit()
 
+    def _read_conn(self) -> sqlite3.Connection:
+        """Return the calling thread's read connection, opening it on first use."""
+        if self._shared_reads:
+            return self.conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -65536")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            self._local.conn = conn
+            with self._lock:
+                self._read_conns.append(conn)
+        return conn
+
+    @_synchronised
+    def close(self) -> None:
+        """Close the write connection and every thread's read connection."""
+        for conn in self._read_conns:
+            conn.close()
+        self._read_conns.clear()
+        self._local = threading.local()
+        self.conn.close()
+
     # Utility function to get current time
     def _now(self) -> str:
         return _dt.datetime.utcnow().isoformat()
 
     # CRUD operations for test cases
+    @_synchronised
     def add_test_case(self, case: Dict[str, Any]) -> int:
         """Insert a new test case and its steps into the database.
 
@@ -138,90 +255,201 @@ class Database:
             optional ``expected``.
         :returns: The database ID of the inserted test case.
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO test_cases (
-                user_story, test_set, description, created_by, source, created_at, version
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+        return self.add_test_cases([case])[0]
+
+    @_synchronised
+    def add_test_cases(self, cases: Iterable[Dict[str, Any]]) -> List[int]:
+        """Insert several test cases and their steps in one transaction.
+
+        Case rows are inserted one by one to obtain their IDs, while all
+        steps go through a single ``executemany``; nothing is committed
+        until every row is written.
+
+        :param cases: Dictionaries as accepted by :meth:`add_test_case`.
+        :returns: The database IDs of the inserted cases, in input order.
+        """
+        case_ids: List[int] = []
+        step_rows: List[Tuple[Any, ...]] = []
+        with self.conn:
+            cursor = self.conn.cursor()
+            for case in cases:
+                steps = case.get("steps", [])
+                created_at = case.get("created_at", self._now())
+                cursor.execute(
+                    """
+                    INSERT INTO test_cases (
+                        user_story, test_set, description, created_by, source, created_at, version
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        case["user_story"],
+                        case["test_set"],
+                        "; ".join(f"{step.get('action','')} {step.get('target', '')}".strip() for step in steps),
+                        case["created_by"],
+                        case["source"],
+                        created_at,
+                        case.get("version", 1),
+                    ),
+                )
+                test_case_id = cursor.lastrowid
+                case_ids.append(test_case_id)
+                step_rows.extend(
+                    (
+                        test_case_id,
+                        idx,
+                        step.get("action", ""),
+                        step.get("target"),
+                        step.get("input_data"),
+                        step.get("expected"),
+                        created_at,
+                    )
+                    for idx, step in enumerate(steps)
+                )
+            cursor.executemany(
+                """
+                INSERT INTO test_steps (
+                    test_case_id, step_index, action, target, input_data, expected, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                step_rows,
+            )
+        return case_ids
+
+    @_synchronised
+    def upsert_test_cases(self, cases: Iterable[Dict[str, Any]]) -> None:
+        """Update or insert test cases matched by ``(user_story, test_set)``.
+
+        A matching case (the oldest, if there are several) whose description
+        changed gets the new description and its version incremented;
+        unchanged cases are left alone and unmatched cases are
+        inserted without steps.  Both passes are single ``executemany``
+        calls in one transaction, so SQLite performs the matching.
+
+        :param cases: Dictionaries with ``user_story``, ``test_set``,
+            ``description``, ``created_by``, ``source`` and optional
+            ``created_at`` and ``version``.
+        """
+        rows = [
             (
                 case["user_story"],
                 case["test_set"],
-                "; ".join(f"{step.get('action','')} {step.get('target', '')}".strip() for step in case.get("steps", [])),
+                case.get("description", ""),
                 case["created_by"],
                 case["source"],
                 case.get("created_at", self._now()),
                 case.get("version", 1),
-            ),
-        )
-        test_case_id = cursor.lastrowid
-        # Insert steps
-        for idx, step in enumerate(case.get("steps", [])):
-            cursor.execute(
+            )
+            for case in cases
+        ]
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.executemany(
                 """
-                INSERT INTO test_steps (
-                    test_case_id, step_index, action, target, input_data, expected, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                UPDATE test_cases SET description = ?, version = version + 1
+                WHERE id = (SELECT MIN(id) FROM test_cases WHERE user_story = ? AND test_set = ?)
+                AND description IS NOT ?
                 """,
-                (
-                    test_case_id,
-                    idx,
-                    step.get("action", ""),
-                    step.get("target"),
-                    step.get("input_data"),
-                    step.get("expected"),
-                    case.get("created_at", self._now()),
-                ),
+                [(row[2], row[0], row[1], row[2]) for row in rows],
+            )
+            cursor.executemany(
+                """
+                INSERT INTO test_cases (
+                    user_story, test_set, description, created_by, source, created_at, version
+                )
+                SELECT ?, ?, ?, ?, ?, ?, ?
+                WHERE NOT EXISTS (SELECT 1 FROM test_cases WHERE user_story = ? AND test_set = ?)
+                """,
+                [row + (row[0], row[1]) for row in rows],
             )
-        self.conn.commit()
-        return test_case_id
 
+    @_concurrent_read
     def get_test_cases(self) -> List[Dict[str, Any]]:
         """Return a list of all test cases in the database."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT id, user_story, test_set, description, created_by, source, created_at, version FROM test_cases"
-        )
-        rows = cursor.fetchall()
+        cursor = self._read_conn().cursor()
+        cursor.execute(f"SELECT {', '.join(_TEST_CASE_COLUMNS)} FROM test_cases")
+        return [dict(zip(_TEST_CASE_COLUMNS, row)) for row in cursor.fetchall()]
+
+    @_concurrent_read
+    def get_test_case(self, test_case_id: int) -> Optional[Dict[str, Any]]:
+        """Return a single test case by ID, or ``None`` if it does not exist."""
+        row = self._read_conn().execute(
+            f"SELECT {', '.join(_TEST_CASE_COLUMNS)} FROM test_cases WHERE id = ?",
+            (test_case_id,),
+        ).fetchone()
+        return dict(zip(_TEST_CASE_COLUMNS, row)) if row else None
+
+    @_concurrent_read
+    def get_test_cases_by_ids(self, test_case_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Return the test cases whose IDs are in ``test_case_ids``.
+
+        Rows are ordered by ID; unknown IDs are ignored.
+        """
+        ids = list(dict.fromkeys(test_case_ids))
         cases: List[Dict[str, Any]] = []
-        for row in rows:
-            cases.append(
-                {
-                    "id": row[0],
-                    "user_story": row[1],
-                    "test_set": row[2],
-                    "description": row[3],
-                    "created_by": row[4],
-                    "source": row[5],
-                    "created_at": row[6],
-                    "version": row[7],
-                }
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            cursor = self._read_conn().execute(
+                f"SELECT {', '.join(_TEST_CASE_COLUMNS)} FROM test_cases "
+                f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk,
             )
+            cases.extend(dict(zip(_TEST_CASE_COLUMNS, row)) for row in cursor.fetchall())
+        cases.sort(key=lambda case: case["id"])
         return cases
 
     # Test run operations
-    def add_test_run(self, test_case_id: int, status: str, started_at: str, ended_at: str, error_message: Optional[str] = None) -> int:
+    @_synchronised
+    def add_test_run(
+        self,
+        test_case_id: int,
+        status: str,
+        started_at: str,
+        ended_at: str,
+        error_message: Optional[str] = None,
+        execution_id: Optional[str] = None,
+    ) -> int:
         """Insert a test run record.
 
+        :param execution_id: Optional ID grouping runs started together,
+            e.g. by one dashboard execution request.
         :returns: The database ID of the inserted run.
         """
         cursor = self.conn.cursor()
         cursor.execute(
             """
-            INSERT INTO test_runs (test_case_id, status, started_at, ended_at, error_message)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO test_runs (test_case_id, status, started_at, ended_at, error_message, execution_id)
+            VALUES (?, ?, ?, ?, ?, ?)
             """,
-            (test_case_id, status, started_at, ended_at, error_message),
+            (test_case_id, status, started_at, ended_at, error_message, execution_id),
         )
         run_id = cursor.lastrowid
         self.conn.commit()
         return run_id
 
+    @_synchronised
+    def add_test_runs(
+        self,
+        runs: Iterable[Tuple[int, str, str, str, Optional[str], Optional[str]]],
+    ) -> None:
+        """Insert several test run records with one ``executemany``.
+
+        :param runs: Tuples of ``(test_case_id, status, started_at,
+            ended_at, error_message, execution_id)``.
+        """
+        with self.conn:
+            self._write_cursor.executemany(
+                """
+                INSERT INTO test_runs (test_case_id, status, started_at, ended_at, error_message, execution_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                runs,
+            )
+
+    @_synchronised
     def add_run_step(self, test_run_id: int, step_index: int, status: str, message: Optional[str], started_at: str, ended_at: str) -> None:
         """Record the result of a single step during a test run."""
-        cursor = self.conn.cursor()
-        cursor.execute(
+        self._write_cursor.execute(
             """
             INSERT INTO run_steps (test_run_id, step_index, status, message, started_at, ended_at)
             VALUES (?, ?, ?, ?, ?, ?)
@@ -230,36 +458,102 @@ class Database:
         )
         self.conn.commit()
 
+    @_synchronised
+    def finish_test_run(
+        self,
+        test_run_id: int,
+        status: str,
+        ended_at: str,
+        error_message: Optional[str],
+        steps: Iterable[Tuple[int, str, Optional[str], str, str]],
+    ) -> None:
+        """Persist buffered step results and the final run status.
+
+        All step rows are inserted with a single ``executemany`` and the
+        ``test_runs`` update is applied in the same ``BEGIN IMMEDIATE``
+        transaction, so a run with many steps costs one commit instead of
+        one per step.  The transaction is rolled back if any statement
+        fails.
+
+        :param steps: Tuples of ``(step_index, status, message,
+            started_at, ended_at)`` in execution order.
+        """
+        self.finish_test_runs([(test_run_id, status, ended_at, error_message, steps)])
+
+    @_synchronised
+    def finish_test_runs(
+        self,
+        runs: Iterable[Tuple[int, str, Optional[str], Optional[str], Iterable[Tuple[int, str, Optional[str], str, str]]]],
+    ) -> None:
+        """Persist several finished runs in a single transaction.
+
+        :param runs: Tuples of ``(test_run_id, status, ended_at,
+            error_message, steps)`` as accepted by :meth:`finish_test_run`.
+        """
+        step_rows: List[Tuple[Any, ...]] = []
+        run_rows: List[Tuple[Any, ...]] = []
+        for test_run_id, status, ended_at, error_message, steps in runs:
+            step_rows.extend((test_run_id, *step) for step in steps)
+            run_rows.append((status, ended_at, error_message, test_run_id))
+        with self.conn:
+            cursor = self._write_cursor
+            # Take the write lock up front rather than upgrading from a read
+            # lock mid-transaction, which can fail with SQLITE_BUSY under WAL.
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(
+                """
+                INSERT INTO run_steps (test_run_id, step_index, status, message, started_at, ended_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                step_rows,
+            )
+            cursor.executemany(
+                """
+                UPDATE test_runs
+                SET status = ?, ended_at = ?, error_message = ?
+                WHERE id = ?
+                """,
+                run_rows,
+            )
+
+    @_concurrent_read
     def get_test_runs(self, test_case_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Return test run records, optionally filtered by test case."""
-        cursor = self.conn.cursor()
+        cursor = self._read_conn().cursor()
         if test_case_id is None:
-            cursor.execute(
-                "SELECT id, test_case_id, status, started_at, ended_at, error_message FROM test_runs"
-            )
+            cursor.execute(f"SELECT {', '.join(_TEST_RUN_COLUMNS)} FROM test_runs")
         else:
             cursor.execute(
-                "SELECT id, test_case_id, status, started_at, ended_at, error_message FROM test_runs WHERE test_case_id = ?",
+                f"SELECT {', '.join(_TEST_RUN_COLUMNS)} FROM test_runs WHERE test_case_id = ?",
                 (test_case_id,),
             )
-        rows = cursor.fetchall()
-        runs: List[Dict[str, Any]] = []
-        for row in rows:
-            runs.append(
-                {
-                    "id": row[0],
-                    "test_case_id": row[1],
-                    "status": row[2],
-                    "started_at": row[3],
-                    "ended_at": row[4],
-                    "error_message": row[5],
-                }
+        return [dict(zip(_TEST_RUN_COLUMNS, row)) for row in cursor.fetchall()]
+
+    @_concurrent_read
+    def get_recent_runs(self, limit: int) -> List[Dict[str, Any]]:
+        """Return the ``limit`` most recently started test runs, newest first."""
+        cursor = self._read_conn().execute(
+            f"SELECT {', '.join(_TEST_RUN_COLUMNS)} FROM test_runs ORDER BY started_at DESC, id LIMIT ?",
+            (limit,),
+        )
+        return [dict(zip(_TEST_RUN_COLUMNS, row)) for row in cursor.fetchall()]
+
+    @_concurrent_read
+    def get_run_stats(self, execution_id: Optional[str] = None) -> Dict[str, int]:
+        """Return the number of test runs per status, optionally for one execution."""
+        if execution_id is None:
+            cursor = self._read_conn().execute("SELECT status, COUNT(*) FROM test_runs GROUP BY status")
+        else:
+            cursor = self._read_conn().execute(
+                "SELECT status, COUNT(*) FROM test_runs WHERE execution_id = ? GROUP BY status",
+                (execution_id,),
             )
-        return runs
+        return dict(cursor.fetchall())
 
+    @_concurrent_read
     def get_run_steps(self, test_run_id: int) -> List[Dict[str, Any]]:
         """Return step results for a specific test run."""
-        cursor = self.conn.cursor()
+        cursor = self._read_conn().cursor()
         cursor.execute(
             "SELECT step_index, status, message, started_at, ended_at FROM run_steps WHERE test_run_id = ?",
             (test_run_id,),
@@ -278,7 +572,39 @@ class Database:
             )
         return results
 
+    # LLM translation cache
+    @_concurrent_read
+    def get_cached_translations(self, keys: Iterable[str], max_age: float) -> Dict[str, str]:
+        """Return cached payloads for ``keys`` that are younger than ``max_age`` seconds."""
+        keys = list(keys)
+        cutoff = int(time.time() - max_age)
+        cursor = self._read_conn().cursor()
+        found: Dict[str, str] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(
+                f"SELECT key, payload FROM llm_cache WHERE key IN ({placeholders}) AND created_at >= ?",
+                (*chunk, cutoff),
+            )
+            found.update(cursor.fetchall())
+        return found
+
+    @_synchronised
+    def cache_translations(self, entries: Dict[str, str]) -> None:
+        """Insert or refresh cached translation payloads."""
+        if not entries:
+            return
+        now = int(time.time())
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO llm_cache (key, payload, created_at) VALUES (?, ?, ?)",
+                [(key, payload, now) for key, payload in entries.items()],
+            )
+
     # Version management
+    @_synchronised
     def record_version(self, user_story: str, test_set: str, version: int, source: str, file_name: Optional[str], comments: Optional[str]) -> None:
         """Record a new version entry for a test case."""
         cursor = self.conn.cursor()
@@ -291,9 +617,10 @@ class Database:
         )
         self.conn.commit()
 
+    @_concurrent_read
     def get_next_version(self, user_story: str, test_set: str) -> int:
         """Determine the next version number for a given user story and test set."""
-        cursor = self.conn.cursor()
+        cursor = self._read_conn().cursor()
         cursor.execute(
             "SELECT MAX(version) FROM versions WHERE user_story = ? AND test_set = ?",
             (user_story, test_set),
@@ -301,9 +628,10 @@ class Database:
         row = cursor.fetchone()
         return (row[0] + 1) if row and row[0] is not None else 1
 
+    @_concurrent_read
     def get_version_history(self, user_story: str, test_set: str) -> List[Dict[str, Any]]:
         """Return all recorded versions for a user story and test set."""
-        cursor = self.conn.cursor()
+        cursor = self._read_conn().cursor()
         cursor.execute(
             """
             SELECT version, source, file_name, comments, created_at
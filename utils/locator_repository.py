@@ -25,7 +25,7 @@ import json
 import logging
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 
 class LocatorRepository:
@@ -138,6 +138,30 @@ class LocatorRepository:
             return None
         return {"type": row[0], "value": row[1]}
 
+    def get_locators(self, context: str, step_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the active locators for several step keys at once.
+
+        Keys without an active locator are absent from the result.
+        """
+        keys = list(dict.fromkeys(step_keys))
+        locators: Dict[str, Dict[str, Any]] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            self.cursor.execute(
+                f"""
+                SELECT step_key, locator_type, locator_value
+                FROM locators
+                WHERE context = ? AND is_active = 1 AND step_key IN ({','.join('?' * len(chunk))})
+                ORDER BY version
+                """,
+                (context, *chunk),
+            )
+            # Ascending versions, so the newest active row wins
+            for step_key, locator_type, locator_value in self.cursor.fetchall():
+                locators[step_key] = {"type": locator_type, "value": locator_value}
+        return locators
+
     def add_locator(self, context: str, step_key: str, locator: Dict[str, str]) -> None:
         """Insert a new locator version and mark previous active ones inactive."""
         locator_type = locator.get("type")
@@ -176,5 +200,47 @@ class LocatorRepository:
             next_version,
         )
 
+    def add_locators(self, context: str, locators: Dict[str, Dict[str, str]]) -> None:
+        """Record new locator versions for several step keys in one transaction.
+
+        Equivalent to calling :meth:`add_locator` for each
+        ``step_key -> locator`` entry, but with batched statements and a
+        single commit.
+        """
+        if not locators:
+            return
+        for locator in locators.values():
+            if not locator.get("type") or not locator.get("value"):
+                raise ValueError("Locator must have 'type' and 'value' fields")
+        now = _dt.datetime.utcnow().isoformat()
+        keys = list(locators)
+        versions: Dict[str, int] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            self.cursor.execute(
+                f"SELECT step_key, MAX(version) FROM locators WHERE context = ? AND step_key IN ({','.join('?' * len(chunk))}) GROUP BY step_key",
+                (context, *chunk),
+            )
+            versions.update(self.cursor.fetchall())
+        self.cursor.executemany(
+            "UPDATE locators SET is_active = 0, updated_at = ? WHERE context = ? AND step_key = ? AND is_active = 1",
+            [(now, context, key) for key in keys],
+        )
+        self.cursor.executemany(
+            """
+            INSERT INTO locators (
+                context, step_key, locator_type, locator_value,
+                version, is_active, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+            """,
+            [
+                (context, key, locator["type"], locator["value"], (versions.get(key) or 0) + 1, now, now)
+                for key, locator in locators.items()
+            ],
+        )
+        self.conn.commit()
+        self.logger.info("Recorded %d locators for context=%s", len(locators), context)
+
 
 __all__ = ["LocatorRepository"]
\ No newline at end of file
@@ -62,6 +62,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Path keys ("/users": {) and operation keys ("get": {) of a JSON-like spec
+_SWAGGER_RE = re.compile(
+    r'"(?P<path>/[^"]+)"\s*:\s*\{|"(?P<method>get|post|put|delete|patch)"\s*:\s*\{',
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class TestCaseMetadata:
@@ -147,19 +153,18 @@ def _extract_endpoints_from_swagger(swagger_content: str) -> List[Dict[str, Any]
                         "responses": details.get("responses", {})
                     })
     except json.JSONDecodeError:
-        # Fallback to regex parsing
-        path_pattern = r'"([^"]+)"\s*:\s*{'
-        method_pattern = r'"(get|post|put|delete|patch)"\s*:\s*{'
-        
-        paths = re.findall(path_pattern, swagger_content, re.IGNORECASE)
-        methods = re.findall(method_pattern, swagger_content, re.IGNORECASE)
-        
-        for path in paths:
-            for method in methods:
+        # Fallback to a single regex scan that pairs each method with the
+        # path key it is nested under
+        path = None
+        for match in _SWAGGER_RE.finditer(swagger_content):
+            if match.group("path") is not None:
+                path = match.group("path")
+            elif path is not None:
+                method = match.group("method").upper()
                 endpoints.append({
                     "path": path,
-                    "method": method.upper(),
-                    "summary": f"{method.upper()} {path}",
+                    "method": method,
+                    "summary": f"{method} {path}",
                     "description": "",
                     "parameters": [],
                     "responses": {}
@@ -518,6 +523,11 @@ def generate_test_cases_from_brd_fallback(brd_path: str, created_by: str = "syst
     return test_cases
 
 
+# Public entry point exported by this module and the utils package; the
+# pattern-based generator is the deterministic path used without RAGAS
+generate_test_cases_from_brd = generate_test_cases_from_brd_fallback
+
+
 def _read_brd_content(brd_path: str) -> str:
     """Read BRD content from various file formats."""
     content = ""
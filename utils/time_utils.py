@@ -0,0 +1,36 @@
+"""
+Time Utilities
+--------------
+
+Timestamp formatting shared by the platform drivers when recording
+test runs and run steps in the database.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from typing import Dict
+
+
+# Steps finishing within the same second share a formatted timestamp
+_iso_cache: Dict[int, str] = {}
+_ISO_CACHE_SIZE = 1024
+
+
+def iso_timestamp(ts: float) -> str:
+    """Convert a timestamp in seconds since the epoch to naive UTC ISO format.
+
+    The value is truncated to whole seconds, and recently formatted
+    seconds are cached so a burst of steps formats each second once.
+    """
+    second = int(ts)
+    value = _iso_cache.get(second)
+    if value is None:
+        value = _dt.datetime.fromtimestamp(second, _dt.timezone.utc).replace(tzinfo=None).isoformat()
+        if len(_iso_cache) >= _ISO_CACHE_SIZE:
+            _iso_cache.clear()
+        _iso_cache[second] = value
+    return value
+
+
+__all__ = ["iso_timestamp"]
@@ -18,7 +18,6 @@ but does not interact with a real browser.
 from __future__ import annotations
 
 import logging
-import json
 import time
 from typing import Any, Dict, List, Optional
 
@@ -31,6 +30,7 @@ except Exception:
 from ..utils import wait_utils
 from ..utils.locator_repository import LocatorRepository
 from ..utils.db_utils import Database
+from ..utils.time_utils import iso_timestamp as _iso
 from ..llm_integration.llm_agent import LLMAgent
 
 
@@ -165,6 +165,8 @@ class WebDriver:
         skipped_steps = 0
         error_message: Optional[str] = None
         steps = case.get("steps", []) or []
+        # Outcome of each step so far, consulted for ``depends_on``
+        step_status: Dict[int, str] = {}
         for idx, step in enumerate(steps):
             step_start = time.time()
             status = "passed"
@@ -173,14 +175,8 @@ class WebDriver:
                 # Honour dependent steps: if a step depends on a previous step
                 # index and that step failed or was skipped, skip this one.
                 dep = step.get("depends_on")
-                if dep is not None and isinstance(dep, int):
-                    # Determine status of dependency
-                    # We fetch previously recorded run_steps from the DB for this run
-                    prev_results = self.db.get_run_steps(run_id) if run_id else []
-                    # Find the run result for the dependency
-                    for r in prev_results:
-                        if r.get("step_index") == dep and r.get("status") in {"failed", "skipped"}:
-                            raise ValueError(f"Step depends_on {dep} which did not pass")
+                if isinstance(dep, int) and step_status.get(dep) in {"failed", "skipped"}:
+                    raise ValueError(f"Step depends_on {dep} which did not pass")
                 self._execute_step(step)
             except ValueError as ve:
                 # Missing required information results in a skipped step
@@ -196,6 +192,7 @@ class WebDriver:
             else:
                 passed_steps += 1
             step_end = time.time()
+            step_status[idx] = status
             self.db.add_run_step(run_id, idx, status, message, _iso(step_start), _iso(step_end))
         # Determine overall status
         end_time = time.time()
@@ -269,11 +266,7 @@ class WebDriver:
                     break
             # Ask LLM for a suggestion if heuristics fail
             if not selector:
-                try:
-                    description = json.dumps(step, ensure_ascii=False)  # type: ignore[name-defined]
-                except Exception:
-                    description = str(step)
-                suggestion = self.llm.suggest_ui_locator(description)
+                suggestion = self.llm.suggest_ui_locator(LLMAgent.describe_step(step))
                 if suggestion:
                     selector = suggestion
                     # Persist the suggested locator
@@ -309,9 +302,4 @@ class WebDriver:
         wait_utils.wait_for_page_stable(page, self.config)
 
 
-def _iso(ts: float) -> str:
-    """Convert a timestamp in seconds since the epoch to ISO format."""
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts))
-
-
 __all__ = ["WebDriver"]
\ No newline at end of file